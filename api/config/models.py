@@ -17,6 +17,19 @@ class PlayDeskConfig(BaseModel):
     columns: int = Field(
         default=32, ge=10, le=100, description="Number of columns in the world grid"
     )
+    engine: Literal["object", "numpy"] = Field(
+        default="object",
+        description="Board backend: Python objects or NumPy arrays",
+    )
+    step_mode: Literal["sequential", "batched", "convolution"] = Field(
+        default="sequential",
+        description="Run the network per ameba or once per step for all amebas",
+    )
+    energy_audit_every: int = Field(
+        default=0,
+        ge=0,
+        description="Check running energy totals against a full recount every N food top-ups (0 disables)",
+    )
 
 
 class AmebaConfig(BaseModel):
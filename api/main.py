@@ -7,6 +7,11 @@ import uvicorn
 from config import router as config_router
 from training import router as training_router
 from movement import router as movement_router
+from metrics import router as metrics_router
+from core.shared.log import configure_logging
+
+# Core loggers read AMEBA_LOG_LEVEL / AMEBA_LOG_SAMPLE_EVERY
+configure_logging()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -31,6 +36,7 @@ app.add_middleware(
 app.include_router(config_router)
 app.include_router(training_router)
 app.include_router(movement_router)
+app.include_router(metrics_router)
 
 # Path to config file (for health check)
 CONFIG_FILE_PATH = Path(__file__).parent.parent / "config.json"
@@ -46,10 +52,11 @@ async def root():
             "config": "/api/config",
             "training": "/api/training",
             "movement": "/api/movement",
+            "metrics": "/api/metrics",
             "health": "/health",
             "docs": "/docs",
         },
-        "modules": ["config", "training", "movement"],
+        "modules": ["config", "training", "movement", "metrics"],
     }
 
 
@@ -59,7 +66,7 @@ async def health_check():
     return {
         "status": "healthy",
         "config_file_exists": CONFIG_FILE_PATH.exists(),
-        "modules_loaded": ["config", "training", "movement"],
+        "modules_loaded": ["config", "training", "movement", "metrics"],
     }
 
 
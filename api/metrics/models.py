@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+from typing import Dict
+
+
+class PhaseMetrics(BaseModel):
+    """Aggregated timings of one step phase"""
+
+    count: int = Field(..., description="Number of recorded samples")
+    total_seconds: float = Field(..., description="Total time spent in the phase")
+    mean_seconds: float = Field(..., description="Mean duration")
+    p50_seconds: float = Field(..., description="Median duration")
+    p99_seconds: float = Field(..., description="99th percentile duration")
+    max_seconds: float = Field(..., description="Longest duration")
+
+
+class MetricsResponse(BaseModel):
+    """Step phase timings"""
+
+    enabled: bool = Field(..., description="Whether step timing is recording")
+    phases: Dict[str, PhaseMetrics] = Field(
+        default_factory=dict, description="Timings keyed by phase name"
+    )
@@ -0,0 +1,55 @@
+import sys
+from dataclasses import asdict
+from fastapi import APIRouter
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from metrics.models import MetricsResponse, PhaseMetrics
+from core.shared.step_metrics import get_step_metrics
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+def _metrics_response() -> MetricsResponse:
+    step_metrics = get_step_metrics()
+    return MetricsResponse(
+        enabled=step_metrics.enabled,
+        phases={
+            phase: PhaseMetrics(**asdict(stats))
+            for phase, stats in step_metrics.snapshot().items()
+        },
+    )
+
+
+@router.get("", response_model=MetricsResponse)
+async def get_metrics():
+    """
+    Get timing histograms of the simulation step phases
+
+    Phases: fetch_windows, predict, move, cleanup, generate_food and step.
+    """
+    return _metrics_response()
+
+
+@router.post("/enable", response_model=MetricsResponse)
+async def enable_metrics():
+    """Start recording step phase timings"""
+    get_step_metrics().enable()
+    return _metrics_response()
+
+
+@router.post("/disable", response_model=MetricsResponse)
+async def disable_metrics():
+    """Stop recording step phase timings, keeping what was recorded"""
+    get_step_metrics().disable()
+    return _metrics_response()
+
+
+@router.post("/reset", response_model=MetricsResponse)
+async def reset_metrics():
+    """Clear the recorded step phase timings"""
+    get_step_metrics().reset()
+    return _metrics_response()
@@ -92,17 +92,36 @@ class SimulationRequest(BaseModel):
     return_steps: bool = Field(
         False, description="Whether to return intermediate steps"
     )
+    keyframe_interval: int = Field(
+        10, ge=1, le=1000, description="Full board keyframe every N returned steps"
+    )
 
 
 class SimulationStep(BaseModel):
-    """Single step in game simulation"""
+    """Single step in game simulation, a full keyframe or a delta
+
+    Keyframes list every ameba as [row, column, energy] (list index is the
+    ameba id) and every food as [row, column, energy]. Deltas list moved
+    amebas as [id, row, column, energy], eaten food cells as [row, column]
+    and spawned food as [row, column, energy]. Step 0 is a keyframe of the
+    board before the simulation.
+    """
 
     step_number: int = Field(..., description="Step number in simulation")
-    movements: List[MovementResult] = Field(
-        default_factory=list, description="Movements in this step"
-    )
-    game_state: GameState = Field(..., description="Game state after this step")
+    keyframe: bool = Field(..., description="Whether this step is a full keyframe")
     total_energy: float = Field(..., description="Total energy in the system")
+    amebas: List[List[float]] = Field(
+        default_factory=list, description="Keyframe amebas or moved amebas"
+    )
+    foods: List[List[float]] = Field(
+        default_factory=list, description="Keyframe food items"
+    )
+    eaten: List[List[int]] = Field(
+        default_factory=list, description="Food cells eaten in this step"
+    )
+    spawned: List[List[float]] = Field(
+        default_factory=list, description="Food spawned in this step"
+    )
 
 
 class SimulationResponse(BaseModel):
@@ -131,3 +150,12 @@ class GameStateResponse(BaseModel):
     board_size: Dict[str, int] = Field(
         ..., description="Board dimensions (rows, columns)"
     )
+
+
+class StreamControl(BaseModel):
+    """Control message sent by a client of the live frame stream"""
+
+    steps_per_second: Optional[float] = Field(
+        None, gt=0.0, description="New stepping rate (clamped to 0.1-60)"
+    )
+    paused: Optional[bool] = Field(None, description="Pause or resume stepping")
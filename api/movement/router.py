@@ -1,5 +1,10 @@
+import asyncio
 import sys
-from fastapi import APIRouter, HTTPException
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 from pathlib import Path
 
 # Add project root to Python path
@@ -17,14 +22,36 @@ from movement.models import (
     Position,
     CellEntity,
     FoodGenerationInfo,
+    StreamControl,
 )
+from movement.stream import FrameBroadcaster, FrameMailbox
 from core.out.movement_handler import MovementHandler
+from core.out.step_delta import merge_steps
 
 router = APIRouter(prefix="/api/movement", tags=["movement"])
 
 # Initialize movement handler
 movement_handler = MovementHandler(project_root)
 
+# Stepping is CPU bound, it runs here so the event loop keeps serving reads.
+# The handler's game lock serializes steps, so one worker is enough.
+simulation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+
+# Full board every this many /stream steps, deltas in between
+STREAM_KEYFRAME_INTERVAL = 10
+
+
+async def _run_in_executor(function, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        simulation_executor, partial(function, *args, **kwargs)
+    )
+
+
+@router.on_event("shutdown")
+def shutdown_simulation_executor():
+    simulation_executor.shutdown(wait=True, cancel_futures=True)
+
 
 @router.post("/move", response_model=MoveResponse)
 async def move_amebas(request: MoveRequest):
@@ -66,7 +93,8 @@ async def move_amebas(request: MoveRequest):
             }
 
         # Use the movement handler
-        result = movement_handler.move_amebas(
+        result = await _run_in_executor(
+            movement_handler.move_amebas,
             game_state=game_state_dict,
             ameba_id=request.ameba_id,
             iterations=request.iterations,
@@ -169,11 +197,15 @@ async def run_simulation(request: SimulationRequest):
 
     - **iterations**: Number of simulation steps (1-1000)
     - **return_steps**: Whether to return intermediate steps (default: False)
+    - **keyframe_interval**: Full board keyframe every N steps, deltas in between
     """
     try:
         # Use the movement handler for simulation
-        result = movement_handler.run_simulation(
-            iterations=request.iterations, return_steps=request.return_steps
+        result = await _run_in_executor(
+            movement_handler.run_simulation,
+            iterations=request.iterations,
+            return_steps=request.return_steps,
+            keyframe_interval=request.keyframe_interval,
         )
 
         if result["success"]:
@@ -205,76 +237,12 @@ async def run_simulation(request: SimulationRequest):
                 board_size=final_state["board_size"],
             )
 
-            # Convert steps if requested
+            # Steps are already delta encoded by the handler
             steps = None
             if request.return_steps and result.get("steps"):
                 from movement.models import SimulationStep
 
-                steps = []
-                for step_data in result["steps"]:
-                    step_movements = []
-                    for movement in step_data["movements"]:
-                        step_movements.append(
-                            MovementResult(
-                                ameba_position=Position(
-                                    row=movement["ameba_position"]["row"],
-                                    column=movement["ameba_position"]["column"],
-                                ),
-                                old_position=Position(
-                                    row=movement["old_position"]["row"],
-                                    column=movement["old_position"]["column"],
-                                ),
-                                new_position=Position(
-                                    row=movement["new_position"]["row"],
-                                    column=movement["new_position"]["column"],
-                                ),
-                                energy_change=movement["energy_change"],
-                                food_consumed=(
-                                    Position(
-                                        row=movement["food_consumed"]["row"],
-                                        column=movement["food_consumed"]["column"],
-                                    )
-                                    if movement["food_consumed"]
-                                    else None
-                                ),
-                            )
-                        )
-
-                    step_state = step_data["game_state"]
-                    step_game_state = GameState(
-                        amebas=[
-                            CellEntity(
-                                type=ameba["type"],
-                                energy=ameba["energy"],
-                                position=Position(
-                                    row=ameba["position"]["row"],
-                                    column=ameba["position"]["column"],
-                                ),
-                            )
-                            for ameba in step_state["amebas"]
-                        ],
-                        foods=[
-                            CellEntity(
-                                type=food["type"],
-                                energy=food["energy"],
-                                position=Position(
-                                    row=food["position"]["row"],
-                                    column=food["position"]["column"],
-                                ),
-                            )
-                            for food in step_state["foods"]
-                        ],
-                        board_size=step_state["board_size"],
-                    )
-
-                    steps.append(
-                        SimulationStep(
-                            step_number=step_data["step_number"],
-                            movements=step_movements,
-                            game_state=step_game_state,
-                            total_energy=step_data["total_energy"],
-                        )
-                    )
+                steps = [SimulationStep(**step) for step in result["steps"]]
 
             return SimulationResponse(
                 success=result["success"],
@@ -298,18 +266,19 @@ async def run_simulation(request: SimulationRequest):
 
 @router.get("/status")
 async def get_movement_status():
-    """Get the current movement system status"""
+    """Get the current movement system status from the last committed step"""
     try:
         # Check if game is loaded and ready
         game_loaded = movement_handler.game is not None
 
         if game_loaded:
-            current_state = movement_handler._get_current_game_state()
+            version, current_state = movement_handler.get_snapshot()
             return {
                 "game_loaded": True,
                 "ameba_count": len(current_state["amebas"]),
                 "food_count": len(current_state["foods"]),
                 "board_size": current_state["board_size"],
+                "snapshot_version": version,
                 "message": "Movement system ready",
             }
         else:
@@ -329,15 +298,17 @@ async def get_movement_status():
 
 @router.get("/state", response_model=GameStateResponse)
 async def get_game_state():
-    """Get the current backend game state from the Game class PlayDesk"""
+    """Get the backend game state as of the last committed step
+
+    Served from a snapshot, so it never waits for an in-flight step.
+    """
     try:
         if not movement_handler.game:
             raise HTTPException(
                 status_code=404, detail="Game not initialized - check configuration"
             )
 
-        # Get the current game state from the Game's PlayDesk
-        current_state = movement_handler._get_current_game_state()
+        _, current_state = movement_handler.get_snapshot()
 
         # Convert to Pydantic model for proper API response
         game_state = GameState(
@@ -379,3 +350,110 @@ async def get_game_state():
         raise HTTPException(
             status_code=500, detail=f"Failed to get game state: {str(e)}"
         )
+
+
+async def _step_frame() -> Dict[str, Any]:
+    result = await _run_in_executor(
+        movement_handler.step_frame, STREAM_KEYFRAME_INTERVAL
+    )
+    if not result["success"]:
+        return {
+            "type": "error",
+            "message": result.get("error_details", result["message"]),
+        }
+    return {"type": "frame", **result["frame"]}
+
+
+def _merge_frames(pending: Dict[str, Any], frame: Dict[str, Any]) -> Dict[str, Any]:
+    if pending["type"] == "frame" and frame["type"] == "frame":
+        return merge_steps(pending, frame)
+    return frame
+
+
+# One producer steps the shared game for every /stream client
+frame_broadcaster = FrameBroadcaster(_step_frame, merge=_merge_frames)
+
+
+async def _send_frames(websocket: WebSocket, mailbox: FrameMailbox) -> None:
+    while True:
+        frame = await mailbox.get()
+        if frame["type"] == "frame":
+            frame = {**frame, "dropped_frames": mailbox.dropped_frames}
+        await websocket.send_json(frame)
+        if frame["type"] == "error":
+            return
+
+
+async def _receive_controls(websocket: WebSocket) -> None:
+    while True:
+        try:
+            control = StreamControl.model_validate(await websocket.receive_json())
+        except (ValidationError, ValueError) as e:
+            await websocket.send_json(
+                {"type": "error", "message": f"Invalid control message: {e}"}
+            )
+            continue
+        settings = frame_broadcaster.settings
+        if control.steps_per_second is not None:
+            settings.set_rate(control.steps_per_second)
+        if control.paused is not None:
+            settings.set_paused(control.paused)
+
+
+@router.websocket("/stream")
+async def stream_frames(websocket: WebSocket, steps_per_second: float = 2.0):
+    """
+    Step the game on the server and push every frame to the client
+
+    - **steps_per_second**: Initial stepping rate (0.1-60), ignored when
+      other clients are already streaming
+
+    Frames are `{"type": "frame", "dropped_frames"}` plus a step of
+    core.out.step_delta numbered with the snapshot version: a keyframe with
+    the full board and its `board_size` first and every
+    STREAM_KEYFRAME_INTERVAL versions, deltas in between. A slow client
+    receives the frames it could not take merged into the next one, so
+    every delta applies to the board of the frame before it. Send
+    `{"steps_per_second": n}` or `{"paused": true|false}` to control the
+    stream. All clients watch the same game stepped by one producer, so
+    controls apply to every connected client.
+    """
+    await websocket.accept()
+    if not movement_handler.game:
+        await websocket.send_json(
+            {"type": "error", "message": "Game not initialized - check configuration"}
+        )
+        await websocket.close()
+        return
+
+    keyframe = await _run_in_executor(movement_handler.stream_keyframe)
+    mailbox = frame_broadcaster.subscribe(
+        {"type": "frame", **keyframe}, steps_per_second
+    )
+
+    # The producer is shared and outlives this client, the stream ends with
+    # the sender (after an error frame) or the receiver (on disconnect)
+    tasks = {
+        asyncio.create_task(_send_frames(websocket, mailbox)),
+        asyncio.create_task(_receive_controls(websocket)),
+    }
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        await frame_broadcaster.unsubscribe(mailbox)
+    try:
+        for task in done:
+            error = task.exception()
+            if isinstance(error, WebSocketDisconnect):
+                return
+            if error is not None:
+                await websocket.send_json(
+                    {"type": "error", "message": f"Stream failed: {error}"}
+                )
+        await websocket.close()
+    except (RuntimeError, WebSocketDisconnect):
+        # Client already gone
+        pass
@@ -0,0 +1,144 @@
+"""
+Building blocks of the live frame stream.
+
+One FrameBroadcaster steps the shared game at the stream rate and puts every
+frame into the FrameMailbox of each connected client. Each client's sender
+takes from its own mailbox as fast as that client reads. A mailbox holds a
+single frame, so a slow client skips intermediate frames instead of backing
+up the simulation or the other clients. With a merge function the skipped
+frames are folded into the pending one, which keeps delta frames chained.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+Frame = Dict[str, Any]
+MergeFrames = Callable[[Frame, Frame], Frame]
+
+MIN_STEPS_PER_SECOND = 0.1
+MAX_STEPS_PER_SECOND = 60.0
+
+
+class FrameMailbox:
+    """Single-slot mailbox: put() replaces any frame not taken yet, or merges
+    it into the new one with `merge(pending, frame)`"""
+
+    def __init__(self, merge: Optional[MergeFrames] = None):
+        self._frame: Optional[Frame] = None
+        self._merge = merge
+        self._ready = asyncio.Event()
+        self.dropped_frames = 0
+
+    def put(self, frame: Frame) -> None:
+        if self._frame is not None:
+            self.dropped_frames += 1
+            if self._merge is not None:
+                frame = self._merge(self._frame, frame)
+        self._frame = frame
+        self._ready.set()
+
+    async def get(self) -> Frame:
+        await self._ready.wait()
+        self._ready.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
+
+class StreamSettings:
+    """Rate and pause state of the stream, changed by client messages"""
+
+    def __init__(self, steps_per_second: float):
+        self.steps_per_second = clamp_rate(steps_per_second)
+        self.running = asyncio.Event()
+        self.running.set()
+
+    @property
+    def step_interval(self) -> float:
+        return 1.0 / self.steps_per_second
+
+    def set_rate(self, steps_per_second: float) -> None:
+        self.steps_per_second = clamp_rate(steps_per_second)
+
+    def set_paused(self, paused: bool) -> None:
+        if paused:
+            self.running.clear()
+        else:
+            self.running.set()
+
+
+def clamp_rate(steps_per_second: float) -> float:
+    return min(max(steps_per_second, MIN_STEPS_PER_SECOND), MAX_STEPS_PER_SECOND)
+
+
+class FrameBroadcaster:
+    """Runs a single producer for all clients of the stream.
+
+    The producer awaits `step` for every frame and starts with the first
+    subscriber and stops with the last one, so the game advances at the
+    stream rate no matter how many clients watch it. Rate and pause controls
+    are shared as well: a control message from any client changes the stream
+    of all of them. A step returning an error frame ends the producer after
+    the frame is delivered, the next subscriber starts a new one. `merge`
+    is passed on to the mailboxes.
+    """
+
+    def __init__(
+        self,
+        step: Callable[[], Awaitable[Frame]],
+        merge: Optional[MergeFrames] = None,
+    ):
+        self._step = step
+        self._merge = merge
+        self._mailboxes: Set[FrameMailbox] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.settings: Optional[StreamSettings] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._mailboxes)
+
+    def subscribe(self, first_frame: Frame, steps_per_second: float) -> FrameMailbox:
+        """Mailbox of a new client, holding `first_frame`.
+
+        `steps_per_second` only applies when this client starts the producer.
+        """
+        mailbox = FrameMailbox(self._merge)
+        mailbox.put(first_frame)
+        self._mailboxes.add(mailbox)
+        if self._task is None or self._task.done():
+            self.settings = StreamSettings(steps_per_second)
+            self._task = asyncio.create_task(self._produce())
+        return mailbox
+
+    async def unsubscribe(self, mailbox: FrameMailbox) -> None:
+        self._mailboxes.discard(mailbox)
+        if self._mailboxes or self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def publish(self, frame: Frame) -> None:
+        for mailbox in self._mailboxes:
+            mailbox.put(frame)
+
+    async def _produce(self) -> None:
+        settings = self.settings
+        loop = asyncio.get_running_loop()
+        next_step = loop.time()
+        while True:
+            if not settings.running.is_set():
+                await settings.running.wait()
+                next_step = loop.time()
+
+            try:
+                frame = await self._step()
+            except Exception as e:
+                frame = {"type": "error", "message": f"Stream failed: {e}"}
+            self.publish(frame)
+            if frame["type"] == "error":
+                return
+
+            # Skip missed ticks instead of bursting to catch up
+            next_step = max(next_step + settings.step_interval, loop.time())
+            await asyncio.sleep(next_step - loop.time())
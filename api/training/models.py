@@ -8,6 +8,7 @@ class TrainingRequest(BaseModel):
     steps: int = 10000
     batch_size: int = 64
     mode: bool = True
+    seed: Optional[int] = None
 
 
 class TrainingResponse(BaseModel):
@@ -16,3 +17,24 @@ class TrainingResponse(BaseModel):
     success: bool
     message: str
     steps_completed: Optional[int] = None
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+
+
+class TrainingJobResponse(BaseModel):
+    """Status and progress of a background training job"""
+
+    job_id: str
+    status: str
+    message: str
+    steps: int
+    batch_size: int
+    submitted_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    epoch: int = 0
+    total_epochs: int = 0
+    loss: Optional[float] = None
+    samples_per_sec: Optional[float] = None
+    error_details: Optional[str] = None
+    model_path: Optional[str] = None
@@ -1,50 +1,103 @@
 import sys
 from fastapi import APIRouter, HTTPException
 from pathlib import Path
+from typing import List
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from training.models import TrainingRequest, TrainingResponse
+from training.models import TrainingRequest, TrainingResponse, TrainingJobResponse
 from core.out.training_handler import TrainingHandler
+from core.out.training_jobs import TrainingJob, TrainingJobManager
 
 router = APIRouter(prefix="/api/training", tags=["training"])
 
 # Initialize training handler
 training_handler = TrainingHandler(project_root)
 
+# Training runs in a worker process so the event loop stays responsive
+training_jobs = TrainingJobManager(project_root)
+
+
+def _job_response(job: TrainingJob) -> TrainingJobResponse:
+    return TrainingJobResponse(
+        job_id=job.job_id,
+        status=job.status.value,
+        message=job.message,
+        steps=job.steps,
+        batch_size=job.batch_size,
+        submitted_at=job.submitted_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        epoch=job.epoch,
+        total_epochs=job.total_epochs,
+        loss=job.loss,
+        samples_per_sec=job.samples_per_sec,
+        error_details=job.error_details,
+        model_path=job.model_path,
+    )
+
+
+@router.on_event("shutdown")
+def shutdown_training_jobs():
+    training_jobs.shutdown()
+
 
 @router.post("/train", response_model=TrainingResponse)
 async def train_neural_network(request: TrainingRequest):
     """
-    Train the neural network with specified parameters
+    Submit a neural network training job and return its id immediately
 
     - **steps**: Number of training steps (default: 1000)
     - **batch_size**: Batch size for training (default: 32)
     - **mode**: Training mode (default: True)
+    - **seed**: Seed of the training data, random if omitted
+
+    Poll `/api/training/jobs/{job_id}` for status and progress.
     """
     try:
-        # Use the training handler from core/out
-        result = training_handler.train_neural_network(
-            steps=request.steps, batch_size=request.batch_size, mode=request.mode
+        job = training_jobs.submit(
+            steps=request.steps,
+            batch_size=request.batch_size,
+            mode=request.mode,
+            seed=request.seed,
+        )
+        return TrainingResponse(
+            success=True,
+            message=f"Training job {job.job_id} submitted",
+            job_id=job.job_id,
+            status=job.status.value,
         )
 
-        if result.success:
-            return TrainingResponse(
-                success=result.success,
-                message=result.message,
-                steps_completed=result.steps_completed,
-            )
-        else:
-            raise HTTPException(
-                status_code=500, detail=f"Training failed: {result.error_details}"
-            )
-
-    except HTTPException:
-        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to submit training job: {str(e)}"
+        )
+
+
+@router.get("/jobs", response_model=List[TrainingJobResponse])
+async def list_training_jobs():
+    """List all training jobs of this server process"""
+    return [_job_response(job) for job in training_jobs.list_jobs()]
+
+
+@router.get("/jobs/{job_id}", response_model=TrainingJobResponse)
+async def get_training_job(job_id: str):
+    """Get status and progress (epoch, loss, samples/sec) of a training job"""
+    job = training_jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Training job {job_id} not found")
+    return _job_response(job)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=TrainingJobResponse)
+async def cancel_training_job(job_id: str):
+    """Cancel a queued job, or stop a running one after its current epoch"""
+    job = training_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Training job {job_id} not found")
+    return _job_response(job)
 
 
 @router.get("/status")
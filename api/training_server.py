@@ -99,11 +99,7 @@ async def train_neural_network(request: TrainingRequest):
         net_state_path = (
             project_root / "core" / "neural_network" / "net_state" / "base.pth"
         )
-        net_state_path.parent.mkdir(parents=True, exist_ok=True)
-
-        import torch
-
-        torch.save(neural_network._nn.state_dict(), net_state_path)
+        neural_network.save_checkpoint(str(net_state_path))
 
         print(f"Training completed and model saved to {net_state_path}")
 
@@ -0,0 +1,208 @@
+"""
+Benchmarks of the simulation core across board size and population.
+
+Times `fetch_visible_entities`, `BaseNeuralNetwork.predict` and a full
+`SimulationRunner.run` for every board size x population x engine x step
+mode case, and writes the results as JSON so runs before and after an engine
+change can be diffed. The run is split into its move, cleanup and
+generate_food phases, and the move phase again into the fetch_windows,
+predict and move phases of `PlayDesk.move_amebas`.
+
+Examples:
+    python benchmarks/simulation_benchmark.py --output before.json
+    python benchmarks/simulation_benchmark.py --preset full --engines numpy \
+        --step-modes batched convolution --output after.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List
+
+from benchmark_utils import environment_metadata, project_root, write_report
+from core.game import Game
+from core.out.simulation_runner import SimulationRunner
+from core.play_desk import StepMode
+from core.play_desk_factory import PlayDeskEngine
+from core.shared.step_metrics import get_step_metrics
+
+PRESETS = {
+    "quick": {"boards": [12, 64, 256], "amebas": [1, 100, 1000]},
+    "full": {
+        "boards": [12, 64, 256, 1024, 2048],
+        "amebas": [1, 10, 100, 1000, 10000, 100000],
+    },
+}
+
+# Amebas may take at most this share of the board, the rest is left for food
+MAX_POPULATION_SHARE = 0.5
+
+
+def _timed_calls(function, arguments: List[Any]) -> Dict[str, float]:
+    started = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    elapsed = time.perf_counter() - started
+    return {
+        "calls": len(arguments),
+        "total_seconds": elapsed,
+        "mean_seconds": elapsed / len(arguments) if arguments else 0.0,
+    }
+
+
+def benchmark_case(
+    config_path: str,
+    board: int,
+    amebas: int,
+    engine: str,
+    step_mode: str,
+    steps: int,
+    food_density: float,
+    sample_calls: int,
+    seed: int,
+) -> Dict[str, Any]:
+    """Benchmark one board size / population / engine / step mode case"""
+    config = Game.load_config(config_path)
+    config.play_desk.rows = board
+    config.play_desk.columns = board
+    config.play_desk.engine = engine
+    config.play_desk.step_mode = step_mode
+    config.play_desk.total_energy = (
+        max(1, round(board * board * food_density)) * config.play_desk.energy_per_food
+    )
+
+    setup_started = time.perf_counter()
+    runner = SimulationRunner(config, ameba_count=amebas, seed=seed)
+    setup_seconds = time.perf_counter() - setup_started
+
+    play_desk = runner.game.play_desk
+    sampled_amebas = play_desk._amebas[:sample_calls]
+    service = play_desk._calculate_visible_area_service
+    visible_areas = [
+        service.fetch_visible_entities(ameba.get_position(), play_desk._food_index)
+        for ameba in sampled_amebas
+    ]
+    neural_network = sampled_amebas[0].get_neural_network()
+
+    fetch_visible_entities = _timed_calls(
+        lambda ameba: service.fetch_visible_entities(
+            ameba.get_position(), play_desk._food_index
+        ),
+        sampled_amebas,
+    )
+    predict = _timed_calls(neural_network.predict, visible_areas)
+
+    metrics = get_step_metrics()
+    metrics.reset()
+    metrics.enable()
+    try:
+        simulation_run = runner.run(steps=steps)
+    finally:
+        metrics.disable()
+    move_phases = {phase: asdict(stats) for phase, stats in metrics.snapshot().items()}
+
+    return {
+        "board": board,
+        "amebas": amebas,
+        "engine": engine,
+        "step_mode": step_mode,
+        "food_items": play_desk.get_food_count(),
+        "setup_seconds": setup_seconds,
+        "fetch_visible_entities": fetch_visible_entities,
+        "predict": predict,
+        "simulation_run": {
+            "steps": simulation_run.steps,
+            "seconds": simulation_run.elapsed_seconds,
+            "steps_per_sec": simulation_run.steps_per_sec,
+            "ameba_moves_per_sec": simulation_run.ameba_moves_per_sec,
+            "phase_seconds": simulation_run.phase_seconds,
+        },
+        "move_phases": move_phases,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the simulation core")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--boards", type=int, nargs="+", help="Board side lengths")
+    parser.add_argument("--amebas", type=int, nargs="+", help="Population sizes")
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=[engine.value for engine in PlayDeskEngine],
+        default=[PlayDeskEngine.OBJECT.value, PlayDeskEngine.NUMPY.value],
+    )
+    parser.add_argument(
+        "--step-modes",
+        nargs="+",
+        choices=[mode.value for mode in StepMode],
+        default=[mode.value for mode in StepMode],
+    )
+    parser.add_argument(
+        "--steps", type=int, default=10, help="SimulationRunner.run steps per case"
+    )
+    parser.add_argument(
+        "--food-density",
+        type=float,
+        default=0.1,
+        help="Share of board cells holding food",
+    )
+    parser.add_argument(
+        "--sample-calls",
+        type=int,
+        default=1000,
+        help="Amebas sampled for the per-call benchmarks",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default=os.path.join(project_root, "config.json"))
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    boards = args.boards or PRESETS[args.preset]["boards"]
+    populations = args.amebas or PRESETS[args.preset]["amebas"]
+
+    results = []
+    for board in boards:
+        for amebas in populations:
+            if amebas > board * board * MAX_POPULATION_SHARE:
+                continue
+            for engine in args.engines:
+                for step_mode in args.step_modes:
+                    print(
+                        f"{board}x{board} amebas={amebas} engine={engine} "
+                        f"step_mode={step_mode}",
+                        file=sys.stderr,
+                    )
+                    results.append(
+                        benchmark_case(
+                            args.config,
+                            board,
+                            amebas,
+                            engine,
+                            step_mode,
+                            args.steps,
+                            args.food_density,
+                            args.sample_calls,
+                            args.seed,
+                        )
+                    )
+
+    report = {
+        "metadata": {
+            **environment_metadata(),
+            "steps": args.steps,
+            "food_density": args.food_density,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
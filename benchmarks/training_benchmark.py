@@ -0,0 +1,266 @@
+"""
+Benchmarks of neural network training throughput on CPU.
+
+For every batch size x torch thread count x network size case, measures:
+  - data generation: synthetic samples/sec, labels included
+  - labelling: closest-food labels/sec on its own
+  - optimizer: forward/backward/SGD steps/sec on pre-generated batches
+  - time to target loss: seconds and steps until the batch loss, averaged
+    over a short window, drops below --target-loss
+
+The loss, optimizer and data pipeline are the ones BaseNeuralNetwork.train
+uses, with freshly initialized weights.
+
+Examples:
+    python benchmarks/training_benchmark.py --output training.json
+    python benchmarks/training_benchmark.py --batch-sizes 64 512 4096 \
+        --threads 1 4 8 --neurons 36 128 --output training.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from benchmark_utils import environment_metadata, project_root, write_report
+
+import torch
+import torch.nn as nn
+
+from core.config_classes.neural_network_config import NeuralNetworkConfig
+from core.game import Game
+from core.neural_network.calculations.find_closest_energy_direction import (
+    closest_energy_direction_batch,
+)
+from core.neural_network.training_data import SyntheticVisibleAreaBatches
+
+LOSS_WINDOW = 20
+
+
+def _fresh_network(config: NeuralNetworkConfig) -> nn.Module:
+    """Network of the given size with new weights, laid out as
+    BaseNeuralNetwork._generate_nn does. Built directly so the benchmark
+    never loads, or touches, the saved checkpoint."""
+    neurons = config.initial_neurons_on_layer
+    layers = [nn.Linear(config.input_size, neurons), nn.ReLU()]
+    for _ in range(config.initial_hidden_layers):
+        layers += [nn.Linear(neurons, neurons), nn.ReLU()]
+    layers.append(nn.Linear(neurons, 4))
+    return nn.Sequential(*layers)
+
+
+def _rate(count: float, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+def benchmark_data_generation(
+    dataset: SyntheticVisibleAreaBatches, batch_size: int, batches: int
+) -> Dict[str, float]:
+    started = time.perf_counter()
+    generated = [dataset.generate_batch(i) for i in range(batches)]
+    generation_seconds = time.perf_counter() - started
+
+    window_shape = dataset._window_shape
+    started = time.perf_counter()
+    for inputs, _ in generated:
+        closest_energy_direction_batch(inputs.reshape(-1, *window_shape))
+    labelling_seconds = time.perf_counter() - started
+
+    return {
+        "samples_per_sec": _rate(batches * batch_size, generation_seconds),
+        "labels_per_sec": _rate(batches * batch_size, labelling_seconds),
+    }
+
+
+def benchmark_optimizer(
+    network: nn.Module,
+    dataset: SyntheticVisibleAreaBatches,
+    batch_size: int,
+    steps: int,
+) -> Dict[str, float]:
+    batches = [dataset.generate_batch(i) for i in range(min(steps, 16))]
+    criterion = nn.CrossEntropyLoss()
+    optimizer = torch.optim.SGD(network.parameters(), lr=0.01)
+    network.train()
+
+    started = time.perf_counter()
+    for step in range(steps):
+        inputs, labels = batches[step % len(batches)]
+        loss = criterion(network(inputs), labels)
+        loss.backward()
+        optimizer.step()
+        optimizer.zero_grad()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "steps_per_sec": _rate(steps, elapsed),
+        "samples_per_sec": _rate(steps * batch_size, elapsed),
+    }
+
+
+def benchmark_time_to_target(
+    network: nn.Module,
+    dataset: SyntheticVisibleAreaBatches,
+    target_loss: float,
+    max_seconds: float,
+) -> Dict[str, Optional[float]]:
+    criterion = nn.CrossEntropyLoss()
+    optimizer = torch.optim.SGD(network.parameters(), lr=0.01)
+    network.train()
+    recent_losses: deque = deque(maxlen=LOSS_WINDOW)
+
+    started = time.perf_counter()
+    step = 0
+    while time.perf_counter() - started < max_seconds:
+        inputs, labels = dataset.generate_batch(step)
+        loss = criterion(network(inputs), labels)
+        loss.backward()
+        optimizer.step()
+        optimizer.zero_grad()
+        step += 1
+
+        recent_losses.append(loss.item())
+        average_loss = sum(recent_losses) / len(recent_losses)
+        if len(recent_losses) == LOSS_WINDOW and average_loss < target_loss:
+            return {
+                "reached": True,
+                "seconds": time.perf_counter() - started,
+                "steps": step,
+                "final_loss": average_loss,
+            }
+    return {
+        "reached": False,
+        "seconds": None,
+        "steps": step,
+        "final_loss": (
+            sum(recent_losses) / len(recent_losses) if recent_losses else None
+        ),
+    }
+
+
+def benchmark_case(
+    base_config: NeuralNetworkConfig,
+    window_shape: tuple[int, int],
+    batch_size: int,
+    threads: int,
+    hidden_layers: int,
+    neurons: int,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """Benchmark one batch size / thread count / network size case"""
+    torch.set_num_threads(threads)
+    torch.manual_seed(args.seed)
+    config = NeuralNetworkConfig(
+        initial_hidden_layers=hidden_layers,
+        initial_neurons_on_layer=neurons,
+        input_size=base_config.input_size,
+    )
+    dataset = SyntheticVisibleAreaBatches(
+        num_batches=0, batch_size=batch_size, window_shape=window_shape, seed=args.seed
+    )
+
+    return {
+        "batch_size": batch_size,
+        "threads": threads,
+        "hidden_layers": hidden_layers,
+        "neurons": neurons,
+        "parameters": sum(p.numel() for p in _fresh_network(config).parameters()),
+        "data_generation": benchmark_data_generation(
+            dataset, batch_size, args.data_batches
+        ),
+        "optimizer": benchmark_optimizer(
+            _fresh_network(config), dataset, batch_size, args.optimizer_steps
+        ),
+        "time_to_target_loss": benchmark_time_to_target(
+            _fresh_network(config), dataset, args.target_loss, args.max_seconds
+        ),
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark network training")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[32, 256, 2048])
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, torch.get_num_threads()]
+    )
+    parser.add_argument(
+        "--hidden-layers",
+        type=int,
+        nargs="+",
+        help="Hidden layer counts (default: from config)",
+    )
+    parser.add_argument(
+        "--neurons",
+        type=int,
+        nargs="+",
+        help="Neurons per layer (default: from config)",
+    )
+    parser.add_argument("--data-batches", type=int, default=20)
+    parser.add_argument("--optimizer-steps", type=int, default=200)
+    parser.add_argument("--target-loss", type=float, default=1.0)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=30.0,
+        help="Time-to-target-loss budget per case",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default=os.path.join(project_root, "config.json"))
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    game_config = Game.load_config(args.config)
+    base_config = game_config.neural_network
+    window_shape = (
+        2 * game_config.ameba.visible_rows + 1,
+        2 * game_config.ameba.visible_columns + 1,
+    )
+    hidden_layers_options = args.hidden_layers or [base_config.initial_hidden_layers]
+    neurons_options = args.neurons or [base_config.initial_neurons_on_layer]
+    default_threads = torch.get_num_threads()
+
+    results = []
+    try:
+        for hidden_layers in hidden_layers_options:
+            for neurons in neurons_options:
+                for threads in sorted(set(args.threads)):
+                    for batch_size in args.batch_sizes:
+                        print(
+                            f"layers={hidden_layers} neurons={neurons} "
+                            f"threads={threads} batch_size={batch_size}",
+                            file=sys.stderr,
+                        )
+                        results.append(
+                            benchmark_case(
+                                base_config,
+                                window_shape,
+                                batch_size,
+                                threads,
+                                hidden_layers,
+                                neurons,
+                                args,
+                            )
+                        )
+    finally:
+        torch.set_num_threads(default_threads)
+
+    report = {
+        "metadata": {
+            **environment_metadata(),
+            "window_shape": list(window_shape),
+            "target_loss": args.target_loss,
+            "max_seconds": args.max_seconds,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
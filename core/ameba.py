@@ -1,4 +1,6 @@
-import torch
+import logging
+
+from torch.types import Number
 
 from core.shared.visible_area import VisibleEntities
 from core.abstract_classes.energy_item import EnergyItem
@@ -7,6 +9,10 @@ from core.abstract_classes.position_item import PositionItem
 from core.shared.position import Position
 from core.config_classes.ameba_config import AmebaConfig
 from core.neural_network.abstract_classes.neural_network_model import NeuralNetwork
+from core.shared.log import LogSampler, get_logger
+
+logger = get_logger("ameba")
+_move_sampler = LogSampler()
 
 
 class Ameba(PositionItem, EnergyItem):
@@ -35,35 +41,33 @@ class Ameba(PositionItem, EnergyItem):
     def get_position(self) -> Position:
         return self._position
 
+    def get_neural_network(self) -> NeuralNetwork:
+        return self._neural_network
+
     def move(self, visible_area: VisibleEntities) -> Position:
-        print("---------------init move------------------")
-        # print(
-        #     "Ameba initial position: row= ",
-        #     self._position.row,
-        #     " col= ",
-        #     self._position.column,
-        # )
-        # visible_energy = visible_area.get_visible_energy()
-        # print("visible_area.get_visible_energy() =")
-        # for i in range(len(visible_energy)):
-        #     print(
-        #         f"{i:02d} :",
-        #         [
-        #             f"{j}: {visible_energy[i][j]:02.0f}"
-        #             for j in range(len(visible_energy[i]))
-        #         ],
-        #     )
         prediction_item = self._neural_network.predict(visible_area)
-        print("prediction_item =", prediction_item)
+        return self.apply_prediction(prediction_item, visible_area)
+
+    def apply_prediction(
+        self, prediction_item: Number, visible_area: VisibleEntities
+    ) -> Position:
         new_position = Position.move_according_prediction(prediction_item)
-        print("new_position =", new_position.row, new_position.column)
         entity_on_new_position = visible_area.get_entity_on_position(new_position)
         if entity_on_new_position is not None and isinstance(
             entity_on_new_position, EnergyItem
         ):
             entity_on_new_position.mark_deleted()
             self._energy += entity_on_new_position.get_energy()
-        print("+++++++++++++++ move end +++++++++++++++")
+        if logger.isEnabledFor(logging.DEBUG) and _move_sampler.should_record():
+            logger.debug(
+                "move from (%d, %d) prediction=%s delta=(%d, %d) energy=%.1f",
+                self._position.row,
+                self._position.column,
+                prediction_item,
+                new_position.row,
+                new_position.column,
+                self._energy,
+            )
         return new_position
 
     def check_and_divide(self):
@@ -7,6 +7,9 @@ class PlayDeskConfig:
     columns: int
     total_energy: float
     energy_per_food: float
+    engine: str = "object"
+    step_mode: str = "sequential"
+    energy_audit_every: int = 0
 
     @classmethod
     def from_dict(cls, data: dict) -> "PlayDeskConfig":
@@ -15,6 +18,9 @@ class PlayDeskConfig:
             columns=data["columns"],
             total_energy=data["total_energy"],
             energy_per_food=data["energy_per_food"],
+            engine=data.get("engine", "object"),
+            step_mode=data.get("step_mode", "sequential"),
+            energy_audit_every=data.get("energy_audit_every", 0),
         )
 
     def to_dict(self) -> dict:
@@ -23,4 +29,7 @@ class PlayDeskConfig:
             "columns": self.columns,
             "total_energy": self.total_energy,
             "energy_per_food": self.energy_per_food,
+            "engine": self.engine,
+            "step_mode": self.step_mode,
+            "energy_audit_every": self.energy_audit_every,
         }
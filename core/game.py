@@ -1,23 +1,40 @@
 import json
+from dataclasses import asdict
+from typing import Optional, Sequence
+
+import numpy as np
 
 from core.ameba import Ameba
+from core.game_snapshot import GameState, load_game_state, save_game_state
+from core.neural_network.abstract_classes.neural_network_model import NeuralNetwork
+from core.shared.log import get_logger
+from core.shared.position import Position
 from core.shared.visible_area import CalculateVisibleAreaService
 from core.config_classes.game_config import GameConfig
 from core.play_desk import PlayDesk
+from core.play_desk_factory import get_play_desk
+from core.shared.random_streams import NETWORK_INIT, RandomStreams, stream_seed
 
 from core.neural_network.factory import NeuralNetworkType, get_neural_network
 
+logger = get_logger("game")
+
 
 class Game:
-    def __init__(self, config: GameConfig):
+    def __init__(self, config: GameConfig, seed: Optional[int] = None):
         self.config = config
+        # Equal seeds give equal trajectories, whatever else runs in the process
+        self.random_streams = RandomStreams(seed)
         calculate_visible_area = CalculateVisibleAreaService(
             visible_rows=config.ameba.visible_rows,
             visible_columns=config.ameba.visible_columns,
             desk_columns=config.play_desk.columns,
             desk_rows=config.play_desk.rows,
         )
-        self.play_desk = PlayDesk(config.play_desk, calculate_visible_area)
+        self.play_desk = get_play_desk(config.play_desk.engine)(
+            config.play_desk, calculate_visible_area, self.random_streams.food_spawn
+        )
+        self._neural_network: Optional[NeuralNetwork] = None
 
     @staticmethod
     def load_config(config_path: str) -> GameConfig:
@@ -25,9 +42,9 @@ class Game:
             config_data = json.load(file_json)
         return GameConfig.from_dict(config_data)
 
-    def initialize_play_desk(self):
-        first_ameba = self._create_first_ameba()
-        self.play_desk._amebas.append(first_ameba)
+    def initialize_play_desk(self, ameba_count: int = 1):
+        for _ in range(ameba_count):
+            self.play_desk.add_ameba(self._create_ameba())
         self.play_desk.generate_food()
 
     def get_play_desk(self) -> PlayDesk:
@@ -37,21 +54,153 @@ class Game:
         for _ in range(iterations):
             self.do_one_step()
 
-    def do_one_step(self):
-        self.play_desk.do_move_amebas()
+    def do_one_step(self) -> list[int]:
+        """Run one step and return the prediction of every ameba"""
+        return self.play_desk.do_move_amebas()
+
+    def apply_step(self, actions: Sequence[int]) -> None:
+        """Run one step with recorded predictions instead of the network"""
+        self.play_desk.apply_actions(actions)
+        self.play_desk._cleanup_play_desk()
+        self.play_desk.generate_food()
 
     def get_info(self):
         pass
 
-    def _create_first_ameba(self):
-        position = self.play_desk.get_random_empty_position()
-        energy = self.config.ameba.initial_energy
-        neural_network = get_neural_network(NeuralNetworkType.BASE_NN)(
-            self.config.neural_network
+    def capture_state(self) -> GameState:
+        """Copy of the board, ameba and random stream state"""
+        amebas = self.play_desk._amebas
+        rows, columns = self.play_desk.get_ameba_positions()
+        # Replayed games run without networks, they have no model to record
+        network = amebas[0].get_neural_network() if amebas else None
+        model_key = network.get_model_key() if network is not None else None
+        # Weights without a checkpoint can only be restored from the state
+        weights = (
+            network.get_weights() if network is not None and model_key is None else None
         )
+        return GameState(
+            config=GameConfig.from_dict(self.config.to_dict()),
+            energy_grid=np.array(self.play_desk.get_energy_grid(), dtype=np.float32),
+            ameba_rows=rows.astype(np.int32),
+            ameba_columns=columns.astype(np.int32),
+            ameba_energy=np.fromiter(
+                (ameba.get_energy() for ameba in amebas),
+                dtype=np.float64,
+                count=len(amebas),
+            ),
+            free_cells=self.play_desk._free_cells.get_cells(),
+            random_state=self.random_streams.get_state(),
+            model=asdict(model_key) if model_key is not None else None,
+            weights=weights,
+        )
+
+    @classmethod
+    def from_state(
+        cls,
+        state: GameState,
+        networks: Optional[Sequence[Optional[NeuralNetwork]]] = None,
+    ) -> "Game":
+        """Rebuild a game from `state`.
+
+        Args:
+            state: State from capture_state or load_game_state
+            networks: Network of every ameba. By default all amebas share one
+                network with the weights of the state, see state_network;
+                None entries are only valid for games stepped with
+                apply_step.
+        """
+        game = cls(state.config, seed=state.random_state["seed"])
+        game.random_streams.set_state(state.random_state)
+        game.play_desk.load_energy_grid(state.energy_grid)
+        if networks is None:
+            networks = [cls.state_network(state)] * len(state.ameba_energy)
+        for row, column, energy, network in zip(
+            state.ameba_rows.tolist(),
+            state.ameba_columns.tolist(),
+            state.ameba_energy.tolist(),
+            networks,
+        ):
+            game.play_desk.add_ameba(
+                Ameba(state.config.ameba, Position(row, column), energy, network)
+            )
+        # Same empty cell order, so food spawns continue as in the saved game
+        game.play_desk._free_cells.load_cells(state.free_cells)
+        return game
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the game to a binary snapshot file, see core.game_snapshot"""
+        save_game_state(self.capture_state(), path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, mmap: bool = True) -> "Game":
+        """Load a game saved with save_snapshot.
+
+        With `mmap` the numpy engine plays directly on a copy-on-write memory
+        map of the food grid, so loading does not read the board upfront.
+        """
+        return cls.from_state(load_game_state(path, mmap=mmap))
+
+    @staticmethod
+    def state_network(state: GameState) -> NeuralNetwork:
+        """Network with the weights of `state`: the weights saved in it, or
+        the current checkpoint when the state references one."""
+        network = get_neural_network(NeuralNetworkType.BASE_NN)(
+            state.config.neural_network,
+            seed=stream_seed(state.random_state["seed"], NETWORK_INIT),
+        )
+        if state.weights is not None:
+            network.set_weights(state.weights)
+            return network
+        model_key = network.get_model_key()
+        checkpoint_hash = model_key.checkpoint_hash if model_key else None
+        if (
+            state.model is not None
+            and state.model["checkpoint_hash"] != checkpoint_hash
+        ):
+            logger.warning(
+                "Game state was saved with another checkpoint (%s), "
+                "loading the current one (%s)",
+                state.model["checkpoint_hash"],
+                checkpoint_hash,
+            )
+        return network
+
+    def fork(self) -> "Game":
+        """Independent copy of the game at its current step.
+
+        Board arrays and random streams are copied and every network is
+        forked, so training the amebas of one game leaves the other's alone.
+        Checkpoint weights stay shared until either side trains.
+        """
+        forked_networks: dict[int, NeuralNetwork] = {}
+        networks = []
+        for ameba in self.play_desk._amebas:
+            network = ameba.get_neural_network()
+            if network is not None and id(network) not in forked_networks:
+                forked_networks[id(network)] = network.fork()
+            networks.append(
+                forked_networks[id(network)] if network is not None else None
+            )
+        return Game.from_state(self.capture_state(), networks)
+
+    def _create_ameba(self):
+        position = self.play_desk.get_random_empty_position(
+            self.random_streams.placement
+        )
+        energy = self.config.ameba.initial_energy
         return Ameba(
             self.config.ameba,
             position,
             energy,
-            neural_network,
+            self._get_neural_network(),
         )
+
+    def _get_neural_network(self) -> NeuralNetwork:
+        """Network of every ameba the game creates, so one forward pass per
+        step serves all of them whether or not the checkpoint fits."""
+        if self._neural_network is None:
+            self._neural_network = get_neural_network(NeuralNetworkType.BASE_NN)(
+                self.config.neural_network,
+                seed=self.random_streams.network_init_seed,
+            )
+        return self._neural_network
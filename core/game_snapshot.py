@@ -0,0 +1,172 @@
+"""
+Binary game snapshots.
+
+File layout, little endian:
+
+    magic "AMEBASNP" | u32 version | u32 header length | JSON header
+    | padding to 64 bytes | raw arrays, each starting on a 64 byte boundary
+
+The header holds the game config, the random stream state, the model
+reference and the dtype, shape and offset of every array, so arrays can be
+memory-mapped straight from the file on load. Network weights that do not
+come from a checkpoint are stored as arrays too, after the board arrays.
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+
+SNAPSHOT_MAGIC = b"AMEBASNP"
+SNAPSHOT_VERSION = 2
+# Version 1 snapshots have no weights and load unchanged
+READABLE_VERSIONS = (1, 2)
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sII")
+ARRAY_NAMES = (
+    "energy_grid",
+    "ameba_rows",
+    "ameba_columns",
+    "ameba_energy",
+    "free_cells",
+)
+
+
+class SnapshotError(ValueError):
+    """Raised for files that are not readable game snapshots"""
+
+
+@dataclass
+class GameState:
+    """Everything needed to rebuild a game at one point of its run"""
+
+    config: GameConfig
+    energy_grid: np.ndarray  # (rows, columns) float32 food energy
+    ameba_rows: np.ndarray  # (amebas,) int32
+    ameba_columns: np.ndarray  # (amebas,) int32
+    ameba_energy: np.ndarray  # (amebas,) float64
+    free_cells: np.ndarray  # (empty cells,) int32 flat indexes in sampling order
+    random_state: Dict[str, Any]  # RandomStreams.get_state()
+    model: Optional[Dict[str, Any]] = None  # ModelKey fields, None if diverged
+    # Network state dict as arrays, only when the weights have no checkpoint
+    weights: Optional[Dict[str, np.ndarray]] = None
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _random_state_to_json(random_state: Dict[str, Any]) -> Dict[str, Any]:
+    data = dict(random_state)
+    for name, value in random_state.items():
+        if isinstance(value, tuple):
+            version, internal_state, gauss = value
+            data[name] = [version, list(internal_state), gauss]
+    return data
+
+
+def _random_state_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    random_state = dict(data)
+    for name, value in data.items():
+        if isinstance(value, list):
+            version, internal_state, gauss = value
+            random_state[name] = (version, tuple(internal_state), gauss)
+    return random_state
+
+
+def _array_specs(
+    arrays: Dict[str, np.ndarray], offset: int
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """dtype, shape and offset of every array laid out from `offset`"""
+    specs = {}
+    for name, array in arrays.items():
+        specs[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset = _align(offset + array.nbytes)
+    return specs, offset
+
+
+def _read_array(
+    path: str, spec: Dict[str, Any], data_start: int, mmap: bool
+) -> np.ndarray:
+    dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+    offset = data_start + spec["offset"]
+    if mmap and all(shape):
+        return np.memmap(path, dtype, mode="c", offset=offset, shape=shape)
+    count = int(np.prod(shape))
+    return np.fromfile(path, dtype, count=count, offset=offset).reshape(shape)
+
+
+def save_game_state(state: GameState, path: str) -> None:
+    arrays = {name: np.ascontiguousarray(getattr(state, name)) for name in ARRAY_NAMES}
+    weights = {
+        name: np.ascontiguousarray(array)
+        for name, array in (state.weights or {}).items()
+    }
+    specs, offset = _array_specs(arrays, 0)
+    weight_specs, _ = _array_specs(weights, offset)
+    header = json.dumps(
+        {
+            "config": state.config.to_dict(),
+            "random_state": _random_state_to_json(state.random_state),
+            "model": state.model,
+            "arrays": specs,
+            "weights": weight_specs if state.weights is not None else None,
+        }
+    ).encode()
+
+    data_start = _align(_PREFIX.size + len(header))
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        snapshot_file.write(header)
+        for array_specs, array_values in ((specs, arrays), (weight_specs, weights)):
+            for name, array in array_values.items():
+                snapshot_file.seek(data_start + array_specs[name]["offset"])
+                array.tofile(snapshot_file)
+
+
+def load_game_state(path: str, mmap: bool = True) -> GameState:
+    """Read a snapshot written by save_game_state.
+
+    With `mmap` the board arrays are copy-on-write memory maps of the file:
+    pages are read on first access and writes never reach the file. Weights
+    are always read into memory.
+    """
+    with open(path, "rb") as snapshot_file:
+        prefix = snapshot_file.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise SnapshotError(f"{path} is too short to be a game snapshot")
+        magic, version, header_length = _PREFIX.unpack(prefix)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a game snapshot")
+        if version not in READABLE_VERSIONS:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        header = json.loads(snapshot_file.read(header_length))
+
+    data_start = _align(_PREFIX.size + header_length)
+    arrays = {
+        name: _read_array(path, header["arrays"][name], data_start, mmap)
+        for name in ARRAY_NAMES
+    }
+    weight_specs = header.get("weights")
+    weights = None
+    if weight_specs is not None:
+        weights = {
+            name: _read_array(path, spec, data_start, mmap=False)
+            for name, spec in weight_specs.items()
+        }
+
+    return GameState(
+        config=GameConfig.from_dict(header["config"]),
+        random_state=_random_state_from_json(header["random_state"]),
+        model=header["model"],
+        weights=weights,
+        **arrays,
+    )
@@ -1,13 +1,19 @@
+import copy
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, Hashable, Optional
 
+import numpy as np
+import torch
 from torch.types import Number
 
 from core.config_classes.neural_network_config import NeuralNetworkConfig
+from core.neural_network.registry import ModelKey
+from core.neural_network.shared.training_progress import TrainingProgress
 from core.shared.visible_area import VisibleEntities
 
 
 class NeuralNetwork(ABC):
-    def __init__(self, config: NeuralNetworkConfig):
+    def __init__(self, config: NeuralNetworkConfig, seed: Optional[int] = None):
         pass
 
     @abstractmethod
@@ -15,5 +21,46 @@ class NeuralNetwork(ABC):
         pass
 
     @abstractmethod
-    def train(self, steps: int, batch_size: int, mode: bool = True) -> None:
+    def predict_batch(self, visible_energy: np.ndarray) -> torch.Tensor:
+        pass
+
+    @abstractmethod
+    def predict_board(
+        self,
+        energy_grid: np.ndarray,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        window_shape: tuple[int, int],
+    ) -> torch.Tensor:
+        pass
+
+    def batch_key(self) -> Hashable:
+        return id(self)
+
+    def get_model_key(self) -> Optional[ModelKey]:
+        return None
+
+    @abstractmethod
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        """Copy of the weights, by parameter name"""
+        pass
+
+    @abstractmethod
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        pass
+
+    def fork(self) -> "NeuralNetwork":
+        """Copy whose weights change independently of this network's"""
+        return copy.deepcopy(self)
+
+    @abstractmethod
+    def train(
+        self,
+        steps: int,
+        batch_size: int,
+        mode: bool = True,
+        progress_callback: Optional[Callable[[TrainingProgress], None]] = None,
+        data_workers: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
         pass
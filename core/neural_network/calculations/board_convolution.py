@@ -0,0 +1,50 @@
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+
+def board_logits(
+    layers: nn.Sequential,
+    energy_grid: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    window_shape: tuple[int, int],
+) -> torch.Tensor:
+    """Evaluate `layers` for the windows centered on (rows, columns) without
+    gathering them.
+
+    The first Linear layer over a flattened window is a cross-correlation of
+    the wrap-padded board with its weight rows reshaped into window-sized
+    kernels, so one conv2d yields first-layer activations for every cell.
+    The remaining layers only run at the requested cells.
+    """
+    first_layer = layers[0]
+    window_rows, window_columns = window_shape
+    if not isinstance(first_layer, nn.Linear):
+        raise ValueError("First layer must be nn.Linear")
+    if first_layer.in_features != window_rows * window_columns:
+        raise ValueError(
+            f"First layer expects {first_layer.in_features} inputs, "
+            f"window has {window_rows * window_columns}"
+        )
+
+    padded_grid = np.pad(
+        energy_grid,
+        (
+            (window_rows // 2, window_rows // 2),
+            (window_columns // 2, window_columns // 2),
+        ),
+        mode="wrap",
+    )
+    board = torch.as_tensor(padded_grid, dtype=torch.float32)[None, None]
+    kernels = first_layer.weight.reshape(
+        first_layer.out_features, 1, window_rows, window_columns
+    )
+
+    with torch.no_grad():
+        activations = F.conv2d(board, kernels)[0]
+        row_index = torch.as_tensor(rows, dtype=torch.long)
+        column_index = torch.as_tensor(columns, dtype=torch.long)
+        hidden = activations[:, row_index, column_index].T + first_layer.bias
+        return layers[1:](hidden)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import torch
 
 
@@ -35,3 +37,41 @@ def closest_energy_direction(visible_area_energy_tensor: torch.Tensor) -> torch.
             return torch.tensor([0, 0, 1, 0], dtype=torch.float32)
         else:
             return torch.tensor([1, 0, 0, 0], dtype=torch.float32)
+
+
+@lru_cache(maxsize=None)
+def _manhattan_distance_map(rows: int, cols: int) -> torch.Tensor:
+    row_distance = (torch.arange(rows) - rows // 2).abs()
+    column_distance = (torch.arange(cols) - cols // 2).abs()
+    return (row_distance[:, None] + column_distance[None, :]).to(torch.float32)
+
+
+def closest_energy_direction_batch(
+    visible_area_energy_tensor: torch.Tensor,
+) -> torch.Tensor:
+    """Vectorized closest_energy_direction: (N, H, W) windows to (N, 4) labels.
+
+    argmin returns the first minimum in row-major order, which matches the
+    tie-breaking of find_closest_food_position.
+    """
+    samples, rows, cols = visible_area_energy_tensor.shape
+    distances = torch.where(
+        visible_area_energy_tensor > 0,
+        _manhattan_distance_map(rows, cols),
+        torch.tensor(float("inf")),
+    ).reshape(samples, -1)
+    closest_index = torch.argmin(distances, dim=1)
+    has_food = torch.isfinite(distances.gather(1, closest_index[:, None]))[:, 0]
+
+    row_offset = closest_index // cols - rows // 2
+    column_offset = closest_index % cols - cols // 2
+    direction = torch.where(
+        column_offset.abs() > row_offset.abs(),
+        torch.where(column_offset > 0, 1, 3),
+        torch.where(row_offset > 0, 2, 0),
+    )
+
+    labels = torch.zeros((samples, 4), dtype=torch.float32)
+    labels[torch.arange(samples), direction] = 1
+    labels[~has_food] = 0.25
+    return labels
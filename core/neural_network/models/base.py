@@ -1,32 +1,99 @@
+import copy
+import logging
+import math
 import os
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+import numpy as np
 import torch
 import torch.nn as nn
 from torch.types import Number
 
-from core.neural_network.calculations.find_closest_energy_direction import (
-    closest_energy_direction,
-)
+from core.neural_network.calculations.board_convolution import board_logits
 from core.config_classes.neural_network_config import NeuralNetworkConfig
 from core.shared.visible_area import VisibleEntities
 from core.neural_network.abstract_classes.neural_network_model import NeuralNetwork
+from core.neural_network.registry import ModelKey, get_model_registry
+from core.neural_network.shared.training_progress import TrainingProgress
+from core.neural_network.training_data import (
+    SyntheticVisibleAreaBatches,
+    synthetic_data_loader,
+)
+from core.shared.log import LogSampler, get_logger
+
+logger = get_logger("neural_network")
+_predict_sampler = LogSampler()
+
+
+def _reset_linear(layer: nn.Linear, generator: Optional[torch.Generator]) -> None:
+    """nn.Linear.reset_parameters with an explicit generator"""
+    nn.init.kaiming_uniform_(layer.weight, a=math.sqrt(5), generator=generator)
+    bound = 1 / math.sqrt(layer.in_features) if layer.in_features > 0 else 0
+    nn.init.uniform_(layer.bias, -bound, bound, generator=generator)
 
 
 class BaseNeuralNetwork(NeuralNetwork):
 
-    def __init__(self, config: NeuralNetworkConfig):
+    def __init__(self, config: NeuralNetworkConfig, seed: Optional[int] = None):
+        """Shared checkpoint weights when the checkpoint fits, otherwise new
+        weights drawn from a generator seeded with `seed` (the global torch
+        generator when None)."""
         self.config = config
-        net_state_path = os.path.join(
+        self._net_state_path = os.path.join(
             os.path.dirname(__file__), "../net_state/base.pth"
         )
-        self._generate_nn()
-        try:
-            if os.path.exists(net_state_path):
-                self._nn.load_state_dict(torch.load(net_state_path))
-        except Exception as e:
-            print(f"Failed to load neural network state: {e}")
-            if os.path.exists(net_state_path):
-                os.remove(net_state_path)
-            print("Starting with a new neural network.")
+        self._neural_network_hidden_layers = self.config.initial_hidden_layers
+        self._neurons_on_layer = self.config.initial_neurons_on_layer
+        registry = get_model_registry()
+        self._model_key: Optional[ModelKey] = ModelKey(
+            network_type="base",
+            architecture=(
+                self.config.input_size,
+                self._neural_network_hidden_layers,
+                self._neurons_on_layer,
+            ),
+            checkpoint_hash=registry.checkpoint_hash(self._net_state_path),
+        )
+        shared_nn = None
+        if self._model_key.checkpoint_hash is not None:
+            shared_nn = registry.get_or_create(self._model_key, self._load_nn)
+        if shared_nn is None:
+            # Only checkpoint weights are shared: random weights stay with this
+            # network, so they depend on the torch seed and not on which
+            # networks the process created before
+            self._model_key = None
+            generator = None if seed is None else torch.Generator().manual_seed(seed)
+            self._generate_nn(generator=generator)
+        else:
+            self._nn = shared_nn
+
+    def get_model_key(self) -> Optional[ModelKey]:
+        """Registry key of the shared weights, None once they diverged."""
+        return self._model_key
+
+    def batch_key(self) -> Hashable:
+        return id(self._nn)
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        return {
+            name: tensor.detach().cpu().numpy().copy()
+            for name, tensor in self._nn.state_dict().items()
+        }
+
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        self._ensure_own_weights()
+        self._nn.load_state_dict(
+            {name: torch.from_numpy(np.array(array)) for name, array in weights.items()}
+        )
+
+    def fork(self) -> "BaseNeuralNetwork":
+        """Copy that keeps sharing registry weights until either one trains
+        (copy-on-write), weights that already diverged are copied."""
+        forked = copy.copy(self)
+        if self._model_key is None:
+            forked._nn = copy.deepcopy(self._nn)
+        return forked
 
     def predict(self, visible_entities: VisibleEntities) -> Number:
 
@@ -39,44 +106,63 @@ class BaseNeuralNetwork(NeuralNetwork):
         self._nn.eval()
         with torch.no_grad():
             output = self._nn(flat_visible_energy_tensor)
-            print("Neural network output =", output)
+        if logger.isEnabledFor(logging.DEBUG) and _predict_sampler.should_record():
+            logger.debug("Neural network output = %s", output)
 
         predicted_class = torch.argmax(output, dim=0)
 
         return predicted_class.item()
 
-    def train(self, steps: int, batch_size: int, mode: bool = True) -> None:
+    def predict_batch(self, visible_energy: np.ndarray) -> torch.Tensor:
+        visible_energy_tensor = torch.as_tensor(visible_energy, dtype=torch.float32)
+        flat_visible_energy_tensor = visible_energy_tensor.reshape(
+            visible_energy_tensor.shape[0], -1
+        )
+
+        self._nn.eval()
+        with torch.no_grad():
+            output = self._nn(flat_visible_energy_tensor)
+
+        return torch.argmax(output, dim=1)
+
+    def predict_board(
+        self,
+        energy_grid: np.ndarray,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        window_shape: tuple[int, int],
+    ) -> torch.Tensor:
+        self._nn.eval()
+        output = board_logits(self._nn, energy_grid, rows, columns, window_shape)
+        return torch.argmax(output, dim=1)
+
+    def train(
+        self,
+        steps: int,
+        batch_size: int,
+        mode: bool = True,
+        progress_callback: Optional[Callable[[TrainingProgress], None]] = None,
+        data_workers: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._ensure_own_weights()
         self._nn.train(mode)
         criterion = nn.CrossEntropyLoss()
         optimizer = torch.optim.SGD(self._nn.parameters(), lr=0.01)
         epochs = steps // batch_size
+        num_batches = steps // batch_size
 
-        batch_inputs = []
-        batch_labels = []
-
-        for _ in range(steps):
-            visible_energy_tensor = torch.zeros((11, 11), dtype=torch.float32)
-            num_points = int(torch.randint(1, 11, (1,)).item())
-            for _ in range(num_points):
-                idx = torch.randint(0, visible_energy_tensor.shape[0], (2,))
-                visible_energy_tensor[idx[0], idx[1]] = 1
-            visible_energy_tensor[5, 5] = 0
-            batch_inputs.append(torch.flatten(visible_energy_tensor))
-            batch_labels.append(closest_energy_direction(visible_energy_tensor))
-
-        inputs = torch.stack(batch_inputs)
-        labels = torch.stack(batch_labels)
-
-        num_batches = inputs.size(0) // batch_size
+        # Batches are generated on demand and replayed every epoch, so memory
+        # stays bounded by a few batches whatever the number of steps.
+        training_data = synthetic_data_loader(
+            SyntheticVisibleAreaBatches(num_batches, batch_size, seed=seed),
+            num_workers=data_workers,
+        )
 
         for epoch in range(epochs):
+            epoch_start = time.perf_counter()
             running_loss = 0.0
-            for i in range(num_batches):
-                batch_start = i * batch_size
-                batch_end = batch_start + batch_size
-                batch_inputs = inputs[batch_start:batch_end]
-                batch_labels = labels[batch_start:batch_end]
-
+            for batch_inputs, batch_labels in training_data:
                 outputs = self._nn(batch_inputs)
                 loss = criterion(outputs, batch_labels)
                 loss.backward()
@@ -86,25 +172,88 @@ class BaseNeuralNetwork(NeuralNetwork):
                 running_loss += loss.item()
 
             avg_loss = running_loss / num_batches
-            print(f"Epoch [{epoch+1}/{epochs}], Loss: {avg_loss:.4f}")
+            logger.info("Epoch [%d/%d], Loss: %.4f", epoch + 1, epochs, avg_loss)
+            if progress_callback is not None:
+                epoch_time = time.perf_counter() - epoch_start
+                progress_callback(
+                    TrainingProgress(
+                        epoch=epoch + 1,
+                        total_epochs=epochs,
+                        loss=avg_loss,
+                        samples_per_sec=num_batches
+                        * batch_size
+                        / max(epoch_time, 1e-9),
+                    )
+                )
+
+    def save_checkpoint(self, path: Optional[str] = None) -> None:
+        """Save the weights as the checkpoint at `path` (the default one when
+        None) and evict the registry models of the checkpoint it replaces."""
+        path = path or self._net_state_path
+        registry = get_model_registry()
+        replaced_hash = registry.checkpoint_hash(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        torch.save(self._nn.state_dict(), path)
+        registry.evict_checkpoint(replaced_hash)
+
+    def _ensure_own_weights(self) -> None:
+        """Copy the shared registry module before this network's weights
+        diverge from it (copy-on-write)."""
+        if self._model_key is not None:
+            self._nn = copy.deepcopy(self._nn)
+            self._model_key = None
+
+    def _load_nn(self) -> Optional[nn.Module]:
+        """Network with the checkpoint weights, None when they cannot be loaded."""
+        if not os.path.exists(self._net_state_path):
+            return None
+        try:
+            state = torch.load(self._net_state_path)
+        except Exception as e:
+            logger.warning("Failed to load neural network state: %s", e)
+            os.remove(self._net_state_path)
+            logger.warning("Starting with a new neural network.")
+            return None
+        # Empty layers: the state replaces every weight, and drawing initial
+        # weights would shift the torch random stream on the first load only
+        self._generate_nn(initialize=False)
+        try:
+            self._nn.load_state_dict(state)
+        except RuntimeError as e:
+            # Saved for another layer layout; keep it for the networks it fits
+            logger.warning("Neural network state does not fit this network: %s", e)
+            logger.warning("Starting with a new neural network.")
+            return None
+        return self._nn
+
+    def _generate_nn(
+        self, initialize: bool = True, generator: Optional[torch.Generator] = None
+    ) -> None:
+        """Build the layers, initialized as nn.Linear does but drawing from
+        `generator`, or left uninitialized without `initialize`."""
+
+        def linear(in_features: int, out_features: int) -> nn.Linear:
+            layer = nn.utils.skip_init(nn.Linear, in_features, out_features)
+            if initialize:
+                _reset_linear(layer, generator)
+            return layer
 
-    def _generate_nn(self) -> None:
-        self._neural_network_hidden_layers = self.config.initial_hidden_layers
-        self._neurons_on_layer = self.config.initial_neurons_on_layer
         layers = []
-        layers.append(nn.Linear(self.config.input_size, self._neurons_on_layer))
+        layers.append(linear(self.config.input_size, self._neurons_on_layer))
         layers.append(nn.ReLU())
         for _ in range(self._neural_network_hidden_layers):
-            layers.append(nn.Linear(self._neurons_on_layer, self._neurons_on_layer))
+            layers.append(linear(self._neurons_on_layer, self._neurons_on_layer))
             layers.append(nn.ReLU())
-        layers.append(nn.Linear(self._neurons_on_layer, 4))
+        layers.append(linear(self._neurons_on_layer, 4))
         self._nn = nn.Sequential(*layers)
 
 
 if __name__ == "__main__":
     import json
     from core.config_classes.game_config import GameConfig
+    from core.shared.log import configure_logging
 
+    configure_logging("INFO")
     config_path = os.path.join(os.environ["PROJECTPATH"], "config.json")
     with open(config_path, "r") as file_json:
         config_data = json.load(file_json)
@@ -115,4 +264,4 @@ if __name__ == "__main__":
     neural_network.train(10000000, 6400)
     net_state_path = os.path.join(os.path.dirname(__file__), "../net_state/base.pth")
     print(f"Saving neural network state to {net_state_path}")
-    torch.save(neural_network._nn.state_dict(), net_state_path)
+    neural_network.save_checkpoint(net_state_path)
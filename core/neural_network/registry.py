@@ -0,0 +1,96 @@
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import torch.nn as nn
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """Identity of a loaded model: network type, layer sizes and checkpoint."""
+
+    network_type: str
+    architecture: tuple[int, ...]
+    checkpoint_hash: Optional[str]
+
+
+class ModelRegistry:
+    """Process-wide cache of network modules shared by every ameba using the
+    same model, so memory scales with distinct models rather than amebas."""
+
+    def __init__(self):
+        self._models: dict[ModelKey, nn.Module] = {}
+        # Keys whose factory returned None, nothing to share for them
+        self._unshared: set[ModelKey] = set()
+        self._checkpoint_hashes: dict[str, tuple[float, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self, key: ModelKey, factory: Callable[[], Optional[nn.Module]]
+    ) -> Optional[nn.Module]:
+        """Shared model of `key`, created by `factory` on first use.
+
+        A factory returning None (e.g. the checkpoint does not fit) is
+        remembered: later calls return None without calling it again.
+        """
+        with self._lock:
+            if key in self._unshared:
+                return None
+            model = self._models.get(key)
+            if model is None:
+                model = factory()
+                if model is None:
+                    self._unshared.add(key)
+                    return None
+                self._models[key] = model
+            return model
+
+    def checkpoint_hash(self, path: str) -> Optional[str]:
+        """SHA-256 of the checkpoint file, cached by modification time and size."""
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        with self._lock:
+            cached = self._checkpoint_hashes.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+                return cached[2]
+        with open(path, "rb") as checkpoint_file:
+            digest = hashlib.sha256(checkpoint_file.read()).hexdigest()
+        with self._lock:
+            self._checkpoint_hashes[path] = (stat.st_mtime, stat.st_size, digest)
+        return digest
+
+    def evict(self, key: ModelKey) -> None:
+        with self._lock:
+            self._models.pop(key, None)
+            self._unshared.discard(key)
+
+    def evict_checkpoint(self, checkpoint_hash: Optional[str]) -> None:
+        """Drop every model loaded from the checkpoint with this hash, e.g.
+        once it was overwritten."""
+        with self._lock:
+            for key in [
+                k for k in self._models if k.checkpoint_hash == checkpoint_hash
+            ]:
+                del self._models[key]
+            self._unshared = {
+                key for key in self._unshared if key.checkpoint_hash != checkpoint_hash
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._unshared.clear()
+            self._checkpoint_hashes.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+_model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    return _model_registry
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TrainingProgress:
+    """Progress reported by NeuralNetwork.train after every epoch"""
+
+    epoch: int
+    total_epochs: int
+    loss: float
+    samples_per_sec: float
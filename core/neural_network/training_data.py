@@ -0,0 +1,91 @@
+from typing import Iterator, Optional
+
+import torch
+from torch.utils.data import DataLoader, IterableDataset, get_worker_info
+
+from core.neural_network.calculations.find_closest_energy_direction import (
+    closest_energy_direction_batch,
+)
+
+
+class SyntheticVisibleAreaBatches(IterableDataset):
+    """Synthetic (inputs, labels) training batches generated on demand.
+
+    Each sample is a visible area with 1 to `max_points` unit food cells and
+    an empty center, labelled with the direction of the closest food. Batch
+    `i` is always generated from the same seed, so iterating again replays
+    the same data while only a few batches are ever held in memory.
+    """
+
+    def __init__(
+        self,
+        num_batches: int,
+        batch_size: int,
+        window_shape: tuple[int, int] = (11, 11),
+        max_points: int = 10,
+        seed: Optional[int] = None,
+    ):
+        self._num_batches = num_batches
+        self._batch_size = batch_size
+        self._window_shape = window_shape
+        self._max_points = max_points
+        if seed is None:
+            seed = int(torch.randint(0, 2**31 - 1, (1,)).item())
+        self._seed = seed
+
+    def __len__(self) -> int:
+        return self._num_batches
+
+    def __iter__(self) -> Iterator[tuple[torch.Tensor, torch.Tensor]]:
+        worker_info = get_worker_info()
+        if worker_info is None:
+            batch_indexes = range(self._num_batches)
+        else:
+            batch_indexes = range(
+                worker_info.id, self._num_batches, worker_info.num_workers
+            )
+        for batch_index in batch_indexes:
+            yield self.generate_batch(batch_index)
+
+    def generate_batch(self, batch_index: int) -> tuple[torch.Tensor, torch.Tensor]:
+        generator = torch.Generator().manual_seed(
+            (self._seed * 1_000_003 + batch_index) % 2**63
+        )
+        rows, columns = self._window_shape
+        batch_size = self._batch_size
+
+        visible_energy = torch.zeros((batch_size, rows, columns), dtype=torch.float32)
+        num_points = torch.randint(
+            1, self._max_points + 1, (batch_size,), generator=generator
+        )
+        point_rows = torch.randint(
+            0, rows, (batch_size, self._max_points), generator=generator
+        )
+        point_columns = torch.randint(
+            0, columns, (batch_size, self._max_points), generator=generator
+        )
+        used_points = torch.arange(self._max_points)[None, :] < num_points[:, None]
+        sample_indexes = torch.arange(batch_size)[:, None].expand_as(point_rows)
+        visible_energy[
+            sample_indexes[used_points],
+            point_rows[used_points],
+            point_columns[used_points],
+        ] = 1
+        visible_energy[:, rows // 2, columns // 2] = 0
+
+        labels = closest_energy_direction_batch(visible_energy)
+        return visible_energy.reshape(batch_size, -1), labels
+
+
+def synthetic_data_loader(
+    dataset: SyntheticVisibleAreaBatches, num_workers: int = 0
+) -> DataLoader:
+    """DataLoader over pre-batched synthetic data, optionally generated in
+    worker processes."""
+    return DataLoader(
+        dataset,
+        batch_size=None,
+        num_workers=num_workers,
+        persistent_workers=num_workers > 0,
+        prefetch_factor=2 if num_workers > 0 else None,
+    )
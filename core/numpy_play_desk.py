@@ -0,0 +1,263 @@
+from typing import Optional
+
+import numpy as np
+
+from core.ameba import Ameba
+from core.food import Food
+from core.play_desk import PlayDesk
+from core.config_classes.ameba_config import AmebaConfig
+from core.neural_network.abstract_classes.neural_network_model import NeuralNetwork
+from core.shared.position import Position
+from core.shared.position_index import PositionIndex
+from core.types.desk_entity import DeskEntity
+
+
+class AmebaArrays:
+    """Struct-of-arrays storage of ameba row, column, energy and alive flag."""
+
+    def __init__(self, capacity: int = 16):
+        self.rows = np.zeros(capacity, dtype=np.int32)
+        self.columns = np.zeros(capacity, dtype=np.int32)
+        self.energy = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.size = 0
+
+    def append(self, row: int, column: int, energy: float) -> int:
+        if self.size == len(self.rows):
+            self._grow(2 * len(self.rows))
+        slot = self.size
+        self.rows[slot] = row
+        self.columns[slot] = column
+        self.energy[slot] = energy
+        self.alive[slot] = True
+        self.size += 1
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("rows", "columns", "energy", "alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+
+class AmebaView(Ameba):
+    """Ameba whose position, energy and alive flag live in AmebaArrays."""
+
+    def __init__(
+        self,
+        arrays: AmebaArrays,
+        slot: int,
+        config: AmebaConfig,
+        neutral_network: NeuralNetwork,
+    ):
+        self._arrays = arrays
+        self._slot = slot
+        self._config = config
+        self._neural_network = neutral_network
+
+    @property
+    def _position(self) -> Position:
+        return Position(
+            int(self._arrays.rows[self._slot]), int(self._arrays.columns[self._slot])
+        )
+
+    @_position.setter
+    def _position(self, position: Position) -> None:
+        self._arrays.rows[self._slot] = position.row
+        self._arrays.columns[self._slot] = position.column
+
+    @property
+    def _energy(self) -> float:
+        return float(self._arrays.energy[self._slot])
+
+    @_energy.setter
+    def _energy(self, energy: float) -> None:
+        self._arrays.energy[self._slot] = energy
+
+    @property
+    def _is_deleted(self) -> bool:
+        return not self._arrays.alive[self._slot]
+
+    @_is_deleted.setter
+    def _is_deleted(self, is_deleted: bool) -> None:
+        self._arrays.alive[self._slot] = not is_deleted
+
+
+class FoodView(Food):
+    """Food item backed by one cell of the desk's food energy grid."""
+
+    def __init__(self, play_desk: "NumpyPlayDesk", position: Position):
+        self._play_desk = play_desk
+        self._position = position
+        self._eaten_energy: Optional[float] = None
+
+    def mark_deleted(self):
+        if self._eaten_energy is None:
+            # Eaten by the ameba moving onto the cell, which stays occupied
+            self._eaten_energy = self._play_desk._take_food(
+                self._position, update_free_cell=False
+            )
+
+    def get_energy(self) -> float:
+        if self._eaten_energy is not None:
+            return self._eaten_energy
+        return float(
+            self._play_desk._food_energy[self._position.row, self._position.column]
+        )
+
+    def is_deleted(self) -> bool:
+        return self._eaten_energy is not None
+
+
+class FoodGridIndex(PositionIndex):
+    """PositionIndex view of the food energy grid, yielding FoodView items."""
+
+    def __init__(self, play_desk: "NumpyPlayDesk"):
+        self._play_desk = play_desk
+
+    def add(self, entity: DeskEntity) -> None:
+        self._play_desk._place_food(entity.get_position(), entity.get_energy())
+
+    def remove(self, entity: DeskEntity, position: Optional[Position] = None) -> None:
+        self._play_desk._take_food(
+            position if position is not None else entity.get_position()
+        )
+
+    def get(self, position: Position) -> Optional[DeskEntity]:
+        if self.is_occupied(position):
+            return FoodView(self._play_desk, position)
+        return None
+
+    def is_occupied(self, position: Position) -> bool:
+        return bool(self._play_desk._food_energy[position.row, position.column] > 0)
+
+    def __len__(self) -> int:
+        return self._play_desk.get_food_count()
+
+
+class AmebaGridIndex(PositionIndex):
+    """PositionIndex over a per-cell ameba count grid.
+
+    Occupancy checks read the count grid, `get` looks the ameba up in the
+    desk's ameba arrays and returns the one added first.
+    """
+
+    def __init__(self, play_desk: "NumpyPlayDesk"):
+        config = play_desk._config
+        self._play_desk = play_desk
+        self._counts = np.zeros((config.rows, config.columns), dtype=np.int32)
+
+    def add(self, entity: DeskEntity) -> None:
+        position = entity.get_position()
+        self._counts[position.row, position.column] += 1
+
+    def remove(self, entity: DeskEntity, position: Optional[Position] = None) -> None:
+        position = position if position is not None else entity.get_position()
+        if self._counts[position.row, position.column] > 0:
+            self._counts[position.row, position.column] -= 1
+
+    def get(self, position: Position) -> Optional[DeskEntity]:
+        if not self.is_occupied(position):
+            return None
+        arrays = self._play_desk._ameba_arrays
+        slots = np.flatnonzero(
+            (arrays.rows[: arrays.size] == position.row)
+            & (arrays.columns[: arrays.size] == position.column)
+            & arrays.alive[: arrays.size]
+        )
+        return self._play_desk._amebas[slots[0]] if len(slots) else None
+
+    def is_occupied(self, position: Position) -> bool:
+        return bool(self._counts[position.row, position.column] > 0)
+
+    def __len__(self) -> int:
+        return int(self._counts.sum())
+
+
+class NumpyPlayDesk(PlayDesk):
+    """PlayDesk storing food as a float32 energy grid and amebas as arrays."""
+
+    def _init_storage(self) -> None:
+        rows, columns = self._config.rows, self._config.columns
+        self._food_energy = np.zeros((rows, columns), dtype=np.float32)
+        self._ameba_arrays = AmebaArrays()
+        self._ameba_index = AmebaGridIndex(self)
+        self._food_index = FoodGridIndex(self)
+        self._food_count = 0
+        self._eaten_food_count = 0
+
+    @property
+    def _foods(self) -> list[Food]:
+        rows, columns = np.nonzero(self._food_energy)
+        return [
+            FoodView(self, Position(int(row), int(column)))
+            for row, column in zip(rows, columns)
+        ]
+
+    def load_energy_grid(self, energy_grid: np.ndarray) -> None:
+        """Use `energy_grid` as the food grid without copying it, on a desk
+        that has no food yet. It must be a writable float32 array."""
+        self._food_energy = energy_grid
+        rows, columns = np.nonzero(energy_grid)
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            self._free_cells.discard(Position(row, column))
+        self._food_count = len(rows)
+        self._food_energy_total = float(energy_grid.sum(dtype=np.float64))
+
+    def get_ameba_positions(self) -> tuple[np.ndarray, np.ndarray]:
+        arrays = self._ameba_arrays
+        return arrays.rows[: arrays.size].copy(), arrays.columns[: arrays.size].copy()
+
+    def get_ameba_energies(self) -> np.ndarray:
+        return self._ameba_arrays.energy[: self._ameba_arrays.size].copy()
+
+    def add_ameba(self, ameba: Ameba) -> None:
+        position = ameba.get_position()
+        slot = self._ameba_arrays.append(
+            position.row, position.column, ameba.get_energy()
+        )
+        view = AmebaView(self._ameba_arrays, slot, ameba._config, ameba._neural_network)
+        self._amebas.append(view)
+        self._ameba_index.add(view)
+        self._free_cells.discard(position)
+        self._ameba_energy_total += ameba.get_energy()
+
+    def add_food(self, food: Food) -> None:
+        self._place_food(food.get_position(), food.get_energy())
+
+    def get_food_count(self) -> int:
+        return self._food_count
+
+    def _place_food(self, position: Position, energy: float) -> None:
+        old_energy = float(self._food_energy[position.row, position.column])
+        self._food_energy_total += energy - old_energy
+        self._food_count += (energy > 0) - (old_energy > 0)
+        self._food_energy[position.row, position.column] = energy
+        if energy > 0:
+            self._free_cells.discard(position)
+            self._record_spawned_food(position, energy)
+        else:
+            self._update_free_cell(position)
+
+    def _take_food(self, position: Position, update_free_cell: bool = True) -> float:
+        energy = float(self._food_energy[position.row, position.column])
+        self._food_energy[position.row, position.column] = 0
+        self._food_energy_total -= energy
+        if energy > 0:
+            self._food_count -= 1
+            self._eaten_food_count += 1
+        if update_free_cell:
+            self._update_free_cell(position)
+        return energy
+
+    def _recount_energy(self) -> tuple[float, float]:
+        arrays = self._ameba_arrays
+        food_energy = float(self._food_energy.sum(dtype=np.float64))
+        ameba_energy = float(arrays.energy[: arrays.size].sum(dtype=np.float64))
+        return food_energy, ameba_energy
+
+    def _cleanup_play_desk(self) -> int:
+        # Eaten food is zeroed in the grid immediately, nothing to compact.
+        eaten_food_count, self._eaten_food_count = self._eaten_food_count, 0
+        return eaten_food_count
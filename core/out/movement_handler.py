@@ -1,5 +1,7 @@
 import sys
 import json
+import logging
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
@@ -12,6 +14,11 @@ from core.config_classes.game_config import GameConfig
 from core.ameba import Ameba
 from core.food import Food
 from core.shared.position import Position as CorePosition
+from core.shared.log import get_logger
+from core.shared.step_metrics import get_step_metrics
+from core.out.step_delta import StepDeltaEncoder
+
+logger = get_logger("out.movement_handler")
 
 
 class MovementResult:
@@ -44,7 +51,26 @@ class MovementHandler:
         self.project_root = project_root
         self.config_path = project_root / "config.json"
         self.game = None
+        # Serializes every mutation of self.game
+        self._lock = threading.Lock()
+        self._snapshot: Dict[str, Any] = self._get_current_game_state()
+        self._snapshot_version = 0
+        # Snapshot version of the last step_frame, deltas chain from it
+        self._stream_version: Optional[int] = None
         self._load_game()
+        self._commit_snapshot()
+
+    def get_snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Last committed game state and its version.
+
+        Never waits for an in-flight step: the snapshot is replaced as a
+        whole after every committed step and never mutated.
+        """
+        return self._snapshot_version, self._snapshot
+
+    def _commit_snapshot(self, state: Optional[Dict[str, Any]] = None) -> None:
+        self._snapshot = state if state is not None else self._get_current_game_state()
+        self._snapshot_version += 1
 
     def _load_game(self):
         """Load game configuration and initialize game"""
@@ -56,7 +82,7 @@ class MovementHandler:
             else:
                 raise FileNotFoundError(f"Config file not found: {self.config_path}")
         except Exception as e:
-            print(f"Error loading game: {e}")
+            logger.error("Error loading game: %s", e)
             self.game = None
 
     def move_amebas(
@@ -76,6 +102,62 @@ class MovementHandler:
         Returns:
             Dictionary with movement results
         """
+        with self._lock:
+            result = self._move_amebas(game_state, ameba_id, iterations)
+            self._commit_snapshot(result.get("updated_game_state"))
+        return result
+
+    def step_frame(self, keyframe_interval: int = 10) -> Dict[str, Any]:
+        """Move every ameba once and return the step as a frame
+
+        The result of move_amebas with the step under "frame", see
+        core.out.step_delta. Frames are numbered with the snapshot version. A
+        frame is a keyframe every keyframe_interval versions and whenever the
+        game changed outside of step_frame since the previous one, so the
+        deltas in between always chain.
+        """
+        with self._lock:
+            if not self.game:
+                return self._move_amebas(None, None, 1)
+            play_desk = self.game.play_desk
+            follows_stream = self._stream_version == self._snapshot_version
+            play_desk.record_spawned_food()
+            try:
+                result = self._move_amebas(None, None, 1)
+                spawned = play_desk.take_spawned_food()
+            finally:
+                play_desk.record_spawned_food(False)
+            self._commit_snapshot(result.get("updated_game_state"))
+            if not result["success"]:
+                return result
+
+            self._stream_version = version = self._snapshot_version
+            encoder = StepDeltaEncoder(keyframe_interval)
+            if follows_stream and not encoder.is_keyframe(version):
+                frame = encoder.delta(version, play_desk, result["movements"], spawned)
+            else:
+                frame = self._stream_keyframe()
+        return {**result, "frame": frame}
+
+    def stream_keyframe(self) -> Dict[str, Any]:
+        """Keyframe of the current game, numbered like the step_frame frames"""
+        with self._lock:
+            return self._stream_keyframe()
+
+    def _stream_keyframe(self) -> Dict[str, Any]:
+        frame = StepDeltaEncoder().keyframe(self._snapshot_version, self.game.play_desk)
+        frame["board_size"] = {
+            "rows": self.game.config.play_desk.rows,
+            "columns": self.game.config.play_desk.columns,
+        }
+        return frame
+
+    def _move_amebas(
+        self,
+        game_state: Optional[Dict],
+        ameba_id: Optional[int],
+        iterations: int,
+    ) -> Dict[str, Any]:
         try:
             if not self.game:
                 return {
@@ -142,6 +224,9 @@ class MovementHandler:
                 "foods_generated": 0,
             }
 
+        metrics = get_step_metrics()
+        step_started = mark = metrics.start()
+
         if ameba_id is not None:
             # Move specific ameba
             if ameba_id < len(self.game.play_desk._amebas):
@@ -156,56 +241,58 @@ class MovementHandler:
                 if movement:
                     movements.append(movement)
 
+        mark = metrics.stop("move", mark)
+
         # Cleanup and regenerate food
-        food_count_before = len(
-            [food for food in self.game.play_desk._foods if not food.is_deleted()]
-        )
-        self.game.play_desk._cleanup_play_desk()
-        food_count_after_cleanup = len(
-            [food for food in self.game.play_desk._foods if not food.is_deleted()]
-        )
+        play_desk = self.game.play_desk
+        foods_consumed = play_desk._cleanup_play_desk()
+        mark = metrics.stop("cleanup", mark)
+        food_count_after_cleanup = play_desk.get_food_count()
+        food_count_before = food_count_after_cleanup + foods_consumed
 
         # Original food generation
-        self.game.play_desk.generate_food()
-        food_count_after_generation = len(
-            [food for food in self.game.play_desk._foods if not food.is_deleted()]
-        )
+        play_desk.generate_food()
+        food_count_after_generation = play_desk.get_food_count()
 
         # Ensure minimum food count for gameplay
         minimum_foods = 12
         if food_count_after_generation < minimum_foods:
             foods_to_add = minimum_foods - food_count_after_generation
-            print(
-                f"[FOOD REGENERATION] Adding {foods_to_add} foods to reach minimum of {minimum_foods}"
+            logger.info(
+                "[FOOD REGENERATION] Adding %d foods to reach minimum of %d",
+                foods_to_add,
+                minimum_foods,
             )
 
             from core.food import Food
 
-            for _ in range(foods_to_add):
-                try:
-                    energy = self.game.config.play_desk.energy_per_food
-                    position = self.game.play_desk.get_random_empty_position()
-                    food = Food(energy=energy, position=position)
-                    self.game.play_desk._foods.append(food)
-                except Exception as e:
-                    print(f"[FOOD REGENERATION] Error creating food: {e}")
-                    break
-
-            food_count_after_generation = len(
-                [food for food in self.game.play_desk._foods if not food.is_deleted()]
-            )
+            foods_to_add = min(foods_to_add, play_desk.get_empty_cell_count())
+            energy = self.game.config.play_desk.energy_per_food
+            for position in play_desk.get_random_empty_positions(foods_to_add):
+                play_desk.add_food(Food(energy=energy, position=position))
+
+            food_count_after_generation = play_desk.get_food_count()
+
+        metrics.stop("generate_food", mark)
+        metrics.stop("step", step_started)
 
         # Calculate food statistics
-        foods_consumed = food_count_before - food_count_after_cleanup
         foods_generated = food_count_after_generation - food_count_after_cleanup
 
         # Log food generation for debugging
-        if foods_consumed > 0 or foods_generated > 0:
-            print(
-                f"[FOOD TRACKING] Before: {food_count_before}, After cleanup: {food_count_after_cleanup}, After generation: {food_count_after_generation}"
+        if (foods_consumed > 0 or foods_generated > 0) and logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            logger.debug(
+                "[FOOD TRACKING] Before: %d, After cleanup: %d, After generation: %d",
+                food_count_before,
+                food_count_after_cleanup,
+                food_count_after_generation,
             )
-            print(
-                f"[FOOD TRACKING] Foods consumed: {foods_consumed}, Foods generated: {foods_generated}"
+            logger.debug(
+                "[FOOD TRACKING] Foods consumed: %d, Foods generated: %d",
+                foods_consumed,
+                foods_generated,
             )
 
         return {
@@ -225,26 +312,22 @@ class MovementHandler:
             old_position = (ameba.get_position().row, ameba.get_position().column)
             old_energy = ameba.get_energy()
 
-            # Get visible area and move ameba
-            visible_area = self.game.play_desk._calculate_visible_area_service.fetch_visible_entities(
-                ameba.get_position(), self.game.play_desk._foods
-            )
-
-            move_delta = ameba.move(visible_area)
-            ameba._position += move_delta
-            ameba._position.adjust_position(
-                self.game.config.play_desk.rows, self.game.config.play_desk.columns
-            )
+            # Move ameba through the play desk so its position index stays current
+            self.game.play_desk.move_ameba(ameba)
+            # Only eating raises the energy, the move cost is applied below
+            ate_food = ameba.get_energy() > old_energy
 
             # Apply energy loss for movement (since core ameba.move doesn't do this)
-            ameba._energy -= self.game.config.ameba.lost_energy_per_move
+            self.game.play_desk.adjust_ameba_energy(
+                ameba, -self.game.config.ameba.lost_energy_per_move
+            )
 
             new_position = (ameba.get_position().row, ameba.get_position().column)
             energy_change = ameba.get_energy() - old_energy
 
             # Check if food was consumed
             food_consumed = None
-            if energy_change > 0:
+            if ate_food:
                 food_consumed = new_position
 
             return MovementResult(
@@ -256,7 +339,7 @@ class MovementHandler:
             )
 
         except Exception as e:
-            print(f"Error moving ameba {ameba_id}: {e}")
+            logger.error("Error moving ameba %d: %s", ameba_id, e)
             return None
 
     def _update_game_state(self, game_state: Dict):
@@ -308,9 +391,21 @@ class MovementHandler:
         }
 
     def run_simulation(
-        self, iterations: int, return_steps: bool = False
+        self, iterations: int, return_steps: bool = False, keyframe_interval: int = 10
+    ) -> Dict[str, Any]:
+        """Run a full game simulation
+
+        With return_steps, steps are delta encoded with a keyframe every
+        keyframe_interval steps, see core.out.step_delta.
+        """
+        with self._lock:
+            result = self._run_simulation(iterations, return_steps, keyframe_interval)
+            self._commit_snapshot(result.get("final_game_state") or None)
+        return result
+
+    def _run_simulation(
+        self, iterations: int, return_steps: bool, keyframe_interval: int
     ) -> Dict[str, Any]:
-        """Run a full game simulation"""
         try:
             if not self.game:
                 return {
@@ -321,56 +416,33 @@ class MovementHandler:
                     "error_details": "Game configuration could not be loaded",
                 }
 
-            steps = [] if return_steps else None
-
-            for step in range(iterations):
-                # Get state before movement
-                if return_steps:
-                    pre_state = self._get_current_game_state()
-
-                # Do one step
-                movements = self._do_single_move_iteration()
-
-                # Record step if requested
-                if return_steps and steps is not None:
-                    post_state = self._get_current_game_state()
-                    total_energy = sum(a["energy"] for a in post_state["amebas"]) + sum(
-                        f["energy"] for f in post_state["foods"]
-                    )
-
-                    steps.append(
-                        {
-                            "step_number": step + 1,
-                            "movements": [
-                                {
-                                    "ameba_position": {
-                                        "row": m.ameba_position[0],
-                                        "column": m.ameba_position[1],
-                                    },
-                                    "old_position": {
-                                        "row": m.old_position[0],
-                                        "column": m.old_position[1],
-                                    },
-                                    "new_position": {
-                                        "row": m.new_position[0],
-                                        "column": m.new_position[1],
-                                    },
-                                    "energy_change": m.energy_change,
-                                    "food_consumed": (
-                                        {
-                                            "row": m.food_consumed[0],
-                                            "column": m.food_consumed[1],
-                                        }
-                                        if m.food_consumed
-                                        else None
-                                    ),
-                                }
-                                for m in movements
-                            ],
-                            "game_state": post_state,
-                            "total_energy": total_energy,
-                        }
-                    )
+            play_desk = self.game.play_desk
+            steps = None
+            if return_steps:
+                encoder = StepDeltaEncoder(keyframe_interval)
+                steps = [encoder.keyframe(0, play_desk)]
+                play_desk.record_spawned_food()
+
+            try:
+                for step in range(1, iterations + 1):
+                    iteration_result = self._do_single_move_iteration()
+                    if steps is None:
+                        continue
+                    spawned = play_desk.take_spawned_food()
+                    if encoder.is_keyframe(step):
+                        steps.append(encoder.keyframe(step, play_desk))
+                    else:
+                        steps.append(
+                            encoder.delta(
+                                step,
+                                play_desk,
+                                iteration_result["movements"],
+                                spawned,
+                            )
+                        )
+            finally:
+                if steps is not None:
+                    play_desk.record_spawned_food(False)
 
             final_state = self._get_current_game_state()
             total_energy = sum(a["energy"] for a in final_state["amebas"]) + sum(
@@ -0,0 +1,161 @@
+"""
+Parameter sweeps - runs many headless simulations over GameConfig overrides
+on a process pool and collects their summary stats into columns
+
+Overrides use dotted GameConfig paths, e.g. {"play_desk.total_energy": 5000,
+"ameba.visible_rows": 3, "neural_network.initial_neurons_on_layer": 64}. A
+search space maps each path to the values to try; `grid_overrides` expands
+it to every combination and `random_overrides` samples it.
+"""
+
+import copy
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+from core.config_classes.game_config import GameConfig
+from core.out.simulation_runner import SimulationRunner
+from core.shared.log import get_logger
+
+logger = get_logger("parameter_sweep")
+
+SearchSpace = Dict[str, Sequence[Any]]
+Overrides = Dict[str, Any]
+
+
+def grid_overrides(space: SearchSpace) -> List[Overrides]:
+    """Every combination of the values in `space`"""
+    paths = sorted(space)
+    return [
+        dict(zip(paths, values))
+        for values in itertools.product(*(space[path] for path in paths))
+    ]
+
+
+def random_overrides(
+    space: SearchSpace, samples: int, seed: int = 0
+) -> List[Overrides]:
+    """`samples` combinations, each value drawn uniformly from its list"""
+    rng = random.Random(seed)
+    paths = sorted(space)
+    return [{path: rng.choice(space[path]) for path in paths} for _ in range(samples)]
+
+
+def apply_overrides(config: GameConfig, overrides: Overrides) -> GameConfig:
+    """Copy of `config` with the dotted-path overrides applied.
+
+    The copy goes through GameConfig.from_dict, so the network input size
+    follows overridden visible rows and columns.
+    """
+    data = copy.deepcopy(config.to_dict())
+    for path, value in overrides.items():
+        section, _, field = path.partition(".")
+        if section not in data or field not in data[section]:
+            raise ValueError(f"Unknown config field: {path}")
+        data[section][field] = value
+    return GameConfig.from_dict(data)
+
+
+def run_seed(base_seed: int, run_index: int) -> int:
+    """Seed of one run, independent of which worker executes it"""
+    return base_seed + run_index
+
+
+def _init_worker() -> None:
+    # One torch thread per process, the pool supplies the parallelism
+    torch.set_num_threads(1)
+
+
+def _run_one(task: Dict[str, Any]) -> Dict[str, Any]:
+    config = apply_overrides(GameConfig.from_dict(task["config"]), task["overrides"])
+    # Checkpoint models come from the process-wide model registry, so a worker
+    # loads each one once and reuses it for later runs. Networks the
+    # checkpoint does not fit get fresh weights from the run seed instead,
+    # so rows do not depend on which runs a worker did before
+    runner = SimulationRunner(config, ameba_count=task["amebas"], seed=task["seed"])
+    report = runner.run(steps=task["steps"])
+    amebas = runner.game.play_desk._amebas
+    return {
+        "run_index": task["run_index"],
+        "seed": task["seed"],
+        **task["overrides"],
+        "steps": report.steps,
+        "foods_eaten": report.foods_eaten,
+        "foods_eaten_per_step": report.foods_eaten_per_step,
+        "final_ameba_energy": sum(ameba.get_energy() for ameba in amebas),
+        "elapsed_seconds": report.elapsed_seconds,
+        "steps_per_sec": report.steps_per_sec,
+    }
+
+
+class ParameterSweep:
+    """Fans simulation runs over a process pool, one run per override set"""
+
+    def __init__(
+        self,
+        config: GameConfig,
+        overrides: List[Overrides],
+        steps: int = 1000,
+        amebas: int = 1,
+        seed: int = 0,
+        workers: Optional[int] = None,
+    ):
+        self.config = config
+        self.overrides = overrides
+        self.steps = steps
+        self.amebas = amebas
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(
+        self, on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Run every override set and return one result row per run, in
+        run order. `on_result` is called with each row as it arrives."""
+        config_data = self.config.to_dict()
+        tasks = [
+            {
+                "run_index": index,
+                "seed": run_seed(self.seed, index),
+                "config": config_data,
+                "overrides": overrides,
+                "steps": self.steps,
+                "amebas": self.amebas,
+            }
+            for index, overrides in enumerate(self.overrides)
+        ]
+        logger.info("Running %s sweep runs on %s workers", len(tasks), self.workers)
+
+        rows = []
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker
+        ) as executor:
+            for row in executor.map(_run_one, tasks):
+                rows.append(row)
+                if on_result is not None:
+                    on_result(row)
+        return rows
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Result rows as one list per column"""
+    names: List[str] = []
+    for row in rows:
+        names.extend(name for name in row if name not in names)
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def write_columns(rows: List[Dict[str, Any]], path: str) -> None:
+    """Write result rows column by column, as .npz arrays or .json lists"""
+    columns = to_columns(rows)
+    if path.endswith(".json"):
+        with open(path, "w") as output:
+            json.dump(columns, output, indent=2)
+    else:
+        np.savez(path, **{name: np.asarray(values) for name, values in columns.items()})
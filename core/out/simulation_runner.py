@@ -0,0 +1,133 @@
+"""
+Headless simulation runner - fast-forwards a game without any UI and
+measures its throughput
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+
+PHASES = ("move", "cleanup", "generate_food")
+
+
+@dataclass
+class SimulationReport:
+    """Throughput of a headless simulation run"""
+
+    steps: int
+    ameba_moves: int
+    elapsed_seconds: float
+    rows: int
+    columns: int
+    amebas: int
+    engine: str
+    step_mode: str
+    seed: Optional[int] = None
+    foods_eaten: int = 0
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def steps_per_sec(self) -> float:
+        return self.steps / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def ameba_moves_per_sec(self) -> float:
+        return self.ameba_moves / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def foods_eaten_per_step(self) -> float:
+        return self.foods_eaten / self.steps if self.steps else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["steps_per_sec"] = self.steps_per_sec
+        data["ameba_moves_per_sec"] = self.ameba_moves_per_sec
+        data["foods_eaten_per_step"] = self.foods_eaten_per_step
+        return data
+
+    def format(self) -> str:
+        lines = [
+            f"Board {self.rows}x{self.columns}, {self.amebas} amebas, "
+            f"engine={self.engine}, step_mode={self.step_mode}, seed={self.seed}",
+            f"Steps:            {self.steps} in {self.elapsed_seconds:.3f}s",
+            f"Steps/sec:        {self.steps_per_sec:.1f}",
+            f"Ameba-moves/sec:  {self.ameba_moves_per_sec:.1f}",
+            f"Foods eaten/step: {self.foods_eaten_per_step:.2f}",
+            "Phase breakdown:",
+        ]
+        for phase, seconds in self.phase_seconds.items():
+            share = seconds / self.elapsed_seconds if self.elapsed_seconds else 0.0
+            lines.append(f"  {phase:<14}{seconds:10.3f}s {share:7.1%}")
+        return "\n".join(lines)
+
+
+class SimulationRunner:
+    """Runs a game for a number of steps or a wall-clock budget"""
+
+    def __init__(
+        self, config: GameConfig, ameba_count: int = 1, seed: Optional[int] = None
+    ):
+        self.config = config
+        self.ameba_count = ameba_count
+        self.seed = seed
+        self.game = Game(config, seed=seed)
+        self.game.initialize_play_desk(ameba_count)
+
+    def run(
+        self, steps: Optional[int] = None, time_budget: Optional[float] = None
+    ) -> SimulationReport:
+        """
+        Run until `steps` steps are done or `time_budget` seconds have passed,
+        whichever comes first
+
+        Args:
+            steps: Maximum number of steps, unlimited if None
+            time_budget: Wall-clock budget in seconds, unlimited if None
+
+        Returns:
+            SimulationReport with throughput and per-phase timings
+        """
+        if steps is None and time_budget is None:
+            raise ValueError("Either steps or time_budget must be given")
+
+        play_desk = self.game.play_desk
+        phase_seconds = dict.fromkeys(PHASES, 0.0)
+        completed_steps = 0
+        ameba_moves = 0
+        foods_eaten = 0
+        clock = time.perf_counter
+        started = clock()
+        while (steps is None or completed_steps < steps) and (
+            time_budget is None or clock() - started < time_budget
+        ):
+            phase_started = clock()
+            play_desk.move_amebas()
+            moved = clock()
+            foods_eaten += play_desk._cleanup_play_desk()
+            cleaned = clock()
+            play_desk.generate_food()
+            generated = clock()
+
+            phase_seconds["move"] += moved - phase_started
+            phase_seconds["cleanup"] += cleaned - moved
+            phase_seconds["generate_food"] += generated - cleaned
+            ameba_moves += len(play_desk._amebas)
+            completed_steps += 1
+        elapsed = clock() - started
+
+        return SimulationReport(
+            steps=completed_steps,
+            ameba_moves=ameba_moves,
+            elapsed_seconds=elapsed,
+            rows=self.config.play_desk.rows,
+            columns=self.config.play_desk.columns,
+            amebas=len(play_desk._amebas),
+            engine=self.config.play_desk.engine,
+            step_mode=self.config.play_desk.step_mode,
+            seed=self.seed,
+            foods_eaten=foods_eaten,
+            phase_seconds=phase_seconds,
+        )
@@ -0,0 +1,165 @@
+"""
+Delta encoding of simulation steps.
+
+Every `keyframe_interval` steps (and at step 0) a keyframe holds the full
+board, in between a delta holds only what changed:
+
+    keyframe: {"step_number", "keyframe": True, "total_energy",
+               "amebas": [[row, column, energy], ...],  # list index = ameba id
+               "foods": [[row, column, energy], ...]}
+    delta:    {"step_number", "keyframe": False, "total_energy",
+               "amebas": [[id, row, column, energy], ...],  # amebas that moved
+               "eaten": [[row, column], ...],
+               "spawned": [[row, column, energy], ...]}
+
+Any frame is rebuilt from the closest keyframe at or before it plus the
+deltas after that keyframe, see `rebuild_frame`. A consumer that skips frames
+folds them into the next one with `merge_steps`.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.play_desk import PlayDesk
+
+Frame = Dict[str, Any]
+
+
+class StepDeltaEncoder:
+    """Turns simulation steps into keyframes and deltas"""
+
+    def __init__(self, keyframe_interval: int = 10):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.keyframe_interval = keyframe_interval
+
+    def is_keyframe(self, step_number: int) -> bool:
+        return step_number % self.keyframe_interval == 0
+
+    def keyframe(self, step_number: int, play_desk: PlayDesk) -> Frame:
+        rows, columns = play_desk.get_ameba_positions()
+        amebas = [
+            list(ameba)
+            for ameba in zip(
+                rows.tolist(),
+                columns.tolist(),
+                play_desk.get_ameba_energies().tolist(),
+            )
+        ]
+        energy_grid = play_desk.get_energy_grid()
+        food_rows, food_columns = np.nonzero(energy_grid)
+        foods = [
+            list(food)
+            for food in zip(
+                food_rows.tolist(),
+                food_columns.tolist(),
+                energy_grid[food_rows, food_columns].tolist(),
+            )
+        ]
+        return {
+            "step_number": step_number,
+            "keyframe": True,
+            "total_energy": play_desk.get_total_energy(),
+            "amebas": amebas,
+            "foods": foods,
+        }
+
+    def delta(
+        self,
+        step_number: int,
+        play_desk: PlayDesk,
+        movements: Iterable[Any],
+        spawned: Sequence[Tuple[int, int, float]],
+    ) -> Frame:
+        energies = play_desk.get_ameba_energies().tolist()
+        amebas = []
+        eaten = []
+        for movement in movements:
+            ameba_id = movement.ameba_position[0]
+            row, column = movement.new_position
+            amebas.append([ameba_id, row, column, energies[ameba_id]])
+            if movement.food_consumed:
+                eaten.append(list(movement.food_consumed))
+        return {
+            "step_number": step_number,
+            "keyframe": False,
+            "total_energy": play_desk.get_total_energy(),
+            "amebas": amebas,
+            "eaten": eaten,
+            "spawned": [list(food) for food in spawned],
+        }
+
+
+def rebuild_frame(steps: Sequence[Frame], step_number: int) -> Frame:
+    """Rebuild the full board after `step_number` as a keyframe"""
+    end = next(
+        (i for i, step in enumerate(steps) if step["step_number"] == step_number),
+        None,
+    )
+    if end is None:
+        raise ValueError(f"Step {step_number} not found")
+    start = next(
+        (i for i in range(end, -1, -1) if steps[i]["keyframe"]),
+        None,
+    )
+    if start is None:
+        raise ValueError(f"No keyframe at or before step {step_number}")
+
+    keyframe = steps[start]
+    amebas: List[List[Any]] = [list(ameba) for ameba in keyframe["amebas"]]
+    foods: Dict[Tuple[int, int], float] = {
+        (row, column): energy for row, column, energy in keyframe["foods"]
+    }
+    for delta in steps[start + 1 : end + 1]:
+        for row, column in delta["eaten"]:
+            foods.pop((row, column), None)
+        for row, column, energy in delta["spawned"]:
+            foods[(row, column)] = energy
+        for ameba_id, row, column, energy in delta["amebas"]:
+            amebas[ameba_id] = [row, column, energy]
+
+    return {
+        "step_number": step_number,
+        "keyframe": True,
+        "total_energy": steps[end]["total_energy"],
+        "amebas": amebas,
+        "foods": [[row, column, energy] for (row, column), energy in foods.items()],
+    }
+
+
+def merge_steps(earlier: Frame, later: Frame) -> Frame:
+    """One frame equivalent to applying `earlier` and then `later`
+
+    A delta at or before the step of `earlier` is already contained in it and
+    is dropped. Keys other than the board entries are taken from the frame
+    the result is based on.
+    """
+    if later["keyframe"]:
+        return later
+    if later["step_number"] <= earlier["step_number"]:
+        return earlier
+    if earlier["keyframe"]:
+        return {**earlier, **rebuild_frame([earlier, later], later["step_number"])}
+
+    amebas = {ameba[0]: ameba for ameba in earlier["amebas"]}
+    amebas.update((ameba[0], ameba) for ameba in later["amebas"])
+    # Last change of every cell, None when the food on it was eaten
+    foods: Dict[Tuple[int, int], Optional[float]] = {}
+    for delta in (earlier, later):
+        for row, column in delta["eaten"]:
+            foods[(row, column)] = None
+        for row, column, energy in delta["spawned"]:
+            foods[(row, column)] = energy
+    return {
+        **later,
+        "amebas": list(amebas.values()),
+        "eaten": [
+            [row, column] for (row, column), energy in foods.items() if energy is None
+        ],
+        "spawned": [
+            [row, column, energy]
+            for (row, column), energy in foods.items()
+            if energy is not None
+        ],
+    }
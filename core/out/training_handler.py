@@ -5,12 +5,18 @@ Training handler for API requests - interfaces with core neural network function
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
 from core.neural_network.models.base import BaseNeuralNetwork
+from core.neural_network.shared.training_progress import TrainingProgress
 from core.config_classes.game_config import GameConfig
+from core.shared.random_streams import RandomStreams
+
+
+class TrainingCancelledError(Exception):
+    """Raised from a progress callback to stop training early"""
 
 
 @dataclass
@@ -57,7 +63,12 @@ class TrainingHandler:
             raise Exception(f"Failed to load configuration: {str(e)}")
 
     def train_neural_network(
-        self, steps: int = 1000, batch_size: int = 32, mode: bool = True
+        self,
+        steps: int = 1000,
+        batch_size: int = 32,
+        mode: bool = True,
+        progress_callback: Optional[Callable[[TrainingProgress], None]] = None,
+        seed: Optional[int] = None,
     ) -> TrainingResult:
         """
         Train the neural network with specified parameters
@@ -66,6 +77,9 @@ class TrainingHandler:
             steps: Number of training steps
             batch_size: Batch size for training
             mode: Training mode
+            progress_callback: Optional callback invoked after every epoch;
+                raising from it aborts training
+            seed: Seed of the training data stream, random if None
 
         Returns:
             TrainingResult with operation details
@@ -78,14 +92,16 @@ class TrainingHandler:
             neural_network = BaseNeuralNetwork(game_config.neural_network)
 
             # Train the neural network
-            neural_network.train(steps=steps, batch_size=batch_size, mode=mode)
+            neural_network.train(
+                steps=steps,
+                batch_size=batch_size,
+                mode=mode,
+                progress_callback=progress_callback,
+                seed=RandomStreams(seed).training_data_seed,
+            )
 
             # Save the trained model state
-            self.model_save_path.parent.mkdir(parents=True, exist_ok=True)
-
-            import torch
-
-            torch.save(neural_network._nn.state_dict(), self.model_save_path)
+            neural_network.save_checkpoint(str(self.model_save_path))
 
             return TrainingResult(
                 success=True,
@@ -94,6 +110,12 @@ class TrainingHandler:
                 model_path=str(self.model_save_path),
             )
 
+        except TrainingCancelledError:
+            return TrainingResult(
+                success=False,
+                message="Training cancelled",
+                steps_completed=0,
+            )
         except Exception as e:
             return TrainingResult(
                 success=False,
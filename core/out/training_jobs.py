@@ -0,0 +1,238 @@
+"""
+Background training jobs - runs TrainingHandler in a process pool so the API
+event loop never blocks on a training run
+"""
+
+import enum
+import multiprocessing
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.neural_network.shared.training_progress import TrainingProgress
+from core.out.training_handler import (
+    TrainingCancelledError,
+    TrainingHandler,
+    TrainingResult,
+)
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class TrainingJob:
+    """State and latest progress of a submitted training job"""
+
+    job_id: str
+    steps: int
+    batch_size: int
+    mode: bool
+    submitted_at: str
+    seed: Optional[int] = None
+    status: JobStatus = JobStatus.QUEUED
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    epoch: int = 0
+    total_epochs: int = 0
+    loss: Optional[float] = None
+    samples_per_sec: Optional[float] = None
+    message: str = "Training job queued"
+    error_details: Optional[str] = None
+    model_path: Optional[str] = None
+
+
+def _run_training_job(
+    project_root: str,
+    steps: int,
+    batch_size: int,
+    mode: bool,
+    seed: Optional[int],
+    progress: Any,
+    cancel_event: Any,
+) -> TrainingResult:
+    """Process pool entry point, reports progress through a managed dict"""
+    if cancel_event.is_set():
+        return TrainingResult(
+            success=False, message="Training cancelled", steps_completed=0
+        )
+    progress.update(
+        {"status": JobStatus.RUNNING, "started_at": datetime.now().isoformat()}
+    )
+
+    def report_progress(training_progress: TrainingProgress) -> None:
+        progress.update(
+            {
+                "epoch": training_progress.epoch,
+                "total_epochs": training_progress.total_epochs,
+                "loss": training_progress.loss,
+                "samples_per_sec": training_progress.samples_per_sec,
+            }
+        )
+        if cancel_event.is_set():
+            raise TrainingCancelledError()
+
+    return TrainingHandler(Path(project_root)).train_neural_network(
+        steps=steps,
+        batch_size=batch_size,
+        mode=mode,
+        progress_callback=report_progress,
+        seed=seed,
+    )
+
+
+class TrainingJobManager:
+    """Queues training jobs on a process pool and tracks their progress"""
+
+    def __init__(self, project_root: Path, max_workers: int = 1):
+        self.project_root = project_root
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._sync_manager: Any = None
+        self._jobs: Dict[str, TrainingJob] = {}
+        self._futures: Dict[str, Future] = {}
+        self._progress: Dict[str, Any] = {}
+        self._cancel_events: Dict[str, Any] = {}
+        # Re-entrant: Future.cancel() runs done callbacks in the calling thread
+        self._lock = threading.RLock()
+
+    def submit(
+        self,
+        steps: int = 1000,
+        batch_size: int = 32,
+        mode: bool = True,
+        seed: Optional[int] = None,
+    ) -> TrainingJob:
+        """Queue a training job and return immediately"""
+        with self._lock:
+            self._ensure_started()
+            job = TrainingJob(
+                job_id=uuid.uuid4().hex,
+                steps=steps,
+                batch_size=batch_size,
+                mode=mode,
+                submitted_at=datetime.now().isoformat(),
+                seed=seed,
+            )
+            progress = self._sync_manager.dict()
+            cancel_event = self._sync_manager.Event()
+            future = self._executor.submit(
+                _run_training_job,
+                str(self.project_root),
+                steps,
+                batch_size,
+                mode,
+                seed,
+                progress,
+                cancel_event,
+            )
+            self._jobs[job.job_id] = job
+            self._futures[job.job_id] = future
+            self._progress[job.job_id] = progress
+            self._cancel_events[job.job_id] = cancel_event
+            submitted = replace(job)
+        future.add_done_callback(
+            lambda done, job_id=job.job_id: self._finish(job_id, done)
+        )
+        return submitted
+
+    def get_job(self, job_id: str) -> Optional[TrainingJob]:
+        """Get a snapshot of a job including its latest progress"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._refresh(job)
+            return replace(job)
+
+    def list_jobs(self) -> List[TrainingJob]:
+        with self._lock:
+            for job in self._jobs.values():
+                self._refresh(job)
+            return [replace(job) for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> Optional[TrainingJob]:
+        """Cancel a queued job or ask a running one to stop after its epoch"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status not in FINISHED_STATUSES:
+                if not self._futures[job_id].cancel():
+                    self._cancel_events[job_id].set()
+                    job.message = "Cancellation requested"
+            self._refresh(job)
+            return replace(job)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for cancel_event in self._cancel_events.values():
+                cancel_event.set()
+            executor, self._executor = self._executor, None
+            sync_manager, self._sync_manager = self._sync_manager, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if sync_manager is not None:
+            sync_manager.shutdown()
+
+    def _ensure_started(self) -> None:
+        if self._executor is None:
+            # spawn: forking a process that already runs torch threads is unsafe
+            context = multiprocessing.get_context("spawn")
+            self._sync_manager = context.Manager()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=context
+            )
+
+    def _refresh(self, job: TrainingJob) -> None:
+        progress = self._progress.get(job.job_id)
+        if progress is None or job.status in FINISHED_STATUSES:
+            return
+        try:
+            for key, value in dict(progress).items():
+                setattr(job, key, value)
+        except (EOFError, OSError):
+            # Sync manager already shut down
+            pass
+        if job.status == JobStatus.RUNNING and job.epoch:
+            job.message = f"Training epoch {job.epoch}/{job.total_epochs}"
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            self._refresh(job)
+            cancel_event = self._cancel_events.pop(job_id, None)
+            self._progress.pop(job_id, None)
+            if future.cancelled():
+                job.status = JobStatus.CANCELLED
+                job.message = "Training cancelled"
+            else:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    job.status = JobStatus.FAILED
+                    job.message = "Training failed"
+                    job.error_details = str(e)
+                else:
+                    if result.success:
+                        job.status = JobStatus.COMPLETED
+                    elif cancel_event is not None and cancel_event.is_set():
+                        job.status = JobStatus.CANCELLED
+                    else:
+                        job.status = JobStatus.FAILED
+                    job.message = result.message
+                    job.error_details = result.error_details
+                    job.model_path = result.model_path
+            job.finished_at = datetime.now().isoformat()
@@ -1,64 +1,397 @@
+import enum
+import math
 import random
+from typing import Hashable, Optional, Sequence
 
-from core.calculations.get_entity_by_position import find_entity_by_position
-from core.shared.visible_area import CalculateVisibleAreaService
+import numpy as np
+from torch.types import Number
+
+from core.shared.free_cell_set import FreeCellSet
+from core.shared.log import get_logger
+from core.shared.position_index import PositionIndex
+from core.shared.step_metrics import get_step_metrics
+from core.shared.visible_area import (
+    CalculateVisibleAreaService,
+    VisibleEntities,
+    VisibleEnergyWindow,
+)
 
 from core.food import Food
 from core.config_classes.play_desk_config import PlayDeskConfig
 from core.ameba import Ameba
 from core.shared.position import Position
 
+logger = get_logger("play_desk")
+
+# Moves only reach adjacent cells, a 3x3 window is all apply_prediction reads
+_NEIGHBOURHOOD = np.zeros((3, 3), dtype=np.float32)
+
+
+class StepMode(str, enum.Enum):
+    SEQUENTIAL = "sequential"
+    BATCHED = "batched"
+    CONVOLUTION = "convolution"
+
 
 class PlayDesk:
     def __init__(
         self,
         config: PlayDeskConfig,
         calculate_visible_area_service: CalculateVisibleAreaService,
+        rng: Optional[random.Random] = None,
     ):
         self._config = config
+        self._rng = rng
         self._amebas = list[Ameba]()
-        self._foods = list[Food]()
+        self._free_cells = FreeCellSet(config.rows, config.columns)
+        self._food_energy_total = 0.0
+        self._ameba_energy_total = 0.0
+        self._energy_audit_countdown = config.energy_audit_every
+        self._spawned_foods: Optional[list[tuple[int, int, float]]] = None
         self._calculate_visible_area_service = calculate_visible_area_service
+        self._init_storage()
+
+    def _init_storage(self) -> None:
+        """Create the engine specific food and ameba storage and indexes."""
+        self._food_energy = np.zeros(
+            (self._config.rows, self._config.columns), dtype=np.float32
+        )
+        self._foods = list[Food]()
+        self._food_slots = dict[Food, int]()
+        self._eaten_foods = list[Food]()
+        self._ameba_index = PositionIndex()
+        self._food_index = PositionIndex()
+
+    def add_ameba(self, ameba: Ameba) -> None:
+        self._amebas.append(ameba)
+        self._ameba_index.add(ameba)
+        self._free_cells.discard(ameba.get_position())
+        self._ameba_energy_total += ameba.get_energy()
+
+    def add_food(self, food: Food) -> None:
+        self._food_slots[food] = len(self._foods)
+        self._foods.append(food)
+        self._food_index.add(food)
+        position = food.get_position()
+        self._food_energy[position.row, position.column] = food.get_energy()
+        self._free_cells.discard(position)
+        self._food_energy_total += food.get_energy()
+        self._record_spawned_food(food.get_position(), food.get_energy())
+
+    def record_spawned_food(self, enabled: bool = True) -> None:
+        """Start or stop recording where food is placed, see take_spawned_food."""
+        self._spawned_foods = [] if enabled else None
+
+    def take_spawned_food(self) -> list[tuple[int, int, float]]:
+        """(row, column, energy) of food placed since the last call."""
+        spawned = self._spawned_foods or []
+        if self._spawned_foods is not None:
+            self._spawned_foods = []
+        return spawned
+
+    def get_total_energy(self) -> float:
+        return self._food_energy_total + self._ameba_energy_total
+
+    def adjust_ameba_energy(self, ameba: Ameba, energy_change: float) -> None:
+        """Change an ameba's energy and keep the desk energy total in sync."""
+        ameba._energy += energy_change
+        self._ameba_energy_total += energy_change
 
     def generate_food(self):
         used_energy = self._calculate_used_energy()
         available_energy = self._config.total_energy - used_energy
-        added_energy = 0
-        while added_energy < available_energy:
-            energy = self._config.energy_per_food
-            position = self.get_random_empty_position()
-            food = Food(energy=energy, position=position)
-            self._foods.append(food)
-            added_energy += food.get_energy()
-
-    def get_random_empty_position(self) -> Position:
-        while True:
-            row = random.randint(0, self._config.rows - 1)
-            column = random.randint(0, self._config.columns - 1)
-            position = Position(row, column)
-            if find_entity_by_position(position, self._amebas) is not None:
-                continue
-            if find_entity_by_position(position, self._foods) is not None:
-                continue
-            break
-        return position
-
-    def do_move_amebas(self) -> None:
-        for ameba in self._amebas:
-            move_position = ameba.move(
-                self._calculate_visible_area_service.fetch_visible_entities(
-                    ameba.get_position(), self._foods
+        if available_energy <= 0:
+            return
+        energy = self._config.energy_per_food
+        count = math.ceil(available_energy / energy)
+        if count > len(self._free_cells):
+            logger.warning(
+                "Play desk saturated: %d foods needed, only %d empty cells",
+                count,
+                len(self._free_cells),
+            )
+            count = len(self._free_cells)
+        for position in self.get_random_empty_positions(count):
+            self._place_food(position, energy)
+
+    def get_food_count(self) -> int:
+        """Number of food items on the desk that have not been eaten."""
+        return len(self._foods) - len(self._eaten_foods)
+
+    def is_position_empty(self, position: Position) -> bool:
+        return not (
+            self._ameba_index.is_occupied(position)
+            or self._food_index.is_occupied(position)
+        )
+
+    def get_random_empty_position(
+        self, rng: Optional[random.Random] = None
+    ) -> Position:
+        """Raises BoardSaturatedError when no empty cell is left."""
+        return self._free_cells.sample(rng or self._rng)
+
+    def get_random_empty_positions(
+        self, count: int, rng: Optional[random.Random] = None
+    ) -> list[Position]:
+        """Sample `count` distinct empty cells, with the desk's food spawn
+        generator unless `rng` is given.
+
+        Raises BoardSaturatedError when fewer than `count` cells are empty.
+        """
+        return self._free_cells.sample_many(count, rng or self._rng)
+
+    def get_empty_cell_count(self) -> int:
+        return len(self._free_cells)
+
+    def get_energy_grid(self) -> np.ndarray:
+        """The live food energy grid, kept in step with every food change."""
+        return self._food_energy
+
+    def load_energy_grid(self, energy_grid: np.ndarray) -> None:
+        """Place food on every non-zero cell of `energy_grid`, on a desk
+        that has no food yet."""
+        rows, columns = np.nonzero(energy_grid)
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            self.add_food(Food(float(energy_grid[row, column]), Position(row, column)))
+
+    def get_ameba_positions(self) -> tuple[np.ndarray, np.ndarray]:
+        rows = np.fromiter(
+            (ameba.get_position().row for ameba in self._amebas),
+            dtype=np.intp,
+            count=len(self._amebas),
+        )
+        columns = np.fromiter(
+            (ameba.get_position().column for ameba in self._amebas),
+            dtype=np.intp,
+            count=len(self._amebas),
+        )
+        return rows, columns
+
+    def get_ameba_energies(self) -> np.ndarray:
+        return np.fromiter(
+            (ameba.get_energy() for ameba in self._amebas),
+            dtype=np.float64,
+            count=len(self._amebas),
+        )
+
+    def fetch_visible_energy(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        return self._calculate_visible_area_service.fetch_visible_energy_batch(
+            rows, columns, self._food_energy
+        )
+
+    def fetch_visible_windows(self) -> list[VisibleEnergyWindow]:
+        rows, columns = self.get_ameba_positions()
+        return self._wrap_visible_windows(
+            self.fetch_visible_energy(rows, columns), rows, columns
+        )
+
+    def predict_moves(
+        self,
+        energy_grid: np.ndarray,
+        visible_energy: Optional[np.ndarray],
+        rows: np.ndarray,
+        columns: np.ndarray,
+    ) -> list[int]:
+        """Run one forward pass per distinct model for all amebas using it and
+        scatter the predictions back in ameba order.
+
+        In convolution step mode the first layer is evaluated over the whole
+        energy grid instead of over gathered windows, `visible_energy` is not
+        read and may be None.
+        """
+        groups: dict[Hashable, list[int]] = {}
+        for i, ameba in enumerate(self._amebas):
+            groups.setdefault(ameba.get_neural_network().batch_key(), []).append(i)
+        predictions = np.zeros(len(self._amebas), dtype=np.int64)
+        for indexes in groups.values():
+            neural_network = self._amebas[indexes[0]].get_neural_network()
+            if self._config.step_mode == StepMode.CONVOLUTION:
+                group_predictions = neural_network.predict_board(
+                    energy_grid,
+                    rows[indexes],
+                    columns[indexes],
+                    self._calculate_visible_area_service.window_shape,
+                )
+            else:
+                group_predictions = neural_network.predict_batch(
+                    visible_energy[indexes]
                 )
+            predictions[indexes] = group_predictions.cpu().numpy()
+        return predictions.tolist()
+
+    def move_ameba(
+        self,
+        ameba: Ameba,
+        visible_area: Optional[VisibleEntities] = None,
+        prediction: Optional[Number] = None,
+    ) -> int:
+        """Move `ameba` by `prediction`, or by its network's prediction when
+        None, and return the prediction used."""
+        old_position = ameba.get_position()
+        old_energy = ameba.get_energy()
+        if visible_area is None:
+            visible_area = self._calculate_visible_area_service.fetch_visible_entities(
+                old_position, self._food_index
             )
-            ameba._position += move_position
-            ameba._position.adjust_position(self._config.rows, self._config.columns)
+        if prediction is None:
+            prediction = ameba.get_neural_network().predict(visible_area)
+        move_position = ameba.apply_prediction(prediction, visible_area)
+        new_position = old_position + move_position
+        new_position.adjust_position(self._config.rows, self._config.columns)
+        ameba._position = new_position
+        self._ameba_index.move(ameba, old_position)
+        self._remove_eaten_food(new_position)
+        self._update_free_cell(old_position)
+        self._free_cells.discard(new_position)
+        self._ameba_energy_total += ameba.get_energy() - old_energy
+        return int(prediction)
+
+    def apply_actions(self, actions: Sequence[int]) -> None:
+        """Move every ameba by a recorded prediction, without gathering
+        visible windows or running any network."""
+        for ameba, prediction in zip(self._amebas, actions):
+            self.move_ameba(ameba, self._neighbourhood_window(ameba), int(prediction))
+
+    def do_move_amebas(self) -> list[int]:
+        """One full step, returns the prediction of every ameba."""
+        metrics = get_step_metrics()
+        step_started = metrics.start()
+        actions = self.move_amebas()
+        mark = metrics.start()
         self._cleanup_play_desk()
+        mark = metrics.stop("cleanup", mark)
         self.generate_food()
+        metrics.stop("generate_food", mark)
+        metrics.stop("step", step_started)
+        return actions
+
+    def move_amebas(self) -> list[int]:
+        """Move every ameba once, without the cleanup and food top-up.
+
+        Returns the prediction each ameba moved by, in ameba order.
+        """
+        metrics = get_step_metrics()
+        mark = metrics.start()
+        rows, columns = self.get_ameba_positions()
+        energy_grid = self.get_energy_grid()
+        visible_energy: Optional[np.ndarray]
+        visible_areas: list[VisibleEnergyWindow]
+        if self._config.step_mode == StepMode.CONVOLUTION:
+            # The network reads the grid itself, moves only need the 3x3
+            # neighbourhood
+            visible_energy = None
+            visible_areas = [
+                self._neighbourhood_window(ameba) for ameba in self._amebas
+            ]
+        else:
+            visible_energy = self.fetch_visible_energy(rows, columns)
+            visible_areas = self._wrap_visible_windows(visible_energy, rows, columns)
+        mark = metrics.stop("fetch_windows", mark)
+        predictions: list[Optional[int]]
+        if self._config.step_mode == StepMode.SEQUENTIAL:
+            # Predictions run per ameba inside the "move" phase
+            predictions = [None] * len(self._amebas)
+        else:
+            predictions = list(
+                self.predict_moves(energy_grid, visible_energy, rows, columns)
+            )
+            mark = metrics.stop("predict", mark)
+        actions = [
+            self.move_ameba(ameba, visible_area, prediction)
+            for ameba, visible_area, prediction in zip(
+                self._amebas, visible_areas, predictions
+            )
+        ]
+        metrics.stop("move", mark)
+        return actions
+
+    def _neighbourhood_window(self, ameba: Ameba) -> VisibleEnergyWindow:
+        return VisibleEnergyWindow(
+            _NEIGHBOURHOOD,
+            ameba.get_position(),
+            self._food_index,
+            self._config.rows,
+            self._config.columns,
+        )
+
+    def _wrap_visible_windows(
+        self, visible_energy: np.ndarray, rows: np.ndarray, columns: np.ndarray
+    ) -> list[VisibleEnergyWindow]:
+        return [
+            VisibleEnergyWindow(
+                energy_window,
+                Position(int(row), int(column)),
+                self._food_index,
+                self._config.rows,
+                self._config.columns,
+            )
+            for energy_window, row, column in zip(visible_energy, rows, columns)
+        ]
+
+    def _place_food(self, position: Position, energy: float) -> None:
+        self.add_food(Food(energy=energy, position=position))
+
+    def _remove_eaten_food(self, position: Position) -> None:
+        food = self._food_index.get(position)
+        if food is not None and food.is_deleted():
+            self._food_index.remove(food, position)
+            self._food_energy[position.row, position.column] = 0
+            self._update_free_cell(position)
+            self._eaten_foods.append(food)
+
+    def _record_spawned_food(self, position: Position, energy: float) -> None:
+        if self._spawned_foods is not None:
+            self._spawned_foods.append((position.row, position.column, energy))
+
+    def _update_free_cell(self, position: Position) -> None:
+        if self.is_position_empty(position):
+            self._free_cells.add(position)
+        else:
+            self._free_cells.discard(position)
 
     def _calculate_used_energy(self) -> float:
-        food_energy = sum(food.get_energy() for food in self._foods)
+        if self._config.energy_audit_every > 0:
+            self._energy_audit_countdown -= 1
+            if self._energy_audit_countdown <= 0:
+                self._energy_audit_countdown = self._config.energy_audit_every
+                self._audit_energy_totals()
+        return self._food_energy_total + self._ameba_energy_total
+
+    def _audit_energy_totals(self) -> None:
+        food_energy, ameba_energy = self._recount_energy()
+        if not (
+            math.isclose(self._food_energy_total, food_energy, rel_tol=1e-5)
+            and math.isclose(self._ameba_energy_total, ameba_energy, rel_tol=1e-5)
+        ):
+            logger.error(
+                "Energy totals drifted: food %.3f (recount %.3f), "
+                "amebas %.3f (recount %.3f)",
+                self._food_energy_total,
+                food_energy,
+                self._ameba_energy_total,
+                ameba_energy,
+            )
+        self._food_energy_total = food_energy
+        self._ameba_energy_total = ameba_energy
+
+    def _recount_energy(self) -> tuple[float, float]:
+        food_energy = sum(
+            food.get_energy() for food in self._foods if not food.is_deleted()
+        )
         ameba_energy = sum(ameba._energy for ameba in self._amebas)
-        return food_energy + ameba_energy
+        return food_energy, ameba_energy
+
+    def _cleanup_play_desk(self) -> int:
+        """Swap-remove the food eaten since the last cleanup.
 
-    def _cleanup_play_desk(self):
-        self._foods = [food for food in self._foods if not food.is_deleted()]
+        Returns the number of food items removed.
+        """
+        eaten_foods, self._eaten_foods = self._eaten_foods, list[Food]()
+        for food in eaten_foods:
+            slot = self._food_slots.pop(food)
+            last_food = self._foods.pop()
+            if last_food is not food:
+                self._foods[slot] = last_food
+                self._food_slots[last_food] = slot
+            self._food_energy_total -= food.get_energy()
+        return len(eaten_foods)
@@ -0,0 +1,17 @@
+import enum
+
+from core.play_desk import PlayDesk
+from core.numpy_play_desk import NumpyPlayDesk
+
+
+class PlayDeskEngine(str, enum.Enum):
+    OBJECT = "object"
+    NUMPY = "numpy"
+
+
+def get_play_desk(engine: str) -> type[PlayDesk]:
+    if engine == PlayDeskEngine.OBJECT:
+        return PlayDesk
+    if engine == PlayDeskEngine.NUMPY:
+        return NumpyPlayDesk
+    raise ValueError(f"Unknown play desk engine: {engine}")
@@ -0,0 +1,212 @@
+"""
+Replay logs - the predictions of every ameba at every step, for playback
+without the network.
+
+File layout, little endian:
+
+    magic "AMEBARPL" | u32 version | u32 header length | JSON header
+    | padding to 64 bytes | one uint8 prediction per ameba per step
+
+The header holds the game seed, the config and its hash, and the ameba
+count. Steps are only ever appended, so a log can be read (and memory-mapped)
+while it is still being written. Every `keyframe_interval` steps the recorder
+also writes a game snapshot to `<log>.keyframes/`, which lets the replay
+engine seek without replaying from the start.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+from dataclasses import replace
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.game_snapshot import GameState, load_game_state
+
+REPLAY_MAGIC = b"AMEBARPL"
+REPLAY_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sII")
+
+
+class ReplayLogError(ValueError):
+    """Raised for unreadable replay logs and actions that do not fit them"""
+
+
+def config_hash(config: GameConfig) -> str:
+    """SHA-256 of the config, independent of key order"""
+    return hashlib.sha256(
+        json.dumps(config.to_dict(), sort_keys=True).encode()
+    ).hexdigest()
+
+
+def keyframe_path(path: str, step: int) -> str:
+    return os.path.join(f"{path}.keyframes", f"{step:012d}.snapshot")
+
+
+class ReplayRecorder:
+    """Steps a game and appends every step's predictions to a replay log.
+
+    Recording starts from the game's current state, which is saved as the
+    step 0 keyframe.
+    """
+
+    def __init__(self, game: Game, path: str, keyframe_interval: int = 100):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.game = game
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.step_count = 0
+        self._ameba_count = len(game.play_desk._amebas)
+
+        header = json.dumps(
+            {
+                "seed": game.random_streams.seed,
+                "config_hash": config_hash(game.config),
+                "config": game.config.to_dict(),
+                "ameba_count": self._ameba_count,
+                "keyframe_interval": keyframe_interval,
+            }
+        ).encode()
+        data_start = -(-(_PREFIX.size + len(header)) // ALIGNMENT) * ALIGNMENT
+        # Keyframes of a log previously recorded at `path` would not match
+        keyframes = f"{path}.keyframes"
+        shutil.rmtree(keyframes, ignore_errors=True)
+        os.makedirs(keyframes)
+        self._file = open(path, "wb")
+        self._file.write(_PREFIX.pack(REPLAY_MAGIC, REPLAY_VERSION, len(header)))
+        self._file.write(header)
+        self._file.write(b"\0" * (data_start - _PREFIX.size - len(header)))
+        self._file.flush()
+        game.save_snapshot(keyframe_path(path, 0))
+
+    def step(self) -> None:
+        self.append(self.game.do_one_step())
+
+    def run(self, iterations: int) -> None:
+        for _ in range(iterations):
+            self.step()
+
+    def append(self, actions) -> None:
+        """Append the predictions of one step that already ran on the game"""
+        actions = np.asarray(actions, dtype=np.uint8)
+        if actions.shape != (self._ameba_count,):
+            raise ReplayLogError(
+                f"Expected {self._ameba_count} actions, got {actions.shape}"
+            )
+        actions.tofile(self._file)
+        self.step_count += 1
+        if self.step_count % self.keyframe_interval == 0:
+            self._file.flush()
+            self.game.save_snapshot(keyframe_path(self.path, self.step_count))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ReplayRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReplayLog:
+    """Read side of a replay log"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as log_file:
+            prefix = log_file.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ReplayLogError(f"{path} is too short to be a replay log")
+            magic, version, header_length = _PREFIX.unpack(prefix)
+            if magic != REPLAY_MAGIC:
+                raise ReplayLogError(f"{path} is not a replay log")
+            if version != REPLAY_VERSION:
+                raise ReplayLogError(f"Unsupported replay log version {version}")
+            header = json.loads(log_file.read(header_length))
+        self._data_start = -(-(_PREFIX.size + header_length) // ALIGNMENT) * ALIGNMENT
+        self.seed: int = header["seed"]
+        self.config_hash: str = header["config_hash"]
+        self.config = GameConfig.from_dict(header["config"])
+        self.ameba_count: int = header["ameba_count"]
+        self.keyframe_interval: int = header["keyframe_interval"]
+        if config_hash(self.config) != self.config_hash:
+            raise ReplayLogError(f"Config of {path} does not match its hash")
+
+    @property
+    def step_count(self) -> int:
+        """Completed steps, growing while a recorder appends"""
+        data_size = os.path.getsize(self.path) - self._data_start
+        return data_size // self.ameba_count if self.ameba_count else 0
+
+    def actions(self) -> np.ndarray:
+        """(steps, amebas) uint8 predictions, memory-mapped read-only"""
+        steps = self.step_count
+        if not steps:
+            return np.zeros((0, self.ameba_count), dtype=np.uint8)
+        return np.memmap(
+            self.path,
+            dtype=np.uint8,
+            mode="r",
+            offset=self._data_start,
+            shape=(steps, self.ameba_count),
+        )
+
+    def keyframe_steps(self) -> list[int]:
+        directory = f"{self.path}.keyframes"
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            int(name.split(".")[0])
+            for name in os.listdir(directory)
+            if name.endswith(".snapshot")
+        )
+
+
+class ReplayEngine:
+    """Rebuilds any step of a replay log by applying the recorded
+    predictions to the closest keyframe, without running the network.
+
+    Keyframes come from the log's snapshot files; states passed while
+    replaying are kept in memory every `keyframe_interval` steps.
+    """
+
+    def __init__(self, log: ReplayLog, keyframe_interval: Optional[int] = None):
+        self.log = log
+        self.keyframe_interval = keyframe_interval or log.keyframe_interval
+        self._keyframes: Dict[int, Optional[GameState]] = dict.fromkeys(
+            log.keyframe_steps()
+        )
+        if 0 not in self._keyframes:
+            raise ReplayLogError(f"{log.path} has no step 0 keyframe")
+
+    def seek(self, step: int) -> Game:
+        """The game after `step` recorded steps (0 is the recording start)"""
+        actions = self.log.actions()
+        if not 0 <= step <= len(actions):
+            raise ValueError(f"Step {step} outside the log (0..{len(actions)})")
+
+        start = max(keyframe for keyframe in self._keyframes if keyframe <= step)
+        game = self._restore(start)
+        for current in range(start, step):
+            game.apply_step(actions[current])
+            if (current + 1) % self.keyframe_interval == 0:
+                self._keyframes.setdefault(current + 1, game.capture_state())
+        return game
+
+    def _restore(self, step: int) -> Game:
+        state = self._keyframes[step]
+        if state is None:
+            state = load_game_state(keyframe_path(self.log.path, step))
+        else:
+            # The numpy desk adopts the grid, keep the cached one untouched
+            state = replace(state, energy_grid=state.energy_grid.copy())
+        # Replay never calls the network, amebas go without one
+        return Game.from_state(state, [None] * len(state.ameba_energy))
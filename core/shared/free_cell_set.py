@@ -0,0 +1,92 @@
+import random
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from core.shared.position import Position
+
+
+class BoardSaturatedError(RuntimeError):
+    """Raised when more empty cells are requested than the desk has left."""
+
+
+class FreeCellSet:
+    """Set of empty desk cells with O(1) add, discard and random sampling.
+
+    Cells are stored as flat indexes in the first `_size` slots of an int32
+    array, an int32 cell -> slot array (-1 when the cell is taken) lets a
+    cell be removed by swapping the last element into its slot.
+    """
+
+    def __init__(self, rows: int, columns: int):
+        self._columns = columns
+        self._cells = np.arange(rows * columns, dtype=np.int32)
+        self._slots = np.arange(rows * columns, dtype=np.int32)
+        self._size = rows * columns
+
+    def add(self, position: Position) -> None:
+        cell = self._cell(position)
+        if self._slots[cell] >= 0:
+            return
+        self._slots[cell] = self._size
+        self._cells[self._size] = cell
+        self._size += 1
+
+    def discard(self, position: Position) -> None:
+        cell = self._cell(position)
+        slot = self._slots[cell]
+        if slot < 0:
+            return
+        self._size -= 1
+        last_cell = self._cells[self._size]
+        if last_cell != cell:
+            self._cells[slot] = last_cell
+            self._slots[last_cell] = slot
+        self._slots[cell] = -1
+
+    def sample(self, rng: Optional[random.Random] = None) -> Position:
+        if not self._size:
+            raise BoardSaturatedError("No empty cells left on the play desk")
+        rng = rng or random
+        return self._position(int(self._cells[rng.randrange(self._size)]))
+
+    def sample_many(
+        self, count: int, rng: Optional[random.Random] = None
+    ) -> list[Position]:
+        """Sample `count` distinct empty cells without removing them."""
+        if count > self._size:
+            raise BoardSaturatedError(
+                f"Requested {count} empty cells, only {self._size} left"
+            )
+        rng = rng or random
+        slots = rng.sample(range(self._size), count)
+        rows, columns = np.divmod(self._cells[slots], self._columns)
+        return [
+            Position(row, column)
+            for row, column in zip(rows.tolist(), columns.tolist())
+        ]
+
+    def get_cells(self) -> np.ndarray:
+        """Flat indexes of the empty cells, in sampling order."""
+        return self._cells[: self._size].copy()
+
+    def load_cells(self, cells: Union[np.ndarray, Sequence[int]]) -> None:
+        """Replace the content with `cells`, keeping their order so that
+        sampling continues exactly as in the set they came from."""
+        cells = np.asarray(cells, dtype=np.int32)
+        self._size = len(cells)
+        self._cells[: self._size] = cells
+        self._slots.fill(-1)
+        self._slots[cells] = np.arange(self._size, dtype=np.int32)
+
+    def __contains__(self, position: Position) -> bool:
+        return bool(self._slots[self._cell(position)] >= 0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _cell(self, position: Position) -> int:
+        return position.row * self._columns + position.column
+
+    def _position(self, cell: int) -> Position:
+        return Position(*divmod(cell, self._columns))
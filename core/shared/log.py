@@ -0,0 +1,60 @@
+"""
+Logging helpers for the simulation core.
+
+Hot-path call sites guard their records with `logger.isEnabledFor(...)` and
+use lazy %-style arguments, so a disabled level costs one cached check.
+Per-move debug records can additionally be sampled to 1 in N moves.
+"""
+
+import logging
+import os
+from typing import Optional, Union
+
+ROOT_LOGGER_NAME = "ameba"
+
+_sample_every = 1
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def configure_logging(
+    level: Optional[Union[int, str]] = None, sample_every: Optional[int] = None
+) -> None:
+    """Configure the core loggers.
+
+    Args:
+        level: Log level, defaults to AMEBA_LOG_LEVEL or WARNING
+        sample_every: Record 1 in N per-move debug records, defaults to
+            AMEBA_LOG_SAMPLE_EVERY or 1 (every move)
+    """
+    global _sample_every
+    if level is None:
+        level = os.environ.get("AMEBA_LOG_LEVEL", "WARNING")
+    if sample_every is None:
+        sample_every = int(os.environ.get("AMEBA_LOG_SAMPLE_EVERY", "1"))
+    _sample_every = max(1, sample_every)
+
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.setLevel(level.upper() if isinstance(level, str) else level)
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+        root_logger.addHandler(handler)
+
+
+class LogSampler:
+    """Lets through 1 in N records of a call site in sampled debug mode."""
+
+    def __init__(self):
+        self._counter = 0
+
+    def should_record(self) -> bool:
+        self._counter += 1
+        if self._counter >= _sample_every:
+            self._counter = 0
+            return True
+        return False
@@ -0,0 +1,55 @@
+from typing import Iterable, Optional
+
+from core.shared.position import Position
+from core.types.desk_entity import DeskEntity
+
+
+class PositionIndex:
+    """Hash index of desk entities keyed by the cell they occupy.
+
+    Several entities may share a cell (amebas can stand on the same cell),
+    lookups return the first one that was placed there.
+    """
+
+    def __init__(self):
+        self._cells: dict[tuple[int, int], list[DeskEntity]] = {}
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[DeskEntity]) -> "PositionIndex":
+        index = cls()
+        for entity in entities:
+            index.add(entity)
+        return index
+
+    def add(self, entity: DeskEntity) -> None:
+        cell = self._cell(entity.get_position())
+        self._cells.setdefault(cell, []).append(entity)
+
+    def remove(self, entity: DeskEntity, position: Optional[Position] = None) -> None:
+        cell = self._cell(position if position is not None else entity.get_position())
+        entities = self._cells.get(cell)
+        if entities is None or entity not in entities:
+            return
+        entities.remove(entity)
+        if not entities:
+            del self._cells[cell]
+
+    def move(self, entity: DeskEntity, old_position: Position) -> None:
+        self.remove(entity, old_position)
+        self.add(entity)
+
+    def get(self, position: Position) -> Optional[DeskEntity]:
+        entities = self._cells.get((position.row, position.column))
+        if entities:
+            return entities[0]
+        return None
+
+    def is_occupied(self, position: Position) -> bool:
+        return (position.row, position.column) in self._cells
+
+    def __len__(self) -> int:
+        return sum(len(entities) for entities in self._cells.values())
+
+    @staticmethod
+    def _cell(position: Position) -> tuple[int, int]:
+        return position.row, position.column
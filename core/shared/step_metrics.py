@@ -0,0 +1,128 @@
+"""
+Timing histograms for the phases of a simulation step.
+
+Call sites bracket a phase with `start()` / `stop(phase, started)`. While the
+metrics are disabled both are a flag check returning 0.0, so the hooks can
+stay in the hot path and be switched on at runtime.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+# Sub-buckets per power of two, percentiles are accurate to about 9 %.
+BUCKETS_PER_OCTAVE = 8
+
+
+@dataclass
+class PhaseStats:
+    """Aggregated timings of one phase, in seconds"""
+
+    count: int
+    total_seconds: float
+    mean_seconds: float
+    p50_seconds: float
+    p99_seconds: float
+    max_seconds: float
+
+
+class PhaseHistogram:
+    """Log-scale histogram of phase durations"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        bucket = (
+            math.floor(math.log2(seconds) * BUCKETS_PER_OCTAVE)
+            if seconds > 0
+            else -(2**31)
+        )
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, quantile: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                upper_bound = 2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE)
+                return min(upper_bound, self.max_seconds)
+        return self.max_seconds
+
+    def stats(self) -> PhaseStats:
+        return PhaseStats(
+            count=self.count,
+            total_seconds=self.total_seconds,
+            mean_seconds=self.total_seconds / self.count if self.count else 0.0,
+            p50_seconds=self.percentile(0.5),
+            p99_seconds=self.percentile(0.99),
+            max_seconds=self.max_seconds,
+        )
+
+
+class StepMetrics:
+    """Per-phase timing histograms that can be switched on and off at runtime"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, PhaseHistogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def start(self) -> float:
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, phase: str, started: float) -> float:
+        """Record the time since `started` under `phase`.
+
+        Returns the current time so consecutive phases can be chained.
+        """
+        if not self.enabled:
+            return 0.0
+        now = time.perf_counter()
+        if started:
+            self.record(phase, now - started)
+        return now
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = PhaseHistogram()
+            histogram.record(seconds)
+
+    def snapshot(self) -> Dict[str, PhaseStats]:
+        with self._lock:
+            return {
+                phase: histogram.stats()
+                for phase, histogram in self._histograms.items()
+            }
+
+
+_step_metrics = StepMetrics()
+
+
+def get_step_metrics() -> StepMetrics:
+    """Process-wide step metrics shared by every play desk"""
+    return _step_metrics
@@ -1,9 +1,14 @@
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
+
+import numpy as np
 
 from core.abstract_classes.energy_item import EnergyItem
 from core.shared.position import Position
+from core.shared.position_index import PositionIndex
 from core.types.desk_entity import DeskEntity
-from core.calculations.get_entity_by_position import find_entity_by_position
+
+# Row-major energies of a visible area, nested lists or a 2D array
+VisibleEnergy = Union[list[list[float]], np.ndarray]
 
 
 class VisibleEntities:
@@ -13,7 +18,7 @@ class VisibleEntities:
     def get_area(self) -> list[list[Optional[DeskEntity]]]:
         return self._area
 
-    def get_visible_energy(self) -> list[list[float]]:
+    def get_visible_energy(self) -> VisibleEnergy:
         energy_area = []
         for row in self._area:
             energy_row = []
@@ -33,6 +38,48 @@ class VisibleEntities:
         return None
 
 
+class VisibleEnergyWindow(VisibleEntities):
+    """Visible area backed by an energy window gathered from the desk grid.
+
+    Entities are only materialized on request through the desk food index.
+    """
+
+    def __init__(
+        self,
+        energy: np.ndarray,
+        center: Position,
+        food_index: PositionIndex,
+        desk_rows: int,
+        desk_columns: int,
+    ):
+        self._energy = energy
+        self._center = center
+        self._food_index = food_index
+        self._desk_rows = desk_rows
+        self._desk_columns = desk_columns
+
+    def get_area(self) -> list[list[Optional[DeskEntity]]]:
+        rows, columns = self._energy.shape
+        return [
+            [
+                self.get_entity_on_position(Position(i - rows // 2, j - columns // 2))
+                for j in range(columns)
+            ]
+            for i in range(rows)
+        ]
+
+    def get_visible_energy(self) -> VisibleEnergy:
+        return self._energy
+
+    def get_entity_on_position(self, position: Position) -> Optional[DeskEntity]:
+        rows, columns = self._energy.shape
+        if abs(position.row) > rows // 2 or abs(position.column) > columns // 2:
+            return None
+        desk_position = self._center + position
+        desk_position.adjust_position(self._desk_rows, self._desk_columns)
+        return self._food_index.get(desk_position)
+
+
 class CalculateVisibleAreaService:
     def __init__(
         self, visible_rows: int, visible_columns: int, desk_rows: int, desk_columns: int
@@ -41,12 +88,53 @@ class CalculateVisibleAreaService:
         self._visible_columns = visible_columns
         self._desk_rows = desk_rows
         self._desk_columns = desk_columns
+        # Wrap-around index tables: row i of a table holds the desk indexes
+        # visible from row (or column) i, so a window is a single gather.
+        self._row_table = (
+            np.arange(desk_rows)[:, None]
+            + np.arange(-visible_rows, visible_rows + 1)[None, :]
+        ) % desk_rows
+        self._column_table = (
+            np.arange(desk_columns)[:, None]
+            + np.arange(-visible_columns, visible_columns + 1)[None, :]
+        ) % desk_columns
+
+    @property
+    def window_shape(self) -> tuple[int, int]:
+        """(rows, columns) of every visible energy window"""
+        return 2 * self._visible_rows + 1, 2 * self._visible_columns + 1
+
+    def fetch_visible_energy_batch(
+        self, rows: np.ndarray, columns: np.ndarray, energy_grid: np.ndarray
+    ) -> np.ndarray:
+        """Return the (n, 2 * visible_rows + 1, 2 * visible_columns + 1) energy
+        windows centered on each of the n given desk positions."""
+        row_index = self._row_table[rows]
+        column_index = self._column_table[columns]
+        return energy_grid[row_index[:, :, None], column_index[:, None, :]]
+
+    def fetch_visible_energy_worlds(
+        self, rows: np.ndarray, columns: np.ndarray, energy_grids: np.ndarray
+    ) -> np.ndarray:
+        """fetch_visible_energy_batch over independent worlds: positions are
+        (worlds, n) arrays on (worlds, desk_rows, desk_columns) grids and the
+        result is (worlds, n, 2 * visible_rows + 1, 2 * visible_columns + 1)."""
+        worlds = np.arange(energy_grids.shape[0])[:, None, None, None]
+        row_index = self._row_table[rows]
+        column_index = self._column_table[columns]
+        return energy_grids[
+            worlds, row_index[:, :, :, None], column_index[:, :, None, :]
+        ]
 
     def fetch_visible_entities(
         self,
         reference_position: Position,
-        fetched_entities: Sequence[DeskEntity],
+        fetched_entities: Union[PositionIndex, Sequence[DeskEntity]],
     ) -> VisibleEntities:
+        if isinstance(fetched_entities, PositionIndex):
+            entity_index = fetched_entities
+        else:
+            entity_index = PositionIndex.from_entities(fetched_entities)
         visible_entity_area = []
         for i in range(-self._visible_rows, self._visible_rows + 1):
             visible_entity_row = []
@@ -56,9 +144,7 @@ class CalculateVisibleAreaService:
                     reference_position.column + j,
                 )
                 current_position.adjust_position(self._desk_rows, self._desk_columns)
-                entity: Optional[DeskEntity] = find_entity_by_position(
-                    current_position, fetched_entities
-                )
+                entity: Optional[DeskEntity] = entity_index.get(current_position)
                 if entity is not None:
                     visible_entity_row.append(entity)
                 else:
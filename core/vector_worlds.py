@@ -0,0 +1,192 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.neural_network.abstract_classes.neural_network_model import NeuralNetwork
+from core.neural_network.factory import NeuralNetworkType, get_neural_network
+from core.shared.random_streams import NETWORK_INIT, stream_seed
+from core.shared.visible_area import CalculateVisibleAreaService
+
+# Row and column change of each prediction, as in Position.move_according_prediction
+MOVE_DELTAS = np.array([[-1, 0], [0, 1], [1, 0], [0, -1]], dtype=np.intp)
+
+
+@dataclass
+class VectorStepResult:
+    observations: np.ndarray  # (worlds, amebas, window rows, window columns)
+    rewards: np.ndarray  # (worlds, amebas) energy eaten this step
+    dones: np.ndarray  # (worlds,) episode finished, the world was reset
+
+
+class VectorWorlds:
+    """N independent boards stepped together.
+
+    Food energy of all worlds is one (worlds, rows, columns) float32 array and
+    amebas are (worlds, amebas) position and energy arrays. Every step gathers
+    all visible windows at once, runs one batched forward pass for all amebas
+    of all worlds and respawns food for every world in one vectorized pass.
+    Rules follow PlayDesk: an ameba eats the food on the cell it moves to,
+    when several amebas of a world reach the same cell the first one eats it,
+    and each world is topped up to its total energy on empty cells.
+    """
+
+    def __init__(
+        self,
+        config: GameConfig,
+        num_worlds: int,
+        amebas_per_world: int = 1,
+        neural_network: Optional[NeuralNetwork] = None,
+        episode_length: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        rows, columns = config.play_desk.rows, config.play_desk.columns
+        if amebas_per_world > rows * columns:
+            raise ValueError(
+                f"{amebas_per_world} amebas do not fit on a {rows}x{columns} board"
+            )
+        self.config = config
+        self.num_worlds = num_worlds
+        self.amebas_per_world = amebas_per_world
+        self.episode_length = episode_length
+        self._neural_network = neural_network
+        self._network_seed = None if seed is None else stream_seed(seed, NETWORK_INIT)
+        self._rng = np.random.default_rng(seed)
+        self._visible_area_service = CalculateVisibleAreaService(
+            visible_rows=config.ameba.visible_rows,
+            visible_columns=config.ameba.visible_columns,
+            desk_rows=rows,
+            desk_columns=columns,
+        )
+
+        self.energy = np.zeros((num_worlds, rows, columns), dtype=np.float32)
+        self.ameba_rows = np.zeros((num_worlds, amebas_per_world), dtype=np.intp)
+        self.ameba_columns = np.zeros((num_worlds, amebas_per_world), dtype=np.intp)
+        self.ameba_energy = np.zeros((num_worlds, amebas_per_world), dtype=np.float32)
+        self.step_counts = np.zeros(num_worlds, dtype=np.int64)
+        self.episodes_completed = 0
+        self.reset()
+
+    def reset(
+        self, worlds: Optional[np.ndarray] = None, seed: Optional[int] = None
+    ) -> np.ndarray:
+        """Start new episodes in the given worlds (all by default).
+
+        Amebas are placed on distinct random cells, then food is generated.
+        Returns the observations of all worlds.
+        """
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        worlds = np.arange(self.num_worlds) if worlds is None else np.asarray(worlds)
+        columns = self.config.play_desk.columns
+        cell_count = self.config.play_desk.rows * columns
+
+        self.energy[worlds] = 0
+        keys = self._rng.random((len(worlds), cell_count))
+        cells = np.argpartition(keys, self.amebas_per_world - 1, axis=1)[
+            :, : self.amebas_per_world
+        ]
+        self.ameba_rows[worlds], self.ameba_columns[worlds] = np.divmod(cells, columns)
+        self.ameba_energy[worlds] = self.config.ameba.initial_energy
+        self.step_counts[worlds] = 0
+        self._respawn_food(worlds)
+        return self.observe()
+
+    def observe(self) -> np.ndarray:
+        """Visible energy windows, (worlds, amebas, window rows, window columns)"""
+        return self._visible_area_service.fetch_visible_energy_worlds(
+            self.ameba_rows, self.ameba_columns, self.energy
+        )
+
+    def act(self, observations: np.ndarray) -> np.ndarray:
+        """Predictions of the network for every ameba, (worlds, amebas)"""
+        if self._neural_network is None:
+            self._neural_network = get_neural_network(NeuralNetworkType.BASE_NN)(
+                self.config.neural_network, seed=self._network_seed
+            )
+        window_shape = observations.shape[2:]
+        predictions = self._neural_network.predict_batch(
+            observations.reshape(-1, *window_shape)
+        )
+        return predictions.cpu().numpy().reshape(self.num_worlds, -1)
+
+    def step(self, actions: Optional[np.ndarray] = None) -> VectorStepResult:
+        """Move every ameba of every world once.
+
+        Args:
+            actions: (worlds, amebas) predictions in 0..3, the network
+                decides when None
+
+        Returns:
+            VectorStepResult with the new observations. Worlds that reached
+            episode_length are reported done and already reset.
+        """
+        if actions is None:
+            actions = self.act(self.observe())
+        actions = np.asarray(actions).reshape(self.num_worlds, self.amebas_per_world)
+        rows, columns = self.config.play_desk.rows, self.config.play_desk.columns
+
+        deltas = MOVE_DELTAS[actions]
+        self.ameba_rows = (self.ameba_rows + deltas[..., 0]) % rows
+        self.ameba_columns = (self.ameba_columns + deltas[..., 1]) % columns
+
+        world_index = np.arange(self.num_worlds)[:, None]
+        cells = (
+            (world_index * rows + self.ameba_rows) * columns + self.ameba_columns
+        ).ravel()
+        # Lowest ameba index first, as in the sequential PlayDesk loop
+        _, eaters = np.unique(cells, return_index=True)
+        energy = self.energy.reshape(-1)
+        rewards = np.zeros(cells.shape, dtype=np.float32)
+        rewards[eaters] = energy[cells[eaters]]
+        energy[cells[eaters]] = 0
+        rewards = rewards.reshape(self.num_worlds, self.amebas_per_world)
+        self.ameba_energy += rewards
+
+        self.step_counts += 1
+        self._respawn_food(np.arange(self.num_worlds))
+
+        dones = np.zeros(self.num_worlds, dtype=np.bool_)
+        if self.episode_length is not None:
+            dones = self.step_counts >= self.episode_length
+            if dones.any():
+                finished = np.flatnonzero(dones)
+                self.episodes_completed += len(finished)
+                self.reset(finished)
+        return VectorStepResult(
+            observations=self.observe(), rewards=rewards, dones=dones
+        )
+
+    def _respawn_food(self, worlds: np.ndarray) -> None:
+        energy_per_food = self.config.play_desk.energy_per_food
+        used_energy = self.energy[worlds].sum(
+            axis=(1, 2), dtype=np.float64
+        ) + self.ameba_energy[worlds].sum(axis=1, dtype=np.float64)
+        available_energy = self.config.play_desk.total_energy - used_energy
+        counts = np.where(
+            available_energy > 0, np.ceil(available_energy / energy_per_food), 0
+        ).astype(np.int64)
+        needed = counts > 0
+        if not needed.any():
+            return
+        worlds, counts = worlds[needed], counts[needed]
+
+        # Random priority per cell, occupied cells never win
+        columns = self.config.play_desk.columns
+        flat_energy = self.energy.reshape(self.num_worlds, -1)
+        keys = self._rng.random((len(worlds), flat_energy.shape[1]))
+        keys[flat_energy[worlds] > 0] = np.inf
+        ameba_cells = self.ameba_rows[worlds] * columns + self.ameba_columns[worlds]
+        keys[np.arange(len(worlds))[:, None], ameba_cells] = np.inf
+
+        k = min(int(counts.max()), keys.shape[1])
+        chosen = np.argpartition(keys, k - 1, axis=1)[:, :k]
+        chosen_keys = np.take_along_axis(keys, chosen, axis=1)
+        order = np.argsort(chosen_keys, axis=1)
+        chosen = np.take_along_axis(chosen, order, axis=1)
+        chosen_keys = np.take_along_axis(chosen_keys, order, axis=1)
+        # A saturated world gets only as much food as it has empty cells
+        place = (np.arange(k)[None, :] < counts[:, None]) & np.isfinite(chosen_keys)
+        world_index = np.broadcast_to(worlds[:, None], chosen.shape)
+        flat_energy[world_index[place], chosen[place]] = energy_per_food
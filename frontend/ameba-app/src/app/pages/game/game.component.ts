@@ -9,8 +9,8 @@ import { MatProgressSpinnerModule } from '@angular/material/progress-spinner';
 import { MatSliderModule } from '@angular/material/slider';
 import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
 import { RouterLink } from '@angular/router';
-import { interval, Subscription } from 'rxjs';
-import { GameState, MovementService, MoveRequest, Position, SimulationRequest } from '../../services/movement.service';
+import { Subscription } from 'rxjs';
+import { GameState, MovementService, MoveRequest, Position, SimulationRequest, StreamFrame } from '../../services/movement.service';
 
 // Game entities and types
 interface GameConfig {
@@ -566,11 +566,42 @@ export class GameComponent implements OnInit, OnDestroy {
     if (this.autoMoveSubscription) return;
 
     this.autoMove.set(true);
-    this.autoMoveSubscription = interval(this.simulationSpeed()).subscribe(async () => {
-      if (this.isGameRunning() && !this.isMoving()) {
-        await this.singleStep();
-      }
-    });
+    let lastStep: number | null = null;
+    this.autoMoveSubscription = this.movementService
+      .openFrameStream(this.getStepsPerSecond())
+      .subscribe({
+        next: (frame: StreamFrame) => {
+          if (frame.type === 'error') {
+            this.snackBar.open('Live stream failed: ' + frame.message, 'Close', {
+              duration: 5000,
+              panelClass: ['error-snackbar']
+            });
+            this.stopAutoMove();
+            return;
+          }
+          if (!frame.game_state || frame.step_number === undefined) return;
+
+          // Frames are coalesced for slow clients, count the skipped steps too
+          const steps = lastStep === null ? 0 : frame.step_number - lastStep;
+          lastStep = frame.step_number;
+          this.updateGridFromGameState(frame.game_state);
+          if (steps > 0) {
+            const stats = this.movementStats();
+            this.movementStats.set({
+              iterations: stats.iterations + steps,
+              lastMoveTime: new Date()
+            });
+          }
+        },
+        error: error => {
+          console.error('Live stream failed:', error);
+          this.snackBar.open('Live stream connection lost', 'Close', {
+            duration: 5000,
+            panelClass: ['error-snackbar']
+          });
+          this.stopAutoMove();
+        }
+      });
 
     this.snackBar.open('Auto movement started', 'Close', {
       duration: 2000,
@@ -582,6 +613,11 @@ export class GameComponent implements OnInit, OnDestroy {
     this.autoMove.set(false);
     this.autoMoveSubscription?.unsubscribe();
     this.autoMoveSubscription = undefined;
+    this.movementService.closeFrameStream();
+  }
+
+  private getStepsPerSecond(): number {
+    return 1000 / this.simulationSpeed();
   }
 
   /**
@@ -643,9 +679,7 @@ export class GameComponent implements OnInit, OnDestroy {
   updateSimulationSpeed(speed: number): void {
     this.simulationSpeed.set(speed);
     if (this.autoMove()) {
-      // Restart auto move with new speed
-      this.stopAutoMove();
-      this.startAutoMove();
+      this.movementService.setStreamRate(this.getStepsPerSecond());
     }
   }
 
@@ -1,4 +1,4 @@
-import { DatePipe } from '@angular/common';
+import { DatePipe, DecimalPipe } from '@angular/common';
 import { Component, OnInit, inject, signal } from '@angular/core';
 import { FormBuilder, FormGroup, ReactiveFormsModule, Validators } from '@angular/forms';
 import { MatButtonModule } from '@angular/material/button';
@@ -10,14 +10,15 @@ import { MatInputModule } from '@angular/material/input';
 import { MatProgressSpinnerModule } from '@angular/material/progress-spinner';
 import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
 import { Router } from '@angular/router';
-import { finalize } from 'rxjs';
-import { TrainingService } from '../../services/training.service';
+import { finalize, switchMap, takeWhile, timer } from 'rxjs';
+import { TrainingJob, TrainingService } from '../../services/training.service';
 
 @Component({
   selector: 'app-training',
   standalone: true,
   imports: [
     DatePipe,
+    DecimalPipe,
     MatButtonModule,
     MatCardModule,
     MatIconModule,
@@ -95,6 +96,26 @@ import { TrainingService } from '../../services/training.service';
             </div>
           </form>
 
+          <!-- Training Progress -->
+          @if (trainingJob(); as job) {
+            @if (isTraining()) {
+              <div class="result-info">
+                <mat-icon>hourglass_top</mat-icon>
+                <div>
+                  <h4>Training {{job.status}}</h4>
+                  <p>{{job.message}}</p>
+                  @if (job.epoch) {
+                    <p>
+                      <strong>Epoch:</strong> {{job.epoch}}/{{job.total_epochs}}
+                      <strong>Loss:</strong> {{job.loss | number:'1.4-4'}}
+                      <strong>Samples/sec:</strong> {{job.samples_per_sec | number:'1.0-0'}}
+                    </p>
+                  }
+                </div>
+              </div>
+            }
+          }
+
           <!-- Training Result -->
           @if (trainingResult()) {
             <div class="result-info" [class.success]="trainingResult()!.success" [class.error]="!trainingResult()!.success">
@@ -127,6 +148,13 @@ import { TrainingService } from '../../services/training.service';
             }
           </button>
 
+          @if (isTraining() && trainingJob()) {
+            <button mat-button (click)="cancelTraining()">
+              <mat-icon>stop</mat-icon>
+              Cancel Training
+            </button>
+          }
+
           <button mat-button (click)="refreshStatus()">
             <mat-icon>refresh</mat-icon>
             Refresh Status
@@ -281,6 +309,7 @@ export class TrainingComponent implements OnInit {
   // Signals for reactive state
   trainingStatus = signal<any>(null);
   trainingResult = signal<any>(null);
+  trainingJob = signal<TrainingJob | null>(null);
   isTraining = signal<boolean>(false);
 
   gameConfig: any = null;
@@ -317,15 +346,30 @@ export class TrainingComponent implements OnInit {
 
     this.isTraining.set(true);
     this.trainingResult.set(null);
+    this.trainingJob.set(null);
 
     const request = this.trainingForm.value;
 
     this.trainingService.startTraining(request).pipe(
+      // Training runs as a background job on the server, poll until it finishes
+      switchMap((response) => timer(0, 1000).pipe(
+        switchMap(() => this.trainingService.getTrainingJob(response.job_id!)),
+        takeWhile((job) => job.status === 'queued' || job.status === 'running', true)
+      )),
       finalize(() => this.isTraining.set(false))
     ).subscribe({
-      next: (response) => {
-        this.trainingResult.set(response);
-        if (response.success) {
+      next: (job) => {
+        this.trainingJob.set(job);
+        if (job.status === 'queued' || job.status === 'running') {
+          return;
+        }
+        const success = job.status === 'completed';
+        this.trainingResult.set({
+          success,
+          message: job.error_details ? `${job.message}: ${job.error_details}` : job.message,
+          steps_completed: success ? job.steps : undefined
+        });
+        if (success) {
           this.snackBar.open('Training completed successfully!', 'Close', {
             duration: 5000,
             panelClass: ['success-snackbar']
@@ -333,7 +377,7 @@ export class TrainingComponent implements OnInit {
           // Refresh status to show updated model info
           this.refreshStatus();
         } else {
-          this.snackBar.open('Training failed!', 'Close', {
+          this.snackBar.open(`Training ${job.status}!`, 'Close', {
             duration: 5000,
             panelClass: ['error-snackbar']
           });
@@ -352,6 +396,22 @@ export class TrainingComponent implements OnInit {
     });
   }
 
+  cancelTraining(): void {
+    const job = this.trainingJob();
+    if (!job) {
+      return;
+    }
+    this.trainingService.cancelTrainingJob(job.job_id).subscribe({
+      next: (cancelledJob) => this.trainingJob.set(cancelledJob),
+      error: (error) => {
+        this.snackBar.open(`Failed to cancel training: ${error.message}`, 'Close', {
+          duration: 3000,
+          panelClass: ['error-snackbar']
+        });
+      }
+    });
+  }
+
   refreshStatus(): void {
     this.trainingService.getTrainingStatus().subscribe({
       next: (status) => {
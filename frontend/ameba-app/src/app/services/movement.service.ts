@@ -1,7 +1,8 @@
 import { HttpClient, HttpErrorResponse } from '@angular/common/http';
 import { Injectable, inject } from '@angular/core';
 import { BehaviorSubject, Observable, throwError } from 'rxjs';
-import { catchError, tap } from 'rxjs/operators';
+import { catchError, filter, map, tap } from 'rxjs/operators';
+import { webSocket, WebSocketSubject } from 'rxjs/webSocket';
 
 export interface Position {
     row: number;
@@ -56,6 +57,24 @@ export interface SimulationRequest {
     game_state: GameState;
     iterations: number;
     return_intermediate_states?: boolean;
+    return_steps?: boolean;
+    keyframe_interval?: number;
+}
+
+/**
+ * Delta encoded simulation step. Keyframes hold every ameba as
+ * [row, column, energy] (index = ameba id) and every food as
+ * [row, column, energy]. Deltas hold moved amebas as [id, row, column, energy],
+ * eaten cells as [row, column] and spawned food as [row, column, energy].
+ */
+export interface SimulationStep {
+    step_number: number;
+    keyframe: boolean;
+    total_energy: number;
+    amebas: number[][];
+    foods: number[][];
+    eaten: number[][];
+    spawned: number[][];
 }
 
 export interface SimulationResponse {
@@ -63,7 +82,7 @@ export interface SimulationResponse {
     message: string;
     total_iterations: number;
     final_game_state: GameState;
-    steps?: GameState[];
+    steps?: SimulationStep[];
     statistics: {
         final_ameba_count: number;
         final_food_count: number;
@@ -82,6 +101,36 @@ export interface MovementStatus {
     message: string;
 }
 
+/**
+ * Frame of the live stream as sent by the server: a simulation step numbered
+ * with the game version, keyframes also carry the board size
+ */
+export interface StreamMessage extends Partial<SimulationStep> {
+    type: 'frame' | 'error';
+    board_size?: {
+        rows: number;
+        columns: number;
+    };
+    dropped_frames?: number;
+    message?: string;
+}
+
+/**
+ * Frame of the live stream with the board rebuilt from the steps
+ */
+export interface StreamFrame {
+    type: 'frame' | 'error';
+    step_number?: number;
+    game_state?: GameState;
+    dropped_frames?: number;
+    message?: string;
+}
+
+export interface StreamControl {
+    steps_per_second?: number;
+    paused?: boolean;
+}
+
 export interface GameStateResponse {
     success: boolean;
     message: string;
@@ -100,6 +149,8 @@ export interface GameStateResponse {
 export class MovementService {
     private readonly http = inject(HttpClient);
     private readonly apiBaseUrl = 'http://127.0.0.1:8000/api/movement';
+    private readonly streamUrl = 'ws://127.0.0.1:8000/api/movement/stream';
+    private streamSocket?: WebSocketSubject<StreamMessage | StreamControl>;
 
     // Observable for game state changes
     private readonly gameStateSubject = new BehaviorSubject<GameState | null>(null);
@@ -165,6 +216,140 @@ export class MovementService {
         );
     }
 
+    /**
+     * Open the live frame stream, the server steps the game at the given rate
+     * and pushes the newest frame whenever the client is ready for it. Deltas
+     * are applied to the board of the last keyframe
+     */
+    openFrameStream(stepsPerSecond: number): Observable<StreamFrame> {
+        this.closeFrameStream();
+        const socket = webSocket<StreamMessage | StreamControl>(
+            `${this.streamUrl}?steps_per_second=${stepsPerSecond}`
+        );
+        this.streamSocket = socket;
+        let board: GameState | undefined;
+        let stepNumber = -1;
+        return (socket as Observable<StreamMessage>).pipe(
+            map((message): StreamFrame | null => {
+                if (message.type === 'error') {
+                    return { type: 'error', message: message.message };
+                }
+                // A delta already contained in the board is stale
+                if (!message.keyframe && message.step_number! <= stepNumber) {
+                    return null;
+                }
+                board = this.applyStreamMessage(board, message);
+                if (!board) {
+                    return null;
+                }
+                stepNumber = message.step_number!;
+                return {
+                    type: 'frame',
+                    step_number: stepNumber,
+                    game_state: board,
+                    dropped_frames: message.dropped_frames
+                };
+            }),
+            filter((frame): frame is StreamFrame => frame !== null),
+            tap(frame => {
+                if (frame.game_state) {
+                    this.gameStateSubject.next(frame.game_state);
+                }
+            })
+        );
+    }
+
+    /**
+     * Change the stepping rate of the open frame stream
+     */
+    setStreamRate(stepsPerSecond: number): void {
+        this.streamSocket?.next({ steps_per_second: stepsPerSecond });
+    }
+
+    /**
+     * Close the live frame stream
+     */
+    closeFrameStream(): void {
+        this.streamSocket?.complete();
+        this.streamSocket = undefined;
+    }
+
+    /**
+     * Rebuild the board after `stepNumber` from the closest keyframe and the
+     * deltas that follow it
+     */
+    rebuildFrame(
+        steps: SimulationStep[],
+        stepNumber: number,
+        boardSize: { rows: number; columns: number }
+    ): GameState {
+        const end = steps.findIndex(step => step.step_number === stepNumber);
+        if (end < 0) {
+            throw new Error(`Step ${stepNumber} not found`);
+        }
+        let start = end;
+        while (start >= 0 && !steps[start].keyframe) {
+            start--;
+        }
+        if (start < 0) {
+            throw new Error(`No keyframe at or before step ${stepNumber}`);
+        }
+
+        const amebas = steps[start].amebas.map(ameba => [...ameba]);
+        const foods = new Map<string, number[]>();
+        steps[start].foods.forEach(food => foods.set(`${food[0]}-${food[1]}`, food));
+        for (const delta of steps.slice(start + 1, end + 1)) {
+            delta.eaten.forEach(([row, column]) => foods.delete(`${row}-${column}`));
+            delta.spawned.forEach(food => foods.set(`${food[0]}-${food[1]}`, food));
+            delta.amebas.forEach(([id, row, column, energy]) => {
+                amebas[id] = [row, column, energy];
+            });
+        }
+
+        return {
+            amebas: amebas.map(([row, column, energy]) => ({
+                type: 'ameba',
+                energy,
+                position: { row, column }
+            })),
+            foods: [...foods.values()].map(([row, column, energy]) => ({
+                type: 'food',
+                energy,
+                position: { row, column }
+            })),
+            board_size: boardSize
+        };
+    }
+
+    private applyStreamMessage(
+        board: GameState | undefined,
+        message: StreamMessage
+    ): GameState | undefined {
+        if (message.keyframe) {
+            return this.rebuildFrame(
+                [message as SimulationStep],
+                message.step_number!,
+                message.board_size!
+            );
+        }
+        if (!board) {
+            return undefined;
+        }
+        const amebas = [...board.amebas];
+        const foods = new Map<string, CellEntity>();
+        board.foods.forEach(food =>
+            foods.set(`${food.position.row}-${food.position.column}`, food)
+        );
+        message.eaten!.forEach(([row, column]) => foods.delete(`${row}-${column}`));
+        message.spawned!.forEach(([row, column, energy]) =>
+            foods.set(`${row}-${column}`, { type: 'food', energy, position: { row, column } })
+        );
+        message.amebas!.forEach(([id, row, column, energy]) => {
+            amebas[id] = { type: 'ameba', energy, position: { row, column } };
+        });
+        return { ...board, amebas, foods: [...foods.values()] };
+    }
+
     /**
      * Convert frontend cell format to API format
      */
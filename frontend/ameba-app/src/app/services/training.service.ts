@@ -13,6 +13,25 @@ export interface TrainingResponse {
     success: boolean;
     message: string;
     steps_completed?: number;
+    job_id?: string;
+    status?: string;
+}
+
+export interface TrainingJob {
+    job_id: string;
+    status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
+    message: string;
+    steps: number;
+    batch_size: number;
+    submitted_at: string;
+    started_at?: string;
+    finished_at?: string;
+    epoch: number;
+    total_epochs: number;
+    loss?: number;
+    samples_per_sec?: number;
+    error_details?: string;
+    model_path?: string;
 }
 
 export interface TrainingStatus {
@@ -30,7 +49,7 @@ export class TrainingService {
     private readonly apiUrl = 'http://127.0.0.1:8000/api/training';
 
     /**
-     * Start neural network training
+     * Submit a neural network training job
      */
     startTraining(request: TrainingRequest): Observable<TrainingResponse> {
         return this.http.post<TrainingResponse>(`${this.apiUrl}/train`, request).pipe(
@@ -38,6 +57,24 @@ export class TrainingService {
         );
     }
 
+    /**
+     * Get status and progress of a submitted training job
+     */
+    getTrainingJob(jobId: string): Observable<TrainingJob> {
+        return this.http.get<TrainingJob>(`${this.apiUrl}/jobs/${jobId}`).pipe(
+            catchError(this.handleError.bind(this))
+        );
+    }
+
+    /**
+     * Cancel a queued or running training job
+     */
+    cancelTrainingJob(jobId: string): Observable<TrainingJob> {
+        return this.http.post<TrainingJob>(`${this.apiUrl}/jobs/${jobId}/cancel`, {}).pipe(
+            catchError(this.handleError.bind(this))
+        );
+    }
+
     /**
      * Get training status and model information
      */
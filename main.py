@@ -2,6 +2,7 @@ import sys
 import os
 
 from core.game import Game
+from core.shared.log import configure_logging
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -10,6 +11,7 @@ if current_dir not in sys.path:
 
 
 def main():
+    configure_logging()
     print("Welcome to Ameba Game!")
     config_path = os.path.join(os.path.dirname(__file__), "config.json")
     game = Game(Game.load_config(config_path))
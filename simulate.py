@@ -0,0 +1,77 @@
+"""
+Headless fast-forward simulation.
+
+Examples:
+    python simulate.py --steps 1000
+    python simulate.py --rows 100 --columns 100 --amebas 500 --engine numpy \
+        --step-mode convolution --seconds 30 --seed 1
+"""
+
+import argparse
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from core.game import Game
+from core.out.simulation_runner import SimulationRunner
+from core.play_desk import StepMode
+from core.play_desk_factory import PlayDeskEngine
+from core.shared.log import configure_logging
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the ameba simulation headless")
+    parser.add_argument(
+        "--config",
+        default=os.path.join(current_dir, "config.json"),
+        help="Game configuration file (default: config.json)",
+    )
+    parser.add_argument("--rows", type=int, help="Override board rows")
+    parser.add_argument("--columns", type=int, help="Override board columns")
+    parser.add_argument("--total-energy", type=float, help="Override total energy")
+    parser.add_argument("--amebas", type=int, default=1, help="Number of amebas")
+    parser.add_argument("--seed", type=int, help="Seed for all random generators")
+    parser.add_argument("--engine", choices=[engine.value for engine in PlayDeskEngine])
+    parser.add_argument("--step-mode", choices=[mode.value for mode in StepMode])
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument("--steps", type=int, help="Number of steps (default: 1000)")
+    budget.add_argument("--seconds", type=float, help="Wall-clock budget in seconds")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+
+    config = Game.load_config(args.config)
+    if args.rows is not None:
+        config.play_desk.rows = args.rows
+    if args.columns is not None:
+        config.play_desk.columns = args.columns
+    if args.total_energy is not None:
+        config.play_desk.total_energy = args.total_energy
+    if args.engine is not None:
+        config.play_desk.engine = args.engine
+    if args.step_mode is not None:
+        config.play_desk.step_mode = args.step_mode
+
+    steps = args.steps
+    if steps is None and args.seconds is None:
+        steps = 1000
+
+    runner = SimulationRunner(config, ameba_count=args.amebas, seed=args.seed)
+    report = runner.run(steps=steps, time_budget=args.seconds)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Parameter sweep over GameConfig overrides on every CPU core.
+
+The search space maps dotted config paths to the values to try, either from
+a JSON file or from repeated --param options.
+
+Examples:
+    python sweep.py --param play_desk.total_energy=2000,5000,10000 \
+        --param ameba.visible_rows=3,5 --steps 500 --output sweep.npz
+    python sweep.py --space space.json --random 50 --seed 7 --output sweep.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from core.game import Game
+from core.out.parameter_sweep import (
+    ParameterSweep,
+    grid_overrides,
+    random_overrides,
+    write_columns,
+)
+from core.shared.log import configure_logging
+
+
+def _parse_param(option: str):
+    path, separator, values = option.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Expected path=value,...: {option}")
+    return path, [json.loads(value) for value in values.split(",")]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sweep game config parameters")
+    parser.add_argument(
+        "--config",
+        default=os.path.join(current_dir, "config.json"),
+        help="Base game configuration file (default: config.json)",
+    )
+    parser.add_argument("--space", help="JSON file mapping config paths to values")
+    parser.add_argument(
+        "--param",
+        type=_parse_param,
+        action="append",
+        default=[],
+        help="Config path and values, e.g. ameba.visible_rows=3,5",
+    )
+    parser.add_argument(
+        "--random",
+        type=int,
+        metavar="N",
+        help="Sample N combinations instead of the full grid",
+    )
+    parser.add_argument("--steps", type=int, default=1000, help="Steps per run")
+    parser.add_argument("--amebas", type=int, default=1, help="Amebas per run")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed of the runs")
+    parser.add_argument("--workers", type=int, help="Processes (default: CPU count)")
+    parser.add_argument(
+        "--output",
+        default="sweep.npz",
+        help="Columnar results file, .npz or .json (default: sweep.npz)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+
+    space = {}
+    if args.space:
+        with open(args.space, "r") as space_file:
+            space.update(json.load(space_file))
+    space.update(dict(args.param))
+    if not space:
+        raise SystemExit("Nothing to sweep, give --space or --param")
+
+    if args.random is not None:
+        overrides = random_overrides(space, args.random, seed=args.seed)
+    else:
+        overrides = grid_overrides(space)
+
+    sweep = ParameterSweep(
+        Game.load_config(args.config),
+        overrides,
+        steps=args.steps,
+        amebas=args.amebas,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    rows = sweep.run(
+        on_result=lambda row: print(
+            f"run {row['run_index'] + 1}/{len(overrides)}: "
+            f"{row['foods_eaten_per_step']:.2f} foods/step, "
+            f"{row['steps_per_sec']:.1f} steps/sec",
+            file=sys.stderr,
+        )
+    )
+    write_columns(rows, args.output)
+    print(f"Wrote {len(rows)} runs to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+# The api modules import each other as top-level packages, as under api/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "api"))
+
+from movement.stream import FrameBroadcaster, FrameMailbox, StreamSettings
+
+
+class TestFrameMailbox(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_returns_the_latest_frame_and_counts_drops(self):
+        mailbox = FrameMailbox()
+        for version in range(3):
+            mailbox.put({"version": version})
+
+        self.assertEqual(await mailbox.get(), {"version": 2})
+        self.assertEqual(mailbox.dropped_frames, 2)
+
+        mailbox.put({"version": 3})
+        self.assertEqual(await mailbox.get(), {"version": 3})
+        self.assertEqual(mailbox.dropped_frames, 2)
+
+    async def test_get_waits_for_the_next_frame(self):
+        mailbox = FrameMailbox()
+        mailbox.put({"version": 0})
+        await mailbox.get()
+
+        waiting = asyncio.create_task(mailbox.get())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+
+        mailbox.put({"version": 1})
+        self.assertEqual(await asyncio.wait_for(waiting, 1), {"version": 1})
+
+    async def test_merge_folds_pending_frames(self):
+        mailbox = FrameMailbox(
+            merge=lambda pending, frame: {"steps": pending["steps"] + frame["steps"]}
+        )
+        for step in range(3):
+            mailbox.put({"steps": [step]})
+
+        self.assertEqual(await mailbox.get(), {"steps": [0, 1, 2]})
+        self.assertEqual(mailbox.dropped_frames, 2)
+
+        mailbox.put({"steps": [3]})
+        self.assertEqual(await mailbox.get(), {"steps": [3]})
+
+    def test_rate_is_clamped(self):
+        settings = StreamSettings(1000)
+        self.assertEqual(settings.steps_per_second, 60.0)
+        settings.set_rate(0)
+        self.assertEqual(settings.steps_per_second, 0.1)
+
+
+class TestFrameBroadcaster(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.steps = 0
+        self.fail_at = None
+
+        async def step():
+            self.steps += 1
+            if self.steps == self.fail_at:
+                return {"type": "error", "message": "step failed"}
+            return {"type": "frame", "version": self.steps}
+
+        self.broadcaster = FrameBroadcaster(step)
+
+    async def test_clients_share_one_producer(self):
+        first = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+        second = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+        self.assertEqual(self.broadcaster.subscriber_count, 2)
+
+        for mailbox in (first, second):
+            self.assertEqual((await mailbox.get())["version"], 0)
+        first_frame = await first.get()
+        second_frame = await second.get()
+
+        # One step per tick, not one per client
+        self.assertEqual(first_frame["version"], second_frame["version"])
+        self.assertEqual(self.steps, first_frame["version"])
+
+        await self.broadcaster.unsubscribe(first)
+        await self.broadcaster.unsubscribe(second)
+        steps = self.steps
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.steps, steps)
+
+    async def test_error_frame_reaches_every_client(self):
+        self.fail_at = 2
+        first = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+        second = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+
+        for mailbox in (first, second):
+            frame = await asyncio.wait_for(mailbox.get(), 1)
+            while frame["type"] != "error":
+                frame = await asyncio.wait_for(mailbox.get(), 1)
+            self.assertEqual(frame["message"], "step failed")
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.steps, 2)
+
+        # A new client restarts the stream
+        third = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+        await third.get()
+        self.assertEqual((await asyncio.wait_for(third.get(), 1))["version"], 3)
+        for mailbox in (first, second, third):
+            await self.broadcaster.unsubscribe(mailbox)
+
+    async def test_pause_stops_stepping(self):
+        mailbox = self.broadcaster.subscribe({"type": "frame", "version": 0}, 60)
+        await mailbox.get()
+        await mailbox.get()
+
+        self.broadcaster.settings.set_paused(True)
+        await asyncio.sleep(0.05)
+        steps = self.steps
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.steps, steps)
+
+        self.broadcaster.settings.set_paused(False)
+        await asyncio.wait_for(mailbox.get(), 1)
+        self.assertGreater(self.steps, steps)
+        await self.broadcaster.unsubscribe(mailbox)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.out.movement_handler import MovementHandler
+from core.play_desk import StepMode
+from core.play_desk_factory import PlayDeskEngine
+
+ENGINES = (PlayDeskEngine.OBJECT.value, PlayDeskEngine.NUMPY.value)
+
+
+def small_config(engine: str) -> GameConfig:
+    config = GameConfig.create_default()
+    config.play_desk.rows = 10
+    config.play_desk.columns = 10
+    config.play_desk.total_energy = 800.0
+    config.play_desk.engine = engine
+    config.ameba.lost_energy_per_move = 1.5
+    return config
+
+
+class TestEnergyTotals(unittest.TestCase):
+
+    def assertTotalsMatchRecount(self, play_desk):
+        food_energy, ameba_energy = play_desk._recount_energy()
+        self.assertAlmostEqual(play_desk._food_energy_total, food_energy, places=3)
+        self.assertAlmostEqual(play_desk._ameba_energy_total, ameba_energy, places=3)
+
+    def test_game_steps_keep_the_totals(self):
+        for engine in ENGINES:
+            for step_mode in (StepMode.SEQUENTIAL.value, StepMode.BATCHED.value):
+                with self.subTest(engine=engine, step_mode=step_mode):
+                    config = small_config(engine)
+                    config.play_desk.step_mode = step_mode
+                    game = Game(config, seed=2)
+                    game.initialize_play_desk(ameba_count=4)
+                    for _ in range(20):
+                        game.run(1)
+                        self.assertTotalsMatchRecount(game.play_desk)
+
+    def test_movement_handler_keeps_the_totals(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine), tempfile.TemporaryDirectory() as root:
+                with open(Path(root) / "config.json", "w") as config_file:
+                    json.dump(small_config(engine).to_dict(), config_file)
+                handler = MovementHandler(Path(root))
+                play_desk = handler.game.play_desk
+                ameba_energy = play_desk._ameba_energy_total
+
+                for _ in range(10):
+                    self.assertTrue(handler.move_amebas()["success"])
+                    self.assertTotalsMatchRecount(play_desk)
+                # Every move costs lost_energy_per_move, eating adds it back
+                self.assertNotEqual(play_desk._ameba_energy_total, ameba_energy)
+
+    def test_audit_logs_and_repairs_drift(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                config = small_config(engine)
+                config.play_desk.energy_audit_every = 2
+                game = Game(config, seed=2)
+                game.initialize_play_desk(ameba_count=2)
+                play_desk = game.play_desk
+                play_desk._food_energy_total += 50.0
+                play_desk._energy_audit_countdown = 2
+
+                with self.assertNoLogs("ameba.play_desk", level="ERROR"):
+                    play_desk.generate_food()
+                with self.assertLogs("ameba.play_desk", level="ERROR") as logs:
+                    play_desk.generate_food()
+
+                self.assertIn("Energy totals drifted", logs.output[0])
+                self.assertTotalsMatchRecount(play_desk)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.play_desk import StepMode
+from core.play_desk_factory import PlayDeskEngine
+
+
+class TestEngineEquivalence(unittest.TestCase):
+
+    def _run(self, engine: str, step_mode: str) -> Game:
+        config = GameConfig.create_default()
+        config.play_desk.rows = 10
+        config.play_desk.columns = 10
+        config.play_desk.total_energy = 800.0
+        config.play_desk.engine = engine
+        config.play_desk.step_mode = step_mode
+        game = Game(config, seed=4)
+        game.initialize_play_desk(ameba_count=3)
+        game.run(25)
+        return game
+
+    def test_object_and_numpy_engines_match(self):
+        for step_mode in (StepMode.SEQUENTIAL.value, StepMode.BATCHED.value):
+            with self.subTest(step_mode=step_mode):
+                object_desk = self._run(
+                    PlayDeskEngine.OBJECT.value, step_mode
+                ).play_desk
+                numpy_desk = self._run(PlayDeskEngine.NUMPY.value, step_mode).play_desk
+
+                np.testing.assert_array_equal(
+                    object_desk.get_energy_grid(), numpy_desk.get_energy_grid()
+                )
+                for expected, actual in zip(
+                    object_desk.get_ameba_positions(), numpy_desk.get_ameba_positions()
+                ):
+                    np.testing.assert_array_equal(expected, actual)
+                self.assertEqual(
+                    [ameba.get_energy() for ameba in object_desk._amebas],
+                    [ameba.get_energy() for ameba in numpy_desk._amebas],
+                )
+                self.assertEqual(
+                    object_desk.get_food_count(), numpy_desk.get_food_count()
+                )
+
+    def test_convolution_mode_matches_batched_mode(self):
+        for engine in (PlayDeskEngine.OBJECT.value, PlayDeskEngine.NUMPY.value):
+            with self.subTest(engine=engine):
+                batched_desk = self._run(engine, StepMode.BATCHED.value).play_desk
+                convolution_desk = self._run(
+                    engine, StepMode.CONVOLUTION.value
+                ).play_desk
+
+                np.testing.assert_array_equal(
+                    batched_desk.get_energy_grid(), convolution_desk.get_energy_grid()
+                )
+                for expected, actual in zip(
+                    batched_desk.get_ameba_positions(),
+                    convolution_desk.get_ameba_positions(),
+                ):
+                    np.testing.assert_array_equal(expected, actual)
+
+    def test_object_energy_grid_follows_the_foods(self):
+        for step_mode in (StepMode.SEQUENTIAL.value, StepMode.BATCHED.value):
+            with self.subTest(step_mode=step_mode):
+                desk = self._run(PlayDeskEngine.OBJECT.value, step_mode).play_desk
+                expected = np.zeros_like(desk.get_energy_grid())
+                for food in desk._foods:
+                    if not food.is_deleted():
+                        position = food.get_position()
+                        expected[position.row, position.column] = food.get_energy()
+
+                np.testing.assert_array_equal(desk.get_energy_grid(), expected)
+
+    def test_numpy_ameba_index_returns_amebas(self):
+        desk = self._run(PlayDeskEngine.NUMPY.value, StepMode.BATCHED.value).play_desk
+        for ameba in desk._amebas:
+            found = desk._ameba_index.get(ameba.get_position())
+            self.assertEqual(found.get_position().row, ameba.get_position().row)
+            self.assertEqual(found.get_position().column, ameba.get_position().column)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.game_snapshot import (
+    GameState,
+    SnapshotError,
+    load_game_state,
+    save_game_state,
+)
+from core.shared.random_streams import RandomStreams
+
+
+class TestGameSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.snapshot")
+        self.config = GameConfig.create_default()
+        self.config.play_desk.rows = 8
+        self.config.play_desk.columns = 8
+        self.config.play_desk.total_energy = 300.0
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _state(self) -> GameState:
+        energy_grid = np.zeros((8, 8), dtype=np.float32)
+        energy_grid[1, 2] = 50.0
+        energy_grid[7, 0] = 50.0
+        return GameState(
+            config=self.config,
+            energy_grid=energy_grid,
+            ameba_rows=np.array([3, 4], dtype=np.int32),
+            ameba_columns=np.array([5, 6], dtype=np.int32),
+            ameba_energy=np.array([100.0, 99.5]),
+            free_cells=np.arange(60, dtype=np.int32),
+            random_state=RandomStreams(11).get_state(),
+        )
+
+    def test_round_trip(self):
+        state = self._state()
+        save_game_state(state, self.path)
+        for mmap in (True, False):
+            loaded = load_game_state(self.path, mmap=mmap)
+            np.testing.assert_array_equal(loaded.energy_grid, state.energy_grid)
+            np.testing.assert_array_equal(loaded.ameba_rows, state.ameba_rows)
+            np.testing.assert_array_equal(loaded.ameba_columns, state.ameba_columns)
+            np.testing.assert_array_equal(loaded.ameba_energy, state.ameba_energy)
+            np.testing.assert_array_equal(loaded.free_cells, state.free_cells)
+            self.assertEqual(loaded.random_state, state.random_state)
+            self.assertEqual(loaded.config.to_dict(), self.config.to_dict())
+
+    def test_weights_round_trip(self):
+        state = self._state()
+        save_game_state(state, self.path)
+        self.assertIsNone(load_game_state(self.path).weights)
+
+        state.weights = {
+            "0.weight": np.arange(6, dtype=np.float32).reshape(2, 3),
+            "0.bias": np.ones(2, dtype=np.float32),
+        }
+        save_game_state(state, self.path)
+        loaded = load_game_state(self.path)
+        self.assertEqual(list(loaded.weights), ["0.weight", "0.bias"])
+        for name, array in state.weights.items():
+            np.testing.assert_array_equal(loaded.weights[name], array)
+        np.testing.assert_array_equal(loaded.free_cells, state.free_cells)
+
+    def test_memory_map_is_copy_on_write(self):
+        save_game_state(self._state(), self.path)
+        loaded = load_game_state(self.path)
+        loaded.energy_grid[1, 2] = 0
+        self.assertEqual(load_game_state(self.path).energy_grid[1, 2], 50.0)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"not a snapshot at all")
+        with self.assertRaises(SnapshotError):
+            load_game_state(self.path)
+
+    def test_fork_runs_independently(self):
+        game = Game(self.config, seed=5)
+        game.initialize_play_desk(ameba_count=2)
+        fork = game.fork()
+        np.testing.assert_array_equal(
+            fork.play_desk.get_energy_grid(), game.play_desk.get_energy_grid()
+        )
+
+        game.run(3)
+        fork.run(3)
+        np.testing.assert_array_equal(
+            fork.play_desk.get_energy_grid(), game.play_desk.get_energy_grid()
+        )
+        self.assertEqual(
+            [a.get_energy() for a in fork.play_desk._amebas],
+            [a.get_energy() for a in game.play_desk._amebas],
+        )
+
+    def test_changing_a_fork_leaves_the_original_alone(self):
+        game = Game(self.config, seed=5)
+        game.initialize_play_desk(ameba_count=2)
+        energy_grid = game.play_desk.get_energy_grid().copy()
+        network = game.play_desk._amebas[0].get_neural_network()
+        weights = {
+            name: tensor.clone() for name, tensor in network._nn.state_dict().items()
+        }
+
+        fork = game.fork()
+        fork_network = fork.play_desk._amebas[0].get_neural_network()
+        self.assertIsNot(fork_network, network)
+        fork_network.train(steps=64, batch_size=32, seed=1)
+        fork.run(3)
+
+        np.testing.assert_array_equal(game.play_desk.get_energy_grid(), energy_grid)
+        for name, tensor in network._nn.state_dict().items():
+            self.assertTrue(tensor.equal(weights[name]), name)
+        self.assertFalse(
+            all(
+                tensor.equal(weights[name])
+                for name, tensor in fork_network._nn.state_dict().items()
+            )
+        )
+
+    def test_save_and_load_a_game(self):
+        # 36 neurons fit the saved checkpoint, 32 do not
+        for neurons, from_checkpoint in ((36, True), (32, False)):
+            for engine in ("object", "numpy"):
+                for mmap in (True, False):
+                    with self.subTest(neurons=neurons, engine=engine, mmap=mmap):
+                        self.config.neural_network.initial_neurons_on_layer = neurons
+                        self.config.play_desk.engine = engine
+                        game = Game(self.config, seed=9)
+                        game.initialize_play_desk(ameba_count=3)
+                        game.run(2)
+                        game.save_snapshot(self.path)
+
+                        state = load_game_state(self.path)
+                        self.assertEqual(state.model is not None, from_checkpoint)
+                        self.assertEqual(state.weights is None, from_checkpoint)
+
+                        loaded = Game.load_snapshot(self.path, mmap=mmap)
+                        self._assert_same_board(loaded, game)
+
+                        # Random streams continue where the saved game was
+                        game.run(4)
+                        loaded.run(4)
+                        self._assert_same_board(loaded, game)
+
+    def _assert_same_board(self, loaded: Game, game: Game) -> None:
+        np.testing.assert_array_equal(
+            loaded.play_desk.get_energy_grid(), game.play_desk.get_energy_grid()
+        )
+        for loaded_axis, axis in zip(
+            loaded.play_desk.get_ameba_positions(), game.play_desk.get_ameba_positions()
+        ):
+            np.testing.assert_array_equal(loaded_axis, axis)
+        np.testing.assert_array_equal(
+            loaded.play_desk.get_ameba_energies(), game.play_desk.get_ameba_energies()
+        )
+        np.testing.assert_array_equal(
+            loaded.play_desk._free_cells.get_cells(),
+            game.play_desk._free_cells.get_cells(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.replay_log import ReplayEngine, ReplayLog, ReplayLogError, ReplayRecorder
+
+
+class TestReplayLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.replay")
+        config = GameConfig.create_default()
+        config.play_desk.rows = 12
+        config.play_desk.columns = 12
+        config.play_desk.total_energy = 1000.0
+        self.game = Game(config, seed=9)
+        self.game.initialize_play_desk(ameba_count=3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_replay_matches_live_run(self):
+        live_states = {}
+        with ReplayRecorder(self.game, self.path, keyframe_interval=5) as recorder:
+            for step in range(1, 21):
+                recorder.step()
+                live_states[step] = self.game.capture_state()
+
+        log = ReplayLog(self.path)
+        self.assertEqual(log.step_count, 20)
+        self.assertEqual(log.seed, 9)
+        self.assertEqual(log.keyframe_steps(), [0, 5, 10, 15, 20])
+        self.assertEqual(log.actions().shape, (20, 3))
+        self.assertTrue((log.actions() < 4).all())
+
+        engine = ReplayEngine(log, keyframe_interval=2)
+        for step in (13, 3, 20):
+            replayed = engine.seek(step).capture_state()
+            np.testing.assert_array_equal(
+                replayed.energy_grid, live_states[step].energy_grid
+            )
+            np.testing.assert_array_equal(
+                replayed.ameba_rows, live_states[step].ameba_rows
+            )
+            np.testing.assert_array_equal(
+                replayed.ameba_energy, live_states[step].ameba_energy
+            )
+
+    def test_recording_again_replaces_the_keyframes(self):
+        with ReplayRecorder(self.game, self.path, keyframe_interval=5) as recorder:
+            recorder.run(10)
+        with ReplayRecorder(self.game, self.path, keyframe_interval=3) as recorder:
+            recorder.run(4)
+
+        log = ReplayLog(self.path)
+        self.assertEqual(log.keyframe_steps(), [0, 3])
+        replayed = ReplayEngine(log).seek(4).capture_state()
+        np.testing.assert_array_equal(
+            replayed.energy_grid, self.game.capture_state().energy_grid
+        )
+        self.assertIsNone(replayed.model)
+
+    def test_rejects_wrong_action_count(self):
+        with ReplayRecorder(self.game, self.path) as recorder:
+            with self.assertRaises(ReplayLogError):
+                recorder.append([0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from core.neural_network.calculations.board_convolution import board_logits
+from core.shared.visible_area import CalculateVisibleAreaService
+
+
+class TestBoardLogits(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+        self.layers = nn.Sequential(
+            nn.Linear(25, 8), nn.ReLU(), nn.Linear(8, 8), nn.ReLU(), nn.Linear(8, 4)
+        )
+        self.calculate_visible_area = CalculateVisibleAreaService(
+            visible_rows=2, visible_columns=2, desk_rows=9, desk_columns=7
+        )
+        rng = np.random.default_rng(0)
+        self.energy_grid = (rng.random((9, 7)) > 0.7).astype(np.float32) * 50
+
+    def test_matches_window_forward_pass(self):
+        rows = np.array([0, 4, 8, 3])
+        columns = np.array([0, 6, 3, 1])
+        windows = self.calculate_visible_area.fetch_visible_energy_batch(
+            rows, columns, self.energy_grid
+        )
+        with torch.no_grad():
+            expected = self.layers(torch.as_tensor(windows).reshape(len(rows), -1))
+
+        actual = board_logits(self.layers, self.energy_grid, rows, columns, (5, 5))
+
+        self.assertTrue(torch.allclose(actual, expected, atol=1e-4))
+
+    def test_rejects_mismatched_window(self):
+        with self.assertRaises(ValueError):
+            board_logits(
+                self.layers, self.energy_grid, np.array([0]), np.array([0]), (3, 3)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
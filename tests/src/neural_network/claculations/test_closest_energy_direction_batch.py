@@ -0,0 +1,40 @@
+import unittest
+import torch
+from core.neural_network.calculations.find_closest_energy_direction import (
+    closest_energy_direction,
+    closest_energy_direction_batch,
+)
+
+
+class TestClosestEnergyDirectionBatch(unittest.TestCase):
+    def setUp(self):
+        self.size = 11
+        self.center = self.size // 2
+
+    def assert_matches_scalar(self, tensor: torch.Tensor):
+        expected = torch.stack([closest_energy_direction(sample) for sample in tensor])
+        self.assertTrue(torch.equal(closest_energy_direction_batch(tensor), expected))
+
+    def test_random_samples(self):
+        generator = torch.Generator().manual_seed(0)
+        tensor = (
+            torch.rand((256, self.size, self.size), generator=generator) > 0.97
+        ).float()
+        self.assert_matches_scalar(tensor)
+
+    def test_no_food(self):
+        tensor = torch.zeros((2, self.size, self.size), dtype=torch.float32)
+        self.assert_matches_scalar(tensor)
+
+    def test_same_distance_ties(self):
+        tensor = torch.zeros((3, self.size, self.size), dtype=torch.float32)
+        tensor[0, self.center - 1, self.center] = 1
+        tensor[0, self.center, self.center + 1] = 1
+        tensor[1, self.center + 2, self.center - 2] = 1
+        tensor[1, self.center - 2, self.center + 2] = 1
+        tensor[2, self.center, self.center] = 1
+        self.assert_matches_scalar(tensor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+import torch.nn as nn
+
+from core.neural_network.registry import ModelKey, ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ModelRegistry()
+        self.key = ModelKey("base", (121, 1, 36), "abc")
+        self.created = 0
+
+    def _factory(self) -> nn.Module:
+        self.created += 1
+        return nn.Linear(2, 2)
+
+    def test_same_key_shares_model(self):
+        first = self.registry.get_or_create(self.key, self._factory)
+        second = self.registry.get_or_create(self.key, self._factory)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.created, 1)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_different_checkpoint_loads_new_model(self):
+        first = self.registry.get_or_create(self.key, self._factory)
+        other_key = ModelKey("base", (121, 1, 36), "def")
+        second = self.registry.get_or_create(other_key, self._factory)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.created, 2)
+
+    def test_evict_checkpoint_drops_its_models(self):
+        self.registry.get_or_create(self.key, self._factory)
+        self.registry.get_or_create(
+            ModelKey("base", (121, 2, 36), "abc"), self._factory
+        )
+        other_key = ModelKey("base", (121, 1, 36), "def")
+        kept = self.registry.get_or_create(other_key, self._factory)
+
+        self.registry.evict_checkpoint("abc")
+
+        self.assertEqual(len(self.registry), 1)
+        self.assertIs(self.registry.get_or_create(other_key, self._factory), kept)
+
+    def test_unloadable_model_is_not_shared(self):
+        def unloadable() -> None:
+            self.created += 1
+            return None
+
+        self.assertIsNone(self.registry.get_or_create(self.key, unloadable))
+        self.assertIsNone(self.registry.get_or_create(self.key, unloadable))
+        self.assertEqual(self.created, 1)
+        self.assertEqual(len(self.registry), 0)
+
+        self.registry.evict_checkpoint("abc")
+        self.assertIsInstance(
+            self.registry.get_or_create(self.key, self._factory), nn.Linear
+        )
+
+    def test_checkpoint_hash_of_missing_file_is_none(self):
+        self.assertIsNone(self.registry.checkpoint_hash("/nonexistent/base.pth"))
+
+
+if __name__ == "__main__":
+    unittest.main()
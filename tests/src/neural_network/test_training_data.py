@@ -0,0 +1,78 @@
+import unittest
+
+import torch
+
+from core.neural_network.calculations.find_closest_energy_direction import (
+    closest_energy_direction,
+)
+from core.neural_network.training_data import (
+    SyntheticVisibleAreaBatches,
+    synthetic_data_loader,
+)
+
+
+class TestSyntheticVisibleAreaBatches(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = SyntheticVisibleAreaBatches(
+            num_batches=5, batch_size=16, window_shape=(7, 9), max_points=4, seed=3
+        )
+
+    def assertBatchesEqual(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for (first_inputs, first_labels), (second_inputs, second_labels) in zip(
+            first, second
+        ):
+            self.assertTrue(torch.equal(first_inputs, second_inputs))
+            self.assertTrue(torch.equal(first_labels, second_labels))
+
+    def test_fixed_seed_replays_the_same_data(self):
+        first = list(self.dataset)
+        self.assertEqual(len(first), 5)
+        self.assertBatchesEqual(first, list(self.dataset))
+        self.assertBatchesEqual(
+            first,
+            list(
+                SyntheticVisibleAreaBatches(
+                    num_batches=5,
+                    batch_size=16,
+                    window_shape=(7, 9),
+                    max_points=4,
+                    seed=3,
+                )
+            ),
+        )
+        other_seed = SyntheticVisibleAreaBatches(
+            num_batches=1, batch_size=16, window_shape=(7, 9), max_points=4, seed=4
+        )
+        self.assertFalse(torch.equal(first[0][0], next(iter(other_seed))[0]))
+
+    def test_samples_match_their_labels(self):
+        for inputs, labels in self.dataset:
+            self.assertEqual(inputs.shape, (16, 7 * 9))
+            windows = inputs.reshape(16, 7, 9)
+            self.assertTrue((windows[:, 3, 4] == 0).all())
+            expected = torch.stack(
+                [closest_energy_direction(window) for window in windows]
+            )
+            self.assertTrue(torch.equal(labels, expected))
+
+    def test_workers_cover_every_batch_once(self):
+        expected = [self.dataset.generate_batch(index) for index in range(5)]
+        for num_workers in (0, 2):
+            with self.subTest(num_workers=num_workers):
+                batches = list(synthetic_data_loader(self.dataset, num_workers))
+                self.assertEqual(len(batches), 5)
+                found = []
+                for inputs, labels in batches:
+                    for index, (expected_inputs, expected_labels) in enumerate(
+                        expected
+                    ):
+                        if torch.equal(inputs, expected_inputs):
+                            self.assertTrue(torch.equal(labels, expected_labels))
+                            found.append(index)
+                self.assertEqual(sorted(found), list(range(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import copy
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from core.config_classes.game_config import GameConfig
+from core.out.movement_handler import MovementHandler
+from core.out.step_delta import merge_steps, rebuild_frame
+
+
+class TestMovementHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        project_root = Path(self.directory.name)
+        config = GameConfig.create_default()
+        config.play_desk.rows = 8
+        config.play_desk.columns = 8
+        with open(project_root / "config.json", "w") as config_file:
+            json.dump(config.to_dict(), config_file)
+        self.handler = MovementHandler(project_root)
+        self.assertIsNotNone(self.handler.game)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_snapshot_is_versioned_and_never_mutated(self):
+        version, snapshot = self.handler.get_snapshot()
+        frozen = copy.deepcopy(snapshot)
+
+        result = self.handler.move_amebas(iterations=3)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            self.handler.get_snapshot(), (version + 1, result["updated_game_state"])
+        )
+        self.assertEqual(snapshot, frozen)
+
+        result = self.handler.run_simulation(5)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            self.handler.get_snapshot(), (version + 2, result["final_game_state"])
+        )
+
+    def test_concurrent_moves_are_serialized(self):
+        single_iteration = self.handler._do_single_move_iteration
+        active = []
+        overlaps = []
+
+        def tracked_iteration(*args, **kwargs):
+            active.append(None)
+            overlaps.append(len(active))
+            time.sleep(0.001)
+            try:
+                return single_iteration(*args, **kwargs)
+            finally:
+                active.pop()
+
+        self.handler._do_single_move_iteration = tracked_iteration
+        version, _ = self.handler.get_snapshot()
+
+        def move():
+            for _ in range(5):
+                self.assertTrue(self.handler.move_amebas()["success"])
+
+        threads = [threading.Thread(target=move) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(overlaps), 20)
+        self.assertEqual(max(overlaps), 1)
+        self.assertEqual(self.handler.get_snapshot()[0], version + 20)
+
+    def test_returned_steps_rebuild_the_live_board(self):
+        single_iteration = self.handler._do_single_move_iteration
+        live_states = [self.handler._get_current_game_state()]
+
+        def recording_iteration(*args, **kwargs):
+            result = single_iteration(*args, **kwargs)
+            live_states.append(self.handler._get_current_game_state())
+            return result
+
+        self.handler._do_single_move_iteration = recording_iteration
+        result = self.handler.run_simulation(12, return_steps=True, keyframe_interval=4)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(len(result["steps"]), 13)
+        for step_number, live_state in enumerate(live_states):
+            frame = rebuild_frame(result["steps"], step_number)
+            self.assertEqual(
+                frame["amebas"],
+                [
+                    [
+                        ameba["position"]["row"],
+                        ameba["position"]["column"],
+                        ameba["energy"],
+                    ]
+                    for ameba in live_state["amebas"]
+                ],
+            )
+            self.assertCountEqual(
+                frame["foods"],
+                [
+                    [
+                        food["position"]["row"],
+                        food["position"]["column"],
+                        food["energy"],
+                    ]
+                    for food in live_state["foods"]
+                ],
+            )
+
+    def board(self, state):
+        amebas = [
+            [ameba["position"]["row"], ameba["position"]["column"], ameba["energy"]]
+            for ameba in state["amebas"]
+        ]
+        foods = [
+            [food["position"]["row"], food["position"]["column"], food["energy"]]
+            for food in state["foods"]
+        ]
+        return amebas, foods
+
+    def assertFrameShowsBoard(self, frame, state):
+        amebas, foods = self.board(state)
+        self.assertEqual(frame["amebas"], amebas)
+        self.assertCountEqual(frame["foods"], foods)
+
+    def test_step_frames_chain_from_the_stream_keyframe(self):
+        frames = [self.handler.stream_keyframe()]
+        self.assertTrue(frames[0]["keyframe"])
+        self.assertEqual(frames[0]["board_size"], {"rows": 8, "columns": 8})
+
+        for _ in range(12):
+            result = self.handler.step_frame(keyframe_interval=5)
+            self.assertTrue(result["success"])
+            frames.append(result["frame"])
+            version, state = self.handler.get_snapshot()
+            self.assertEqual(result["frame"]["step_number"], version)
+            self.assertFrameShowsBoard(rebuild_frame(frames, version), state)
+
+        keyframes = [frame["step_number"] for frame in frames if frame["keyframe"]]
+        # The first step starts the chain, later keyframes follow the interval
+        self.assertTrue(frames[1]["keyframe"])
+        self.assertTrue(all(step % 5 == 0 for step in keyframes[2:]))
+        self.assertGreater(len(frames), len(keyframes) + 5)
+
+        merged = frames[0]
+        for frame in frames[1:]:
+            merged = merge_steps(merged, frame)
+        self.assertFrameShowsBoard(merged, self.handler.get_snapshot()[1])
+
+    def test_moves_outside_the_stream_force_a_keyframe(self):
+        self.handler.step_frame(keyframe_interval=1000)
+        self.assertFalse(
+            self.handler.step_frame(keyframe_interval=1000)["frame"]["keyframe"]
+        )
+
+        self.handler.move_amebas()
+        frame = self.handler.step_frame(keyframe_interval=1000)["frame"]
+
+        self.assertTrue(frame["keyframe"])
+        self.assertFrameShowsBoard(frame, self.handler.get_snapshot()[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
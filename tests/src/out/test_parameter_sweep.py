@@ -0,0 +1,68 @@
+import unittest
+
+from core.config_classes.game_config import GameConfig
+from core.out.parameter_sweep import (
+    ParameterSweep,
+    apply_overrides,
+    grid_overrides,
+    random_overrides,
+    to_columns,
+)
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.space = {
+            "play_desk.total_energy": [1000.0, 2000.0],
+            "ameba.visible_rows": [3, 5, 7],
+        }
+
+    def test_grid_covers_every_combination(self):
+        overrides = grid_overrides(self.space)
+        self.assertEqual(len(overrides), 6)
+        self.assertIn(
+            {"play_desk.total_energy": 2000.0, "ameba.visible_rows": 7}, overrides
+        )
+
+    def test_random_is_deterministic(self):
+        self.assertEqual(
+            random_overrides(self.space, 10, seed=3),
+            random_overrides(self.space, 10, seed=3),
+        )
+
+    def test_apply_overrides_updates_input_size(self):
+        config = GameConfig.create_default()
+        updated = apply_overrides(config, {"ameba.visible_rows": 3})
+        self.assertEqual(updated.ameba.visible_rows, 3)
+        self.assertEqual(updated.neural_network.input_size, 7 * 11)
+        self.assertEqual(config.ameba.visible_rows, 5)
+        with self.assertRaises(ValueError):
+            apply_overrides(config, {"ameba.unknown": 1})
+
+    def test_to_columns(self):
+        columns = to_columns([{"a": 1, "b": 2}, {"a": 3, "c": 4}])
+        self.assertEqual(columns, {"a": [1, 3], "b": [2, None], "c": [None, 4]})
+
+    def test_rows_do_not_depend_on_worker_count(self):
+        config = GameConfig.create_default()
+        config.play_desk.rows = 8
+        config.play_desk.columns = 8
+        # Visible rows 3 does not fit the saved checkpoint, 5 does
+        overrides = grid_overrides(
+            {"ameba.visible_rows": [3, 5], "play_desk.total_energy": [500.0, 800.0]}
+        )
+
+        def sweep_rows(workers):
+            rows = ParameterSweep(
+                config, overrides, steps=20, amebas=3, seed=7, workers=workers
+            ).run()
+            for row in rows:
+                del row["elapsed_seconds"], row["steps_per_sec"]
+            return rows
+
+        self.assertEqual(sweep_rows(1), sweep_rows(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from core.out.step_delta import StepDeltaEncoder, merge_steps, rebuild_frame
+
+
+class TestStepDelta(unittest.TestCase):
+
+    def setUp(self):
+        self.steps = [
+            {
+                "step_number": 0,
+                "keyframe": True,
+                "total_energy": 250.0,
+                "amebas": [[0, 0, 100.0], [5, 5, 100.0]],
+                "foods": [[0, 1, 50.0], [3, 3, 50.0]],
+            },
+            {
+                "step_number": 1,
+                "keyframe": False,
+                "total_energy": 248.0,
+                "amebas": [[0, 0, 1, 149.0], [1, 4, 5, 99.0]],
+                "eaten": [[0, 1]],
+                "spawned": [[7, 7, 50.0]],
+            },
+            {
+                "step_number": 2,
+                "keyframe": False,
+                "total_energy": 246.0,
+                "amebas": [[0, 0, 2, 148.0], [1, 3, 5, 98.0]],
+                "eaten": [[7, 7]],
+                "spawned": [[0, 1, 50.0]],
+            },
+        ]
+
+    def test_rebuild_keyframe_returns_it(self):
+        frame = rebuild_frame(self.steps, 0)
+
+        self.assertEqual(frame["amebas"], self.steps[0]["amebas"])
+        self.assertCountEqual(frame["foods"], self.steps[0]["foods"])
+
+    def test_rebuild_applies_deltas(self):
+        frame = rebuild_frame(self.steps, 2)
+
+        self.assertEqual(frame["amebas"], [[0, 2, 148.0], [3, 5, 98.0]])
+        self.assertCountEqual(frame["foods"], [[3, 3, 50.0], [0, 1, 50.0]])
+        self.assertEqual(frame["total_energy"], 246.0)
+
+    def test_rebuild_unknown_step_raises(self):
+        with self.assertRaises(ValueError):
+            rebuild_frame(self.steps, 5)
+
+    def test_keyframe_schedule(self):
+        encoder = StepDeltaEncoder(keyframe_interval=5)
+
+        self.assertTrue(encoder.is_keyframe(0))
+        self.assertFalse(encoder.is_keyframe(3))
+        self.assertTrue(encoder.is_keyframe(10))
+        with self.assertRaises(ValueError):
+            StepDeltaEncoder(keyframe_interval=0)
+
+    def test_merged_deltas_apply_like_the_originals(self):
+        merged = merge_steps(self.steps[1], self.steps[2])
+
+        self.assertFalse(merged["keyframe"])
+        self.assertEqual(merged["step_number"], 2)
+        self.assertEqual(merged["total_energy"], 246.0)
+        self.assertCountEqual(merged["eaten"], [[7, 7]])
+        self.assertCountEqual(merged["spawned"], [[0, 1, 50.0]])
+        frame = rebuild_frame([self.steps[0], merged], 2)
+        expected = rebuild_frame(self.steps, 2)
+        self.assertEqual(frame["amebas"], expected["amebas"])
+        self.assertCountEqual(frame["foods"], expected["foods"])
+
+    def test_merge_into_a_keyframe_gives_a_keyframe(self):
+        first = {**self.steps[0], "board_size": {"rows": 8, "columns": 8}}
+        merged = merge_steps(merge_steps(first, self.steps[1]), self.steps[2])
+
+        self.assertTrue(merged["keyframe"])
+        self.assertEqual(merged["board_size"], first["board_size"])
+        self.assertEqual(merged["amebas"], rebuild_frame(self.steps, 2)["amebas"])
+
+    def test_merge_drops_stale_deltas_and_keeps_keyframes(self):
+        self.assertIs(merge_steps(self.steps[2], self.steps[1]), self.steps[2])
+        self.assertIs(merge_steps(self.steps[1], self.steps[0]), self.steps[0])
@@ -0,0 +1,72 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from core.config_classes.game_config import GameConfig
+from core.out.training_jobs import FINISHED_STATUSES, JobStatus, TrainingJobManager
+
+
+class TestTrainingJobManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.project_root = Path(self.directory.name)
+        with open(self.project_root / "config.json", "w") as config_file:
+            json.dump(GameConfig.create_default().to_dict(), config_file)
+        self.manager = TrainingJobManager(self.project_root, max_workers=1)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        self.directory.cleanup()
+
+    def _wait(self, job_id, timeout=120.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = self.manager.get_job(job_id)
+            if job.status in FINISHED_STATUSES:
+                return job
+            time.sleep(0.1)
+        self.fail(f"Job {job_id} did not finish in {timeout} seconds")
+
+    def test_submit_reports_progress_and_completes(self):
+        submitted = self.manager.submit(steps=64, batch_size=32, seed=1)
+        self.assertEqual(submitted.status, JobStatus.QUEUED)
+
+        job = self._wait(submitted.job_id)
+        self.assertEqual(job.status, JobStatus.COMPLETED)
+        self.assertEqual(job.total_epochs, 2)
+        self.assertEqual(job.epoch, 2)
+        self.assertIsNotNone(job.loss)
+        self.assertIsNotNone(job.finished_at)
+        self.assertTrue(Path(job.model_path).is_file())
+        self.assertTrue(job.model_path.startswith(str(self.project_root)))
+
+    def test_missing_config_fails(self):
+        (self.project_root / "config.json").unlink()
+        job = self._wait(self.manager.submit(steps=64, batch_size=32).job_id)
+        self.assertEqual(job.status, JobStatus.FAILED)
+        self.assertIn("Configuration file not found", job.error_details)
+
+    def test_cancel_queued_and_running_jobs(self):
+        # One worker: the second job waits in the queue behind the first
+        running = self.manager.submit(steps=20000, batch_size=100, seed=1)
+        queued = self.manager.submit(steps=64, batch_size=32, seed=2)
+
+        self.manager.cancel(queued.job_id)
+        deadline = time.monotonic() + 120.0
+        while self.manager.get_job(running.job_id).status == JobStatus.QUEUED:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.1)
+        self.manager.cancel(running.job_id)
+
+        job = self._wait(running.job_id)
+        self.assertEqual(job.status, JobStatus.CANCELLED)
+        self.assertLess(job.epoch, job.total_epochs)
+        self.assertEqual(self._wait(queued.job_id).status, JobStatus.CANCELLED)
+        self.assertIsNone(self.manager.cancel("unknown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from core.shared.visible_area import CalculateVisibleAreaService
 from core.play_desk import Position
 from core.food import Food
@@ -38,3 +40,38 @@ class TestCalculateVisibleArea(unittest.TestCase):
         actual_visible_energy = fetched_etities.get_visible_energy()
         print(actual_visible_energy)
         self.assertEqual(actual_visible_energy, expected_visible_energy)
+
+    def test_fetch_visible_energy_batch(self):
+        calculate_visible_area = CalculateVisibleAreaService(
+            visible_rows=2,
+            visible_columns=2,
+            desk_rows=7,
+            desk_columns=7,
+        )
+
+        foods = [
+            Food(energy=1, position=Position(1, 1)),
+            Food(energy=2, position=Position(3, 3)),
+            Food(energy=3, position=Position(2, 6)),
+            Food(energy=4, position=Position(6, 0)),
+        ]
+        energy_grid = np.zeros((7, 7), dtype=np.float32)
+        for food in foods:
+            energy_grid[food.get_position().row, food.get_position().column] = (
+                food.get_energy()
+            )
+
+        reference_positions = [Position(0, 1), Position(3, 3), Position(6, 6)]
+        rows = np.array([position.row for position in reference_positions])
+        columns = np.array([position.column for position in reference_positions])
+
+        windows = calculate_visible_area.fetch_visible_energy_batch(
+            rows, columns, energy_grid
+        )
+
+        self.assertEqual(windows.shape, (3, 5, 5))
+        for window, reference_position in zip(windows, reference_positions):
+            expected_visible_energy = calculate_visible_area.fetch_visible_entities(
+                reference_position, foods
+            ).get_visible_energy()
+            self.assertEqual(window.tolist(), expected_visible_energy)
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from core.shared.free_cell_set import BoardSaturatedError, FreeCellSet
+from core.shared.position import Position
+
+
+class TestFreeCellSet(unittest.TestCase):
+
+    def test_starts_with_every_cell_free(self):
+        free_cells = FreeCellSet(3, 4)
+
+        self.assertEqual(len(free_cells), 12)
+        self.assertIn(Position(2, 3), free_cells)
+
+    def test_discard_and_add(self):
+        free_cells = FreeCellSet(2, 2)
+
+        free_cells.discard(Position(0, 1))
+        free_cells.discard(Position(0, 1))
+
+        self.assertEqual(len(free_cells), 3)
+        self.assertNotIn(Position(0, 1), free_cells)
+
+        free_cells.add(Position(0, 1))
+        free_cells.add(Position(0, 1))
+
+        self.assertEqual(len(free_cells), 4)
+        self.assertIn(Position(0, 1), free_cells)
+
+    def test_sample_returns_only_free_cells(self):
+        free_cells = FreeCellSet(2, 2)
+        for position in (Position(0, 0), Position(0, 1), Position(1, 1)):
+            free_cells.discard(position)
+
+        position = free_cells.sample()
+
+        self.assertEqual((position.row, position.column), (1, 0))
+
+    def test_sample_many_without_replacement(self):
+        free_cells = FreeCellSet(3, 3)
+        free_cells.discard(Position(1, 1))
+
+        positions = free_cells.sample_many(8)
+
+        cells = {(position.row, position.column) for position in positions}
+        self.assertEqual(len(cells), 8)
+        self.assertNotIn((1, 1), cells)
+
+    def test_load_cells_keeps_order(self):
+        free_cells = FreeCellSet(3, 3)
+        free_cells.discard(Position(0, 0))
+        free_cells.discard(Position(2, 1))
+        copy = FreeCellSet(3, 3)
+
+        copy.load_cells(free_cells.get_cells())
+
+        self.assertEqual(copy.get_cells().tolist(), free_cells.get_cells().tolist())
+        self.assertEqual(copy.get_cells().dtype, np.int32)
+        self.assertNotIn(Position(2, 1), copy)
+        self.assertIn(Position(1, 1), copy)
+
+    def test_saturated_board_raises(self):
+        free_cells = FreeCellSet(1, 2)
+        free_cells.discard(Position(0, 0))
+
+        with self.assertRaises(BoardSaturatedError):
+            free_cells.sample_many(2)
+
+        free_cells.discard(Position(0, 1))
+
+        with self.assertRaises(BoardSaturatedError):
+            free_cells.sample()
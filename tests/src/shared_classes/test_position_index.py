@@ -0,0 +1,51 @@
+import unittest
+
+from core.shared.position_index import PositionIndex
+from core.shared.position import Position
+from core.food import Food
+
+
+class TestPositionIndex(unittest.TestCase):
+
+    def test_get_returns_entity_on_cell(self):
+        food = Food(energy=1, position=Position(2, 3))
+        index = PositionIndex.from_entities([food])
+
+        self.assertIs(index.get(Position(2, 3)), food)
+        self.assertIsNone(index.get(Position(3, 2)))
+        self.assertTrue(index.is_occupied(Position(2, 3)))
+
+    def test_remove_frees_cell(self):
+        food = Food(energy=1, position=Position(0, 0))
+        index = PositionIndex.from_entities([food])
+
+        index.remove(food)
+
+        self.assertIsNone(index.get(Position(0, 0)))
+        self.assertFalse(index.is_occupied(Position(0, 0)))
+        self.assertEqual(len(index), 0)
+
+    def test_move_reindexes_entity(self):
+        food = Food(energy=1, position=Position(1, 1))
+        index = PositionIndex.from_entities([food])
+        old_position = food.get_position()
+
+        food._position = Position(4, 5)
+        index.move(food, old_position)
+
+        self.assertIsNone(index.get(old_position))
+        self.assertIs(index.get(Position(4, 5)), food)
+
+    def test_shared_cell_keeps_remaining_entity(self):
+        first = Food(energy=1, position=Position(1, 1))
+        second = Food(energy=2, position=Position(1, 1))
+        index = PositionIndex.from_entities([first, second])
+
+        index.remove(first)
+
+        self.assertIs(index.get(Position(1, 1)), second)
+        self.assertEqual(len(index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import torch
+
+from core.config_classes.game_config import GameConfig
+from core.game import Game
+from core.shared.free_cell_set import FreeCellSet
+from core.shared.random_streams import RandomStreams, stream_seed
+
+
+class TestRandomStreams(unittest.TestCase):
+
+    def test_same_seed_gives_same_sequences(self):
+        first, second = RandomStreams(42), RandomStreams(42)
+        self.assertEqual(
+            [first.food_spawn.random() for _ in range(5)],
+            [second.food_spawn.random() for _ in range(5)],
+        )
+        self.assertEqual(first.training_data_seed, second.training_data_seed)
+        self.assertEqual(first.network_init_seed, second.network_init_seed)
+
+    def test_streams_are_independent(self):
+        streams = RandomStreams(42)
+        expected = RandomStreams(42).food_spawn.random()
+        streams.placement.random()
+        self.assertEqual(streams.food_spawn.random(), expected)
+        self.assertNotEqual(stream_seed(42, "food_spawn"), stream_seed(42, "placement"))
+
+    def test_state_round_trip(self):
+        streams = RandomStreams(7)
+        state = streams.get_state()
+        expected = [streams.food_spawn.random(), streams.placement.random()]
+        restored = RandomStreams()
+        restored.set_state(state)
+        self.assertEqual(restored.seed, 7)
+        self.assertEqual(
+            [restored.food_spawn.random(), restored.placement.random()], expected
+        )
+
+    def test_free_cell_sampling_is_reproducible(self):
+        cells = FreeCellSet(10, 10)
+        first = cells.sample_many(5, RandomStreams(3).food_spawn)
+        second = cells.sample_many(5, RandomStreams(3).food_spawn)
+        # Position has no __eq__, compare coordinates
+        self.assertEqual(
+            [(p.row, p.column) for p in first], [(p.row, p.column) for p in second]
+        )
+
+
+class TestSeededGame(unittest.TestCase):
+
+    def _trajectory(self):
+        config = GameConfig.create_default()
+        config.play_desk.rows = 10
+        config.play_desk.columns = 10
+        # The default neuron count does not fit the checkpoint, so the
+        # network gets fresh weights
+        game = Game(config, seed=1)
+        game.initialize_play_desk(3)
+        network = game.play_desk._amebas[0].get_neural_network()
+        trajectory = []
+        for _ in range(10):
+            game.run(1)
+            trajectory.append(
+                [
+                    (row, column, ameba.get_energy())
+                    for row, column, ameba in zip(
+                        *game.play_desk.get_ameba_positions(), game.play_desk._amebas
+                    )
+                ]
+            )
+        return network.get_weights(), trajectory
+
+    def test_same_seed_gives_same_game(self):
+        first_weights, first_trajectory = self._trajectory()
+        global_state = torch.get_rng_state()
+        second_weights, second_trajectory = self._trajectory()
+
+        self.assertEqual(first_trajectory, second_trajectory)
+        self.assertEqual(first_weights.keys(), second_weights.keys())
+        for name, weights in first_weights.items():
+            self.assertTrue((weights == second_weights[name]).all(), name)
+        # Network init never touches the global torch generator
+        self.assertTrue(torch.equal(torch.get_rng_state(), global_state))
+
+
+if __name__ == "__main__":
+    unittest.main()
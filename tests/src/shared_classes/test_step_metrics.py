@@ -0,0 +1,47 @@
+import unittest
+
+from core.shared.step_metrics import StepMetrics
+
+
+class TestStepMetrics(unittest.TestCase):
+
+    def test_disabled_metrics_record_nothing(self):
+        metrics = StepMetrics()
+
+        mark = metrics.start()
+        metrics.stop("move", mark)
+
+        self.assertEqual(mark, 0.0)
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_stop_records_phase(self):
+        metrics = StepMetrics(enabled=True)
+
+        mark = metrics.start()
+        mark = metrics.stop("move", mark)
+        metrics.stop("cleanup", mark)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["move"].count, 1)
+        self.assertEqual(snapshot["cleanup"].count, 1)
+
+    def test_percentiles_within_bucket_precision(self):
+        metrics = StepMetrics(enabled=True)
+        for i in range(1, 101):
+            metrics.record("step", i / 1000)
+
+        stats = metrics.snapshot()["step"]
+
+        self.assertEqual(stats.count, 100)
+        self.assertAlmostEqual(stats.total_seconds, 5.05)
+        self.assertAlmostEqual(stats.max_seconds, 0.1)
+        self.assertAlmostEqual(stats.p50_seconds, 0.05, delta=0.05 * 0.1)
+        self.assertAlmostEqual(stats.p99_seconds, 0.099, delta=0.099 * 0.1)
+
+    def test_reset_clears_histograms(self):
+        metrics = StepMetrics(enabled=True)
+        metrics.record("step", 0.01)
+
+        metrics.reset()
+
+        self.assertEqual(metrics.snapshot(), {})
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from core.config_classes.game_config import GameConfig
+from core.vector_worlds import VectorWorlds
+
+
+class TestVectorWorlds(unittest.TestCase):
+
+    def setUp(self):
+        self.config = GameConfig.create_default()
+        self.config.play_desk.rows = 8
+        self.config.play_desk.columns = 8
+        self.config.play_desk.total_energy = 400.0
+        self.config.play_desk.energy_per_food = 50.0
+        self.config.ameba.initial_energy = 100.0
+        self.worlds = VectorWorlds(
+            self.config, num_worlds=3, amebas_per_world=2, seed=1
+        )
+
+    def _total_energy(self):
+        return self.worlds.energy.sum(axis=(1, 2)) + self.worlds.ameba_energy.sum(
+            axis=1
+        )
+
+    def test_reset_fills_every_world_to_total_energy(self):
+        np.testing.assert_allclose(self._total_energy(), 400.0)
+        ameba_cells = self.worlds.ameba_rows * 8 + self.worlds.ameba_columns
+        for world in range(3):
+            self.assertEqual(len(set(ameba_cells[world])), 2)
+            flat_energy = self.worlds.energy[world].reshape(-1)
+            self.assertTrue(np.all(flat_energy[ameba_cells[world]] == 0))
+
+    def test_observe_shape(self):
+        observations = self.worlds.observe()
+        self.assertEqual(observations.shape, (3, 2, 11, 11))
+
+    def test_step_eats_food_and_respawns(self):
+        self.worlds.energy[:] = 0
+        self.worlds.ameba_rows[:] = [[0, 4]]
+        self.worlds.ameba_columns[:] = [[0, 4]]
+        self.worlds.energy[0, 0, 1] = 50.0
+        actions = np.array([[1, 0], [0, 0], [2, 2]])
+
+        result = self.worlds.step(actions)
+
+        self.assertEqual(result.rewards[0, 0], 50.0)
+        self.assertEqual(result.rewards[1:].sum(), 0.0)
+        np.testing.assert_array_equal(self.worlds.ameba_rows, [[0, 3], [7, 3], [1, 5]])
+        np.testing.assert_array_equal(
+            self.worlds.ameba_columns, [[1, 4], [0, 4], [0, 4]]
+        )
+        np.testing.assert_allclose(self._total_energy(), 400.0)
+        self.assertEqual(result.observations.shape, (3, 2, 11, 11))
+
+    def test_first_ameba_eats_shared_cell(self):
+        self.worlds.energy[:] = 0
+        self.worlds.ameba_rows[:] = [[2, 2]]
+        self.worlds.ameba_columns[:] = [[1, 3]]
+        self.worlds.energy[:, 2, 2] = 50.0
+
+        result = self.worlds.step(np.array([[1, 3]] * 3))
+
+        np.testing.assert_array_equal(result.rewards, [[50.0, 0.0]] * 3)
+
+    def test_episode_length_resets_world(self):
+        worlds = VectorWorlds(self.config, num_worlds=2, episode_length=2, seed=3)
+        self.assertFalse(worlds.step(np.zeros((2, 1), dtype=np.int64)).dones.any())
+        result = worlds.step(np.zeros((2, 1), dtype=np.int64))
+        self.assertTrue(result.dones.all())
+        self.assertEqual(worlds.episodes_completed, 2)
+        np.testing.assert_array_equal(worlds.step_counts, [0, 0])
+        np.testing.assert_allclose(worlds.ameba_energy, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()